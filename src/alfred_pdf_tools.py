@@ -35,6 +35,7 @@ Options:
     --scale <width> <height>     Scale PDF files to a given page size.
     --extract-text               Extract text from PDF files.
 """
+import hashlib
 import json
 import os
 import re
@@ -42,10 +43,11 @@ import shlex
 import subprocess
 import sys
 import tempfile
+from contextlib import contextmanager, suppress
 from copy import copy
 from math import floor
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from docopt import docopt
 from pypdf import PageObject, PageRange, PdfReader, PdfWriter, errors
@@ -53,8 +55,14 @@ from workflow import ICON_ERROR, Variables, Workflow, notify
 
 UPDATE_SETTINGS = {"github_slug": "xilopaint/alfred-pdf-tools"}
 HELP_URL = "https://github.com/xilopaint/alfred-pdf-tools"
+# memory budget of the parsed objects kept by readers walking through every page
+READER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# seconds a cached PDF structure is kept once it is no longer used
+STRUCTURE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
 
 wf = Workflow(update_settings=UPDATE_SETTINGS, help_url=HELP_URL)
+# cache names, keys and readers of the files whose structure is to be cached
+unsaved_structures: list[tuple[str, tuple[str, int, int], PdfReader]] = []
 
 
 class AlfredPdfToolsError(Exception):
@@ -123,6 +131,114 @@ def run_k2pdfopt(cmd: str) -> int:
     return proc.returncode
 
 
+def read_pdf(pdf_path: str, **kwargs: Any) -> PdfReader:
+    """Open a PDF file reusing the structure cached by a previous file action.
+
+    The structure is cached under the absolute path of the file and is only
+    reused while the size and modification time of the file are unchanged.
+    A structure that could not be reused is saved by `save_structures` once
+    the file action has run, so that it includes the pages it walked.
+    A structure expires once it has not been used for
+    `STRUCTURE_CACHE_MAX_AGE` seconds.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        **kwargs: Keyword arguments passed to the reader.
+
+    Returns:
+        PdfReader: Reader of the PDF file.
+    """
+    path = os.path.abspath(pdf_path)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    cache_name = f"structure_{hashlib.sha1(path.encode()).hexdigest()}"
+
+    try:
+        cached = wf.cached_data(cache_name, max_age=STRUCTURE_CACHE_MAX_AGE)
+    except Exception:  # pylint: disable=broad-except
+        cached = None  # written by an incompatible version
+
+    structure = cached[1] if cached and cached[0] == key else None
+
+    if structure is not None:
+        # the age of a structure counts from its last use
+        with suppress(OSError):
+            os.utime(wf.cachefile(f"{cache_name}.{wf.cache_serializer}"))
+
+    reader = PdfReader(pdf_path, structure=structure, **kwargs)
+
+    if not reader.structure_loaded:
+        unsaved_structures.append((cache_name, key, reader))
+
+    return reader
+
+
+def save_structures() -> None:
+    """Cache the structure of the PDF files opened by `read_pdf` since the last call.
+
+    The structures of the files whose reader has been closed are not saved.
+    Once a structure is saved, the expired structures are removed from the
+    cache so that it does not keep one for every file ever opened.
+    """
+    saved = False
+
+    while unsaved_structures:
+        cache_name, key, reader = unsaved_structures.pop()
+
+        if not getattr(reader.stream, "closed", False):
+            wf.cache_data(cache_name, (key, reader.dump_structure()))
+            saved = True
+
+    if saved:
+        wf.clear_cache(
+            lambda cache_file: cache_file.startswith("structure_")
+            and wf.cached_data_age(Path(cache_file).stem) > STRUCTURE_CACHE_MAX_AGE
+        )
+
+
+@contextmanager
+def streamed_writer(
+    out_file: str, compress_identical_objects: bool = False
+) -> Iterator[PdfWriter]:
+    """Create a writer saving the objects to a file as soon as they are finished.
+
+    The objects are saved to a temporary file next to the output file, which
+    replaces it on exit: an input file with the same path is only overwritten
+    once it has been read. The temporary file is removed if an error occurred.
+
+    Args:
+        out_file (str): Path to the output PDF file.
+        compress_identical_objects (bool): Whether identical objects are
+            written once.
+
+    Yields:
+        PdfWriter: Writer of the output PDF file.
+    """
+    writer = PdfWriter()
+
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(out_file)), suffix=".pdf", delete=False
+    ) as f:
+        try:
+            writer.start_streaming(
+                f,
+                object_streams=True,
+                compress_identical_objects=compress_identical_objects,
+            )
+            yield writer
+            writer.write(f)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+
+    # temporary files are only readable by their owner
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(f.name, 0o666 & ~umask)
+    os.replace(f.name, out_file)
+
+
 @handle_exceptions
 def optimize(resolution: str, pdf_paths: list[str]) -> None:
     """Optimize PDF files.
@@ -223,7 +339,7 @@ def encrypt(pwd: str, pdf_paths: list[str]) -> None:
         pdf_paths (list): Paths to selected PDF files.
     """
     for pdf_path in pdf_paths:
-        reader = PdfReader(pdf_path)
+        reader = read_pdf(pdf_path)
         writer = PdfWriter()
 
         for page in reader.pages:
@@ -233,7 +349,7 @@ def encrypt(pwd: str, pdf_paths: list[str]) -> None:
         out_file = f"{Path(pdf_path).with_suffix('')} [encrypted].pdf"
 
         with open(out_file, "wb") as f:
-            writer.write(f)
+            writer.write(f, object_streams=True)
 
         notify.notify("Alfred PDF Tools", "Encryption successfully completed.")
 
@@ -247,7 +363,7 @@ def decrypt(pwd: str, pdf_paths: list[str]) -> None:
         pdf_paths (list): Paths to selected PDF files.
     """
     for pdf_path in pdf_paths:
-        reader = PdfReader(pdf_path)
+        reader = read_pdf(pdf_path)
         reader.decrypt(pwd)
 
         writer = PdfWriter()
@@ -265,34 +381,38 @@ def decrypt(pwd: str, pdf_paths: list[str]) -> None:
         out_file = f"{Path(pdf_path).with_suffix('')} [decrypted].pdf"
 
         with open(out_file, "wb") as f:
-            writer.write(f)
+            writer.write(f, object_streams=True)
 
         notify.notify("Alfred PDF Tools", "Decryption successfully completed.")
 
 
 @handle_exceptions
-def merge(out_filename: str, pdf_paths: list[str]):
+def merge(out_filename: str, pdf_paths: list[str], remove_duplicates: bool = True):
     """Merge PDF files.
 
     Args:
         out_filename (str): Filename of the output PDF file without extension.
         pdf_paths (list): Paths to selected PDF files.
+        remove_duplicates (bool): Whether the objects shared by the PDF files,
+            such as fonts or images, are stored once in the output PDF file.
     """
     parent_paths = [Path(pdf_path).parent for pdf_path in pdf_paths]
 
     if not parent_paths[1:] == parent_paths[:-1]:
         raise MultiplePathsError
 
-    writer = PdfWriter()
-
-    for pdf_path in pdf_paths:
-        reader = PdfReader(pdf_path)
-        writer.append(reader)
-
     if out_filename:
-        writer.write(f"{parent_paths[0]}/{out_filename}.pdf")
+        out_file = f"{parent_paths[0]}/{out_filename}.pdf"
     else:
-        writer.write(f"{Path(pdf_paths[0]).with_suffix('')} [merged].pdf")
+        out_file = f"{Path(pdf_paths[0]).with_suffix('')} [merged].pdf"
+
+    with streamed_writer(out_file, remove_duplicates) as writer:
+        for pdf_path in pdf_paths:
+            with read_pdf(pdf_path) as reader:
+                writer.append(reader)
+                # the objects taken from the reader are written: release it
+                writer.reset_translation(reader)
+                save_structures()
 
     v = Variables(pdf_paths)
     print(json.dumps(v.obj))
@@ -310,16 +430,17 @@ def split_count(max_pages: str, abs_path: str, suffix: str) -> None:
     if int(max_pages) < 0:
         raise ValueError
 
-    reader = PdfReader(abs_path)
+    reader = read_pdf(abs_path)
 
     pg_cnt = int(max_pages)
     num_pages = len(reader.pages)
     page_ranges = [PageRange(slice(n, n + pg_cnt)) for n in range(0, num_pages, pg_cnt)]
 
     for n, page_range in enumerate(page_ranges, 1):
-        writer = PdfWriter()
-        writer.append(reader, pages=page_range)
-        writer.write(f"{Path(abs_path).with_suffix('')} [{suffix} {n}].pdf")
+        out_file = f"{Path(abs_path).with_suffix('')} [{suffix} {n}].pdf"
+
+        with streamed_writer(out_file) as writer:
+            writer.append(reader, pages=page_range)
 
 
 @handle_exceptions
@@ -335,7 +456,7 @@ def split_size(max_size: str, abs_path: str, suffix: str) -> None:
         raise ValueError
 
     max_chunk_sz = float(max_size) * 1000000
-    reader = PdfReader(abs_path)
+    reader = read_pdf(abs_path, cache_max_bytes=READER_CACHE_MAX_BYTES)
     pg_cnt = len(reader.pages)
     pg_sizes = []
 
@@ -345,7 +466,7 @@ def split_size(max_size: str, abs_path: str, suffix: str) -> None:
             writer.add_page(page)
 
             with open(f"{tmp_dir}/page{n}", "wb") as f:
-                writer.write(f)
+                writer.write(f, object_streams=True)
 
             tmp_file_size = os.path.getsize(f"{tmp_dir}/page{n}")
             pg_sizes.append(tmp_file_size)
@@ -374,7 +495,10 @@ def split_size(max_size: str, abs_path: str, suffix: str) -> None:
         for n, slice__ in enumerate(slices, 1):
             writer = PdfWriter()
             writer.append(reader, pages=slice__)
-            writer.write(f"{Path(abs_path).with_suffix('')} [{suffix} {n}].pdf")
+            writer.write(
+                f"{Path(abs_path).with_suffix('')} [{suffix} {n}].pdf",
+                object_streams=True,
+            )
     else:
         while not stop > pg_cnt:
             out_file_name = (
@@ -390,13 +514,13 @@ def split_size(max_size: str, abs_path: str, suffix: str) -> None:
                 else:
                     writer = PdfWriter()
                     writer.append(reader, pages=(start, stop))
-                    writer.write(out_file_name)
+                    writer.write(out_file_name, object_streams=True)
                     break
             else:
                 if chunk_pg_cnt == 1:
                     writer = PdfWriter()
                     writer.append(reader, pages=(start, stop))
-                    writer.write(out_file_name)
+                    writer.write(out_file_name, object_streams=True)
                     start = stop
                     stop += 1
                     pg_num += 1
@@ -404,7 +528,7 @@ def split_size(max_size: str, abs_path: str, suffix: str) -> None:
                     stop -= 1
                     writer = PdfWriter()
                     writer.append(reader, pages=(start, stop))
-                    writer.write(out_file_name)
+                    writer.write(out_file_name, object_streams=True)
                     chunk_size = os.path.getsize(out_file_name)
                     next_page = pg_sizes[stop : stop + 1][0]
 
@@ -443,7 +567,7 @@ def slice_(query: str, abs_path: str, is_single: bool, suffix: str) -> None:
             if int(pg_range[0]) > int(pg_range[1]):
                 raise ValueError
 
-    reader = PdfReader(abs_path)
+    reader = read_pdf(abs_path)
     pg_cnt = len(reader.pages)
 
     slices = [
@@ -460,12 +584,17 @@ def slice_(query: str, abs_path: str, is_single: bool, suffix: str) -> None:
 
         for slice__ in slices:
             writer.append(reader, pages=slice__)
-        writer.write(f"{Path(abs_path).with_suffix('')} [sliced].pdf")
+        writer.write(
+            f"{Path(abs_path).with_suffix('')} [sliced].pdf", object_streams=True
+        )
     else:
         for part_num, slice__ in enumerate(slices, 1):
             writer = PdfWriter()
             writer.append(reader, pages=slice__)
-            writer.write(f"{Path(abs_path).with_suffix('')} [{suffix} {part_num}].pdf")
+            writer.write(
+                f"{Path(abs_path).with_suffix('')} [{suffix} {part_num}].pdf",
+                object_streams=True,
+            )
 
 
 @handle_exceptions
@@ -476,7 +605,7 @@ def crop(pdf_paths: list[str]) -> None:
         pdf_paths (list): Paths to selected PDF files.
     """
     for pdf_path in pdf_paths:
-        reader = PdfReader(pdf_path)
+        reader = read_pdf(pdf_path)
         writer = PdfWriter()
 
         for page in reader.pages:
@@ -523,10 +652,11 @@ def crop(pdf_paths: list[str]) -> None:
             writer.add_page(page_copy_1)
             writer.add_page(page_copy_2)
 
+        writer.compress_streams()
         out_file = f"{Path(pdf_path).with_suffix('')} [cropped].pdf"
 
         with open(out_file, "wb") as f:
-            writer.write(f)
+            writer.write(f, object_streams=True)
 
 
 @handle_exceptions
@@ -540,7 +670,7 @@ def scale(pdf_paths: list[str]) -> None:
     height = float(sys.argv[3]) * 72
 
     for pdf_path in pdf_paths:
-        reader = PdfReader(pdf_path)
+        reader = read_pdf(pdf_path)
         writer = PdfWriter()
 
         for page in reader.pages:
@@ -549,10 +679,11 @@ def scale(pdf_paths: list[str]) -> None:
 
             writer.add_page(out_page)
 
+        writer.compress_streams()
         out_file = f"{Path(pdf_path).with_suffix('')} [scaled].pdf"
 
         with open(out_file, "wb") as f:
-            writer.write(f)
+            writer.write(f, object_streams=True)
 
 
 @handle_exceptions
@@ -563,7 +694,7 @@ def extract_text(pdf_paths: list[str]) -> None:
         pdf_paths (list): Paths to selected PDF files.
     """
     for pdf_path in pdf_paths:
-        reader = PdfReader(pdf_path)
+        reader = read_pdf(pdf_path, cache_max_bytes=READER_CACHE_MAX_BYTES)
         for page in reader.pages:
             print(page.extract_text(extraction_mode="layout") + "\n")
 
@@ -577,6 +708,7 @@ def main(wf) -> None:  # type: ignore[param-type] # pylint: disable=redefined-ou
     abs_path = os.environ["abs_path"]
     pdf_paths = abs_path.split("\t")
     suffix = os.environ["suffix"]
+    remove_duplicates = os.environ.get("remove_duplicates", "1") == "1"
 
     if args["--optimize"]:
         optimize(query, pdf_paths)
@@ -589,9 +721,9 @@ def main(wf) -> None:  # type: ignore[param-type] # pylint: disable=redefined-ou
     elif args["--decrypt"] is not None:
         decrypt(query, pdf_paths)
     elif args["--mrg"]:
-        merge(query, pdf_paths)
+        merge(query, pdf_paths, remove_duplicates)
     elif args["--mrg-trash"]:
-        merge(query, pdf_paths)
+        merge(query, pdf_paths, remove_duplicates)
     elif args["--split-count"]:
         split_count(query, abs_path, suffix)
     elif args["--split-size"]:
@@ -607,6 +739,8 @@ def main(wf) -> None:  # type: ignore[param-type] # pylint: disable=redefined-ou
     elif args["--extract-text"]:
         extract_text(pdf_paths)
 
+    save_structures()
+
     if wf.update_available:
         notify.notify(
             "Alfred PDF Tools", "A newer version of the workflow is available.", "Glass"
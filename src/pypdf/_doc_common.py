@@ -93,6 +93,14 @@ from .types import OutlineType, PagemodeType
 from .xmp import XmpInformation
 
 
+INHERITABLE_PAGE_ATTRIBUTES = (
+    NameObject(PG.RESOURCES),
+    NameObject(PG.MEDIABOX),
+    NameObject(PG.CROPBOX),
+    NameObject(PG.ROTATE),
+)
+
+
 def convert_to_int(d: bytes, size: int) -> Union[int, Tuple[Any, ...]]:
     if size > 8:
         raise PdfReadError("invalid size in convert_to_int")
@@ -1008,9 +1016,8 @@ class PdfDocCommon:
         (through del operator)
         Note: only the page entry is removed. As the objects beneath can be used
         somewhere else.
-        A solution to completely remove them - if they are not used anywhere -
-        is to write to a buffer/temporary file and to load it into a new PdfWriter
-        object afterwards.
+        The objects which are not used anywhere anymore are left out when the
+        document is written.
         """
         return _VirtualList(self.get_num_pages, self.get_page)  # type: ignore
 
@@ -1084,12 +1091,6 @@ class PdfDocCommon:
         inherit: Optional[Dict[str, Any]] = None,
         indirect_reference: Optional[IndirectObject] = None,
     ) -> None:
-        inheritable_page_attributes = (
-            NameObject(PG.RESOURCES),
-            NameObject(PG.MEDIABOX),
-            NameObject(PG.CROPBOX),
-            NameObject(PG.ROTATE),
-        )
         if inherit is None:
             inherit = {}
         if pages is None:
@@ -1109,7 +1110,7 @@ class PdfDocCommon:
             t = "/Pages"
 
         if t == "/Pages":
-            for attr in inheritable_page_attributes:
+            for attr in INHERITABLE_PAGE_ATTRIBUTES:
                 if attr in pages:
                     inherit[attr] = pages[attr]
             for page in cast(ArrayObject, pages[PA.KIDS]):
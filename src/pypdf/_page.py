@@ -338,10 +338,9 @@ class PageObject(DictionaryObject):
         self.inline_images_keys: Optional[List[Union[str, List[str]]]] = None
         self.indirect_reference = indirect_reference
 
-    def hash_value_data(self) -> bytes:
-        data = super().hash_value_data()
-        data += b"%d" % id(self)
-        return data
+    def _hash_digest(self) -> bytes:
+        digest = super()._hash_digest()
+        return self.hash_func(digest + b"%d" % id(self)).digest()
 
     @property
     def user_unit(self) -> float:
@@ -2262,6 +2261,9 @@ class _VirtualList(Sequence[PageObject]):
                     del ind.pdf.flattened_pages[index]  # case of page in a Reader
                 except Exception:  # pragma: no cover
                     pass
+                if hasattr(ind.pdf, "_lazy_pages"):
+                    # pages resolved lazily by a Reader are now shifted
+                    ind.pdf._lazy_pages.clear()
                 if "/Count" in parent:
                     parent[NameObject("/Count")] = NumberObject(parent["/Count"] - 1)
                 if len(parent["/Kids"]) == 0:
@@ -2269,13 +2271,25 @@ class _VirtualList(Sequence[PageObject]):
                     ind = parent.indirect_reference
                     parent = cast(DictionaryObject, parent.get("/Parent", None))
                 else:
-                    parent = None
+                    # the ancestors have lost one page as well
+                    parent = parent.get("/Parent", None)
+                    while parent is not None:
+                        parent = cast(DictionaryObject, parent.get_object())
+                        if "/Count" in parent:
+                            parent[NameObject("/Count")] = NumberObject(
+                                parent["/Count"] - 1
+                            )
+                        parent = parent.get("/Parent", None)
             except ValueError:  # from index
                 raise PdfReadError(f"Page Not Found in Page Tree {ind}")
 
     def __iter__(self) -> Iterator[PageObject]:
-        for i in range(len(self)):
+        # the length is evaluated at each step: it may be corrected while
+        # the pages of a damaged page tree are retrieved
+        i = 0
+        while i < len(self):
             yield self[i]
+            i += 1
 
     def __str__(self) -> str:
         p = [f"PageObject({i})" for i in range(self.length_function())]
@@ -2,7 +2,7 @@
 
 from abc import abstractmethod
 from pathlib import Path
-from typing import IO, Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Dict, List, MutableMapping, Optional, Tuple, Union
 
 try:
     # Python 3.8+: https://peps.python.org/pep-0586
@@ -67,7 +67,7 @@ class PdfCommonDocProtocol(Protocol):
 class PdfReaderProtocol(PdfCommonDocProtocol, Protocol):
     @property
     @abstractmethod
-    def xref(self) -> Dict[int, Dict[int, Any]]:
+    def xref(self) -> Dict[int, MutableMapping[int, Any]]:
         ...  # pragma: no cover
 
     @property
@@ -27,8 +27,13 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
 import os
 import re
+import sys
+from array import array
+from collections import OrderedDict
+from copy import deepcopy
 from io import BytesIO, UnsupportedOperation
 from pathlib import Path
 from typing import (
@@ -37,26 +42,39 @@ from typing import (
     Dict,
     Iterable,
     List,
+    MutableMapping,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
 )
 
-from ._doc_common import PdfDocCommon, convert_to_int
+from ._doc_common import INHERITABLE_PAGE_ATTRIBUTES, PdfDocCommon, convert_to_int
 from ._encryption import Encryption, PasswordType
 from ._page import PageObject
 from ._utils import (
+    FileSlice,
+    MemoryMappedStream,
     StrByteType,
     StreamType,
     b_,
     logger_warning,
     read_non_whitespace,
     read_previous_line,
+    read_stream_buffer,
     read_until_whitespace,
     skip_over_comment,
     skip_over_whitespace,
 )
+from ._xref import (
+    XrefFlags,
+    XrefObjectStreams,
+    XrefOffsets,
+    new_free_entry_generation,
+    new_xref_generation,
+)
+from .constants import PagesAttributes as PA
 from .constants import TrailerKeys as TK
 from .errors import (
     EmptyFileError,
@@ -76,12 +94,114 @@ from .generic import (
     NullObject,
     NumberObject,
     PdfObject,
+    StreamObject,
     TextStringObject,
     read_object,
 )
 from .xmp import XmpInformation
 
 
+#: Format of the data returned by :meth:`PdfReader.dump_structure`.
+STRUCTURE_VERSION = 1
+# size of the head and of the tail of the file covered by the structure checksum
+_STRUCTURE_CHECKSUM_SIZE = 1024
+
+
+def _loaded_size(obj: StreamObject) -> int:
+    """Return the size of the data of *obj* held in memory."""
+    data = obj._raw_data()
+    return 0 if isinstance(data, FileSlice) else len(data)
+
+
+class _ObjectCache(OrderedDict):  # type: ignore[type-arg]
+    """
+    Storage of parsed objects, evicting the least recently used ones.
+
+    Objects are evicted once more than ``max_objects`` of them are stored, or
+    once the data of the stored streams, encoded and decoded, exceeds
+    ``max_bytes``. The data left in a memory-mapped file is not counted, and
+    the objects holding no data are not evicted to free bytes. Only the
+    objects accepted by ``evictable`` are evicted; the reader parses them
+    again when they are needed.
+    """
+
+    def __init__(
+        self,
+        max_objects: Optional[int],
+        max_bytes: Optional[int],
+        evictable: Callable[[Tuple[Any, Any]], bool],
+    ) -> None:
+        super().__init__()
+        self.max_objects = max_objects
+        self.max_bytes = max_bytes
+        self._evictable = evictable
+        self._sizes: Dict[Tuple[Any, Any], int] = {}
+        self.nbytes = 0
+
+    def _update_size(self, key: Tuple[Any, Any], obj: Optional[PdfObject]) -> None:
+        size = 0
+        if isinstance(obj, StreamObject):
+            size = _loaded_size(obj)
+            if obj.decoded_self is not None:
+                size += _loaded_size(obj.decoded_self)
+        self.nbytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def room(self) -> Optional[int]:
+        """Return how many objects can be added without evicting any."""
+        if self.max_objects is None:
+            return None
+        return max(self.max_objects - len(self), 0)
+
+    def _evict(self, keep: Tuple[Any, Any]) -> None:
+        skipped = 0
+        while skipped < len(self):
+            too_many = self.max_objects is not None and len(self) > self.max_objects
+            too_big = self.max_bytes is not None and self.nbytes > self.max_bytes
+            if not too_many and not too_big:
+                break
+            key = next(iter(self))
+            if (
+                key == keep
+                or not self._evictable(key)
+                # evicting an object without data does not free any byte
+                or (not too_many and not self._sizes.get(key))
+            ):
+                self.move_to_end(key)
+                skipped += 1
+            else:
+                del self[key]
+
+    def get(self, key: Tuple[Any, Any], default: Any = None) -> Any:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        obj = super().__getitem__(key)
+        # the data of a stream grows once it is decoded
+        self._update_size(key, obj)
+        self._evict(key)
+        return obj
+
+    def __setitem__(self, key: Tuple[Any, Any], obj: Optional[PdfObject]) -> None:
+        super().__setitem__(key, obj)
+        self.move_to_end(key)
+        self._update_size(key, obj)
+        self._evict(key)
+
+    def __delitem__(self, key: Tuple[Any, Any]) -> None:
+        super().__delitem__(key)
+        self.nbytes -= self._sizes.pop(key, 0)
+
+    def pop(self, key: Tuple[Any, Any], *default: Any) -> Any:
+        self.nbytes -= self._sizes.pop(key, 0)
+        return super().pop(key, *default)
+
+    def clear(self) -> None:
+        super().clear()
+        self._sizes.clear()
+        self.nbytes = 0
+
+
 class PdfReader(PdfDocCommon):
     """
     Initialize a PdfReader object.
@@ -99,6 +219,24 @@ class PdfReader(PdfDocCommon):
         password: Decrypt PDF file at initialization. If the
             password is None, the file will not be decrypted.
             Defaults to ``None``.
+        memory_map: When *stream* is a path, map the file into memory
+            instead of reading it completely. Only the parts of the file
+            that are parsed are then loaded. Defaults to ``True``.
+        cache_max_objects: Maximum number of parsed objects kept in
+            :attr:`resolved_objects`. Defaults to ``None`` (no limit).
+        cache_max_bytes: Maximum size of the stream data, encoded and
+            decoded, held by the objects kept in :attr:`resolved_objects`.
+            Defaults to ``None`` (no limit).
+        structure: Data returned by :meth:`dump_structure` for a previous
+            reading of the same file. When it matches the file, the
+            cross-reference tables, the trailer and the page tree are not
+            parsed again. Defaults to ``None``.
+
+    When a limit is set, the least recently used objects are evicted and
+    parsed again from the file when needed: changes made to them are lost.
+    The catalog, the page tree, the objects referenced by the trailer and
+    the objects which are not in the cross-reference table are never
+    evicted.
     """
 
     def __init__(
@@ -106,12 +244,43 @@ class PdfReader(PdfDocCommon):
         stream: Union[StrByteType, Path],
         strict: bool = False,
         password: Union[None, str, bytes] = None,
+        memory_map: bool = True,
+        cache_max_objects: Optional[int] = None,
+        cache_max_bytes: Optional[int] = None,
+        structure: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.strict = strict
         self.flattened_pages: Optional[List[PageObject]] = None
+        # (idnum, generation) of every page, when loaded from a structure
+        self._page_refs: Optional[List[Tuple[int, int]]] = None
+        self._structure = structure
+        #: Whether the structure given to the constructor has been used.
+        self.structure_loaded = False
+        # pages resolved from the page tree without flattening it
+        self._lazy_pages: Dict[int, PageObject] = {}
+        self._lazy_page_tree_failed = False
+        # /Count of the page tree root, once checked against the whole tree in
+        # strict mode
+        self._checked_page_count: Optional[int] = None
+        # kids of the page tree nodes, by (idnum, generation) of the node
+        self._page_tree_kids: Dict[Tuple[int, int], Any] = {}
         #: Storage of parsed PDF objects.
         self.resolved_objects: Dict[Tuple[Any, Any], Optional[PdfObject]] = {}
+        if cache_max_objects is not None or cache_max_bytes is not None:
+            self.resolved_objects = _ObjectCache(
+                cache_max_objects, cache_max_bytes, self._is_evictable
+            )
+        #: Objects never evicted from a bounded cache, as (generation, idnum).
+        self._pinned_objects: Set[Tuple[Any, Any]] = set()
         self.xref_index = 0
+        #: Offsets of the objects within each object stream, by stream number.
+        self._objstm_index: Dict[int, Dict[int, Tuple[int, int]]] = {}
+        # decoded data of the object streams, by stream number; not kept with
+        # a bounded cache, whose byte budget does not account for it
+        self._objstm_data: Dict[int, BytesIO] = {}
+        #: Offsets of all the object headers found in the file, by object
+        #: number; built on the first object missing from the xref.
+        self._obj_header_index: Optional[Dict[int, List[Tuple[int, int, int]]]] = None
         self._page_id2num: Optional[
             Dict[Any, Any]
         ] = None  # map page indirect_reference number to Page Number
@@ -122,10 +291,14 @@ class PdfReader(PdfDocCommon):
                 __name__,
             )
         if isinstance(stream, (str, Path)):
-            with open(stream, "rb") as fh:
-                stream = BytesIO(fh.read())
+            if memory_map and os.path.getsize(stream) > 0:
+                stream = MemoryMappedStream(stream)
+            else:
+                with open(stream, "rb") as fh:
+                    stream = BytesIO(fh.read())
         self.read(stream)
         self.stream = stream
+        self._structure = None
 
         self._override_encryption = False
         self._encryption: Optional[Encryption] = None
@@ -153,6 +326,32 @@ class PdfReader(PdfDocCommon):
         elif password is not None:
             raise PdfReadError("Not encrypted file")
 
+    def __enter__(self) -> "PdfReader":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memory map opened for a path, if any, along with the
+        objects parsed from it, which can no longer be read.
+
+        The streams still in use elsewhere, e.g. cloned into a PdfWriter,
+        are read into memory first.
+        """
+        if isinstance(self.stream, MemoryMappedStream):
+            # the parsed objects refer to the reader: release them now rather
+            # than when the reference cycles are collected, and before the
+            # streams still referring to the file are read
+            self.resolved_objects.clear()
+            self._objstm_index.clear()
+            self._objstm_data.clear()
+            self._page_tree_kids.clear()
+            self._lazy_pages.clear()
+            self.flattened_pages = None
+            self.stream.close()
+
     @property
     def root_object(self) -> DictionaryObject:
         """Provide access to "/Root". standardized with PdfWriter."""
@@ -242,9 +441,76 @@ class PdfReader(PdfDocCommon):
         finally:
             self._override_encryption = False
 
-    def _get_page(self, page_number: int) -> PageObject:
+    def get_num_pages(self) -> int:
+        """
+        Calculate the number of pages in this PDF file.
+
+        The count is taken from the ``/Count`` entry of the page tree root,
+        so the page tree does not have to be flattened. The counts of the
+        nodes are checked against their kids on the way down to the pages
+        retrieved: if the page tree turns out to be inconsistent, the pages
+        are counted by flattening it. In strict mode, every node of the page
+        tree is checked the first time, which resolves all the pages.
+
+        Returns:
+            The number of pages of the parsed PDF file
+
+        Raises:
+            PdfReadError: if file is encrypted and restrictions prevent
+                this action.
+        """
+        if (
+            self.flattened_pages is None
+            and not self._lazy_page_tree_failed
+            and not self.is_encrypted
+        ):
+            if self._page_refs is not None:
+                return len(self._page_refs)
+            try:
+                root = cast(DictionaryObject, self.root_object["/Pages"].get_object())
+                count = root.get(PA.COUNT)
+                if self.strict and count != self._checked_page_count:
+                    count = self._check_page_tree(root)
+            except Exception:
+                count = None
+            if isinstance(count, int) and count >= 0:
+                self._checked_page_count = count
+                return int(count)
+            self._lazy_page_tree_failed = True
+        return super().get_num_pages()
+
+    def _check_page_tree(self, root: DictionaryObject) -> Optional[int]:
+        """
+        Check the ``/Count`` of every node of the page tree against its kids.
+
+        Every kid of the nodes is resolved, but the pages are not built.
+
+        Returns:
+            The number of pages, or ``None`` if a node's ``/Count`` does not
+            match its kids or a node is reached twice.
+        """
+        visited = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            ref = getattr(node, "indirect_reference", None)
+            key = id(node) if ref is None else (ref.idnum, ref.generation)
+            if key in visited:
+                return None
+            visited.add(key)
+            kids = self._get_page_tree_kids(node)
+            if kids is None:
+                return None
+            stack.extend(obj for obj, _, _, is_node in kids if is_node)
+        return cast(int, root[PA.COUNT])
+
+    def get_page(self, page_number: int) -> PageObject:
         """
         Retrieve a page by number from this PDF file.
+        Most of the time ```.pages[page_number]``` is preferred.
+
+        The page is found by descending the page tree using the ``/Count`` of
+        each subtree; inherited attributes are only applied to that page.
 
         Args:
             page_number: The page number to retrieve
@@ -253,10 +519,185 @@ class PdfReader(PdfDocCommon):
         Returns:
             A :class:`PageObject<pypdf._page.PageObject>` instance.
         """
-        if self.flattened_pages is None:
-            self._flatten()
-        assert self.flattened_pages is not None, "hint for mypy"
-        return self.flattened_pages[page_number]
+        if self.strict and self.flattened_pages is None:
+            # the counts of the whole page tree are checked first
+            self.get_num_pages()
+        if self.flattened_pages is None and not self._lazy_page_tree_failed:
+            page = self._lazy_pages.get(page_number)
+            if page is None:
+                try:
+                    page = self._get_page(page_number)
+                except Exception:
+                    page = None
+            if page is not None:
+                self._lazy_pages[page_number] = page
+                return page
+            # the page tree is inconsistent: fall back to flattening it
+            self._lazy_page_tree_failed = True
+            self._lazy_pages = {}
+        return super().get_page(page_number)
+
+    def _get_page_tree_kids(
+        self, node: DictionaryObject
+    ) -> Optional[List[Tuple[DictionaryObject, Optional[IndirectObject], int, bool]]]:
+        """
+        Resolve the kids of a page tree node along with their page count.
+
+        The result is cached for the nodes which are indirect objects, as long
+        as their ``/Kids`` and ``/Count`` are unchanged.
+
+        Args:
+            node: A ``/Pages`` node of the page tree.
+
+        Returns:
+            The kids with their indirect reference, their number of pages and
+            whether they are ``/Pages`` nodes, or ``None`` if the ``/Count``
+            of the node does not match its kids.
+        """
+        kids_array = cast(ArrayObject, node[PA.KIDS])
+        node_ref = getattr(node, "indirect_reference", None)
+        # the node may be parsed again once evicted from the cache: its id
+        # is not stable
+        key = None if node_ref is None else (node_ref.idnum, node_ref.generation)
+        cached = self._page_tree_kids.get(key) if key is not None else None
+        if cached is not None and cached[0] == (len(kids_array), node.get(PA.COUNT)):
+            return cached[1]
+        kids = []
+        for kid in kids_array:
+            obj = kid.get_object()
+            if not obj:
+                # damaged file may have invalid child in /Pages
+                continue
+            obj = cast(DictionaryObject, obj)
+            if PA.TYPE in obj:
+                t = obj[PA.TYPE]
+            # if pdf has no type, considered as a page if /Kids is missing
+            elif PA.KIDS not in obj:
+                t = "/Page"
+            else:
+                t = "/Pages"
+            if t == "/Pages":
+                count = obj.get(PA.COUNT)
+                if not isinstance(count, int) or count < 0:
+                    return None
+            else:
+                count = 1 if t == "/Page" else 0
+            ref = kid if isinstance(kid, IndirectObject) else None
+            kids.append((obj, ref, int(count), t == "/Pages"))
+        if node.get(PA.COUNT) != sum(kid[2] for kid in kids):
+            return None
+        if key is not None:
+            self._page_tree_kids[key] = ((len(kids_array), node.get(PA.COUNT)), kids)
+        return kids
+
+    def _get_page(self, page_number: int) -> Optional[PageObject]:
+        """
+        Retrieve a page by descending the page tree from its root.
+
+        Args:
+            page_number: The page number to retrieve
+                (pages begin at zero)
+
+        Returns:
+            A :class:`PageObject<pypdf._page.PageObject>` instance, or ``None``
+            if the page tree is inconsistent.
+        """
+        if self._page_refs is not None:
+            return self._get_page_by_reference(page_number)
+        node = cast(DictionaryObject, self.root_object["/Pages"].get_object())
+        inherit: Dict[str, Any] = {}
+        visited = set()
+        while id(node) not in visited:
+            visited.add(id(node))
+            for attr in INHERITABLE_PAGE_ATTRIBUTES:
+                if attr in node:
+                    inherit[attr] = node[attr]
+            kids = self._get_page_tree_kids(node)
+            if kids is None:
+                return None
+            for obj, indirect_reference, count, is_node in kids:
+                if page_number < count:
+                    break
+                page_number -= count
+            else:
+                return None
+            if is_node:
+                node = obj
+                continue
+            for attr_in, value in inherit.items():
+                # if the page has it's own value, it does not inherit the
+                # parent's value:
+                if attr_in not in obj:
+                    obj[attr_in] = value
+            page_obj = PageObject(self, indirect_reference)
+            page_obj.update(obj)
+            return page_obj
+        return None  # loop in the page tree
+
+    def _get_page_by_reference(self, page_number: int) -> Optional[PageObject]:
+        """
+        Retrieve a page from the page map loaded with the structure.
+
+        The inherited attributes are collected by following the ``/Parent``
+        entries of the page.
+
+        Args:
+            page_number: The page number to retrieve
+                (pages begin at zero)
+
+        Returns:
+            A :class:`PageObject<pypdf._page.PageObject>` instance, or ``None``
+            if the page is not found.
+        """
+        assert self._page_refs is not None, "hint for mypy"
+        if not 0 <= page_number < len(self._page_refs):
+            return None
+        indirect_reference = IndirectObject(*self._page_refs[page_number], self)
+        obj = indirect_reference.get_object()
+        if not isinstance(obj, DictionaryObject):
+            return None
+        inherit: Dict[str, Any] = {}
+        visited = {id(obj)}
+        node = obj.get(PA.PARENT, NullObject()).get_object()
+        while isinstance(node, DictionaryObject) and id(node) not in visited:
+            visited.add(id(node))
+            for attr in INHERITABLE_PAGE_ATTRIBUTES:
+                # the nearest ancestor defining the attribute prevails
+                if attr in node and attr not in obj and attr not in inherit:
+                    inherit[attr] = node[attr]
+            node = node.get(PA.PARENT, NullObject()).get_object()
+        obj.update(inherit)
+        page_obj = PageObject(self, indirect_reference)
+        page_obj.update(obj)
+        return page_obj
+
+    def _resolved_page_refs(self) -> Optional[List[Tuple[int, int]]]:
+        """
+        Return the (idnum, generation) of the pages, if all were resolved.
+
+        Returns:
+            None if some page has not been retrieved yet, or is not an
+            indirect object.
+        """
+        if self._page_refs is not None:
+            return self._page_refs
+        if self.flattened_pages is not None:
+            pages = self.flattened_pages
+        elif (
+            self._lazy_pages
+            and not self._lazy_page_tree_failed
+            and len(self._lazy_pages) == self.get_num_pages()
+        ):
+            pages = [self._lazy_pages[i] for i in range(len(self._lazy_pages))]
+        else:
+            return None
+        refs = []
+        for page in pages:
+            ref = page.indirect_reference
+            if ref is None:
+                return None
+            refs.append((ref.idnum, ref.generation))
+        return refs
 
     def _get_page_number_by_indirect(
         self, indirect_reference: Union[None, int, NullObject, IndirectObject]
@@ -285,63 +726,122 @@ class PdfReader(PdfDocCommon):
         ret = self._page_id2num.get(idnum, None)
         return ret
 
-    def _get_object_from_stream(
-        self, indirect_reference: IndirectObject
-    ) -> Union[int, PdfObject, str]:
-        # indirect reference to object in object stream
-        # read the entire object stream into memory
-        stmnum, idx = self.xref_objStm[indirect_reference.idnum]
+    def _get_object_stream_index(
+        self, stmnum: int
+    ) -> Tuple[BytesIO, Dict[int, Tuple[int, int]]]:
+        """
+        Decode an object stream and index the objects it contains.
+
+        The index maps each object number to its position within the stream and
+        to the offset of its data. It is built on first access only and kept
+        for later lookups, along with the decoded data unless the object cache
+        is bounded.
+
+        Args:
+            stmnum: Object number of the object stream.
+
+        Returns:
+            The decoded stream data and the index.
+        """
+        stream_data = self._objstm_data.get(stmnum)
+        if stream_data is not None:
+            return stream_data, self._objstm_index[stmnum]
         obj_stm: EncodedStreamObject = IndirectObject(stmnum, 0, self).get_object()  # type: ignore
         # This is an xref to a stream, so its type better be a stream
         assert cast(str, obj_stm["/Type"]) == "/ObjStm"
-        # /N is the number of indirect objects in the stream
-        assert idx < obj_stm["/N"]
         stream_data = BytesIO(b_(obj_stm.get_data()))
-        for i in range(obj_stm["/N"]):  # type: ignore
-            read_non_whitespace(stream_data)
-            stream_data.seek(-1, 1)
-            objnum = NumberObject.read_from_stream(stream_data)
-            read_non_whitespace(stream_data)
-            stream_data.seek(-1, 1)
-            offset = NumberObject.read_from_stream(stream_data)
-            read_non_whitespace(stream_data)
-            stream_data.seek(-1, 1)
-            if objnum != indirect_reference.idnum:
-                # We're only interested in one object
-                continue
-            if self.strict and idx != i:
-                raise PdfReadError("Object is in wrong index.")
-            stream_data.seek(int(obj_stm["/First"] + offset), 0)  # type: ignore
+        index = self._objstm_index.get(stmnum)
+        if index is None:
+            index = {}
+            first = int(obj_stm["/First"])  # type: ignore
+            # /N is the number of indirect objects in the stream
+            for i in range(obj_stm["/N"]):  # type: ignore
+                read_non_whitespace(stream_data)
+                stream_data.seek(-1, 1)
+                objnum = NumberObject.read_from_stream(stream_data)
+                read_non_whitespace(stream_data)
+                stream_data.seek(-1, 1)
+                offset = NumberObject.read_from_stream(stream_data)
+                read_non_whitespace(stream_data)
+                stream_data.seek(-1, 1)
+                # keep the first occurrence, as the linear scan did
+                index.setdefault(int(objnum), (i, first + int(offset)))
+            self._objstm_index[stmnum] = index
+        if not isinstance(self.resolved_objects, _ObjectCache):
+            self._objstm_data[stmnum] = stream_data
+        return stream_data, index
+
+    def _read_object_from_stream(
+        self, stream_data: BytesIO, offset: int, i: int, idnum: int
+    ) -> PdfObject:
+        stream_data.seek(offset, 0)
+
+        # to cope with some case where the 'pointer' is on a white space
+        read_non_whitespace(stream_data)
+        stream_data.seek(-1, 1)
 
-            # to cope with some case where the 'pointer' is on a white space
-            read_non_whitespace(stream_data)
-            stream_data.seek(-1, 1)
+        try:
+            return read_object(stream_data, self)  # type: ignore
+        except PdfStreamError as exc:
+            # Stream object cannot be read. Normally, a critical error, but
+            # Adobe Reader doesn't complain, so continue (in strict mode?)
+            logger_warning(
+                f"Invalid stream (index {i}) within object {idnum} 0: {exc}",
+                __name__,
+            )
 
-            try:
-                obj = read_object(stream_data, self)
-            except PdfStreamError as exc:
-                # Stream object cannot be read. Normally, a critical error, but
-                # Adobe Reader doesn't complain, so continue (in strict mode?)
-                logger_warning(
-                    f"Invalid stream (index {i}) within object "
-                    f"{indirect_reference.idnum} {indirect_reference.generation}: "
-                    f"{exc}",
-                    __name__,
-                )
+            if self.strict:  # pragma: no cover
+                raise PdfReadError(
+                    f"Cannot read object stream: {exc}"
+                )  # pragma: no cover
+            # Replace with null. Hopefully it's nothing important.
+            return NullObject()  # pragma: no cover
 
-                if self.strict:  # pragma: no cover
-                    raise PdfReadError(
-                        f"Cannot read object stream: {exc}"
-                    )  # pragma: no cover
-                # Replace with null. Hopefully it's nothing important.
-                obj = NullObject()  # pragma: no cover
-            return obj
-
-        if self.strict:  # pragma: no cover
-            raise PdfReadError(
-                "This is a fatal error in strict mode."
-            )  # pragma: no cover
-        return NullObject()  # pragma: no cover
+    def _get_object_from_stream(
+        self, indirect_reference: IndirectObject
+    ) -> Union[int, PdfObject, str]:
+        # indirect reference to object in object stream
+        stmnum, idx = self.xref_objStm[indirect_reference.idnum]
+        stream_data, index = self._get_object_stream_index(stmnum)
+        if indirect_reference.idnum not in index:
+            if self.strict:  # pragma: no cover
+                raise PdfReadError(
+                    "This is a fatal error in strict mode."
+                )  # pragma: no cover
+            return NullObject()  # pragma: no cover
+        i, offset = index[indirect_reference.idnum]
+        if self.strict and idx != i:
+            raise PdfReadError("Object is in wrong index.")
+        obj = self._read_object_from_stream(
+            stream_data, offset, i, indirect_reference.idnum
+        )
+
+        # The stream is decoded anyway: materialise its other objects in the
+        # same pass instead of decoding it again for each of them. A bounded
+        # cache only takes the ones it has room for, leaving a slot for the
+        # requested object, so that they do not evict it or each other.
+        room = None
+        if isinstance(self.resolved_objects, _ObjectCache):
+            room = self.resolved_objects.room()
+            if room is not None:
+                room -= 1
+        for objnum, (j, obj_offset) in index.items():
+            if room is not None and room <= 0:
+                break
+            if (
+                objnum == indirect_reference.idnum
+                or self.xref_objStm.get(objnum, (None,))[0] != stmnum
+                or (0, objnum) in self.resolved_objects
+            ):
+                continue
+            self.cache_indirect_object(
+                0,
+                objnum,
+                self._read_object_from_stream(stream_data, obj_offset, j, objnum),
+            )
+            if room is not None:
+                room -= 1
+        return obj
 
     def get_object(
         self, indirect_reference: Union[int, IndirectObject]
@@ -375,30 +875,45 @@ class PdfReader(PdfDocCommon):
                     or generation != indirect_reference.generation
                 ):
                     raise PdfReadError("not matching, we parse the file for it")
-            except Exception:
-                if hasattr(self.stream, "getbuffer"):
-                    buf = bytes(self.stream.getbuffer())
-                else:
-                    p = self.stream.tell()
-                    self.stream.seek(0, 0)
-                    buf = self.stream.read(-1)
-                    self.stream.seek(p, 0)
-                m = re.search(
-                    rf"\s{indirect_reference.idnum}\s+{indirect_reference.generation}\s+obj".encode(),
-                    buf,
-                )
-                if m is not None:
-                    logger_warning(
-                        f"Object ID {indirect_reference.idnum},{indirect_reference.generation} ref repaired",
-                        __name__,
+            except Exception as exc:
+                if self._fix_shifted_xref_entry(indirect_reference):
+                    idnum, generation = (
+                        indirect_reference.idnum,
+                        indirect_reference.generation,
                     )
-                    self.xref[indirect_reference.generation][
-                        indirect_reference.idnum
-                    ] = (m.start(0) + 1)
-                    self.stream.seek(m.start(0) + 1)
-                    idnum, generation = self.read_object_header(self.stream)
                 else:
-                    idnum = -1  # exception will be raised below
+                    m = self._find_object_header(
+                        self.stream,
+                        indirect_reference.idnum,
+                        indirect_reference.generation,
+                    )
+                    if m is not None:
+                        logger_warning(
+                            f"Object ID {indirect_reference.idnum},{indirect_reference.generation} ref repaired",
+                            __name__,
+                        )
+                        self.xref[indirect_reference.generation][
+                            indirect_reference.idnum
+                        ] = m[1]
+                        self.stream.seek(m[1])
+                        idnum, generation = self.read_object_header(self.stream)
+                    elif isinstance(exc, ValueError) and not self.strict:
+                        # the entry does not point to an object header - cf #2326
+                        self._drop_xref_entry(
+                            indirect_reference.idnum, indirect_reference.generation
+                        )
+                        logger_warning(
+                            f"Object {indirect_reference.idnum} {indirect_reference.generation} not defined.",
+                            __name__,
+                        )
+                        self.cache_indirect_object(
+                            indirect_reference.generation,
+                            indirect_reference.idnum,
+                            None,
+                        )
+                        return None
+                    else:
+                        idnum = -1  # exception will be raised below
             if idnum != indirect_reference.idnum and self.xref_index:
                 # Xref table probably had bad indexes due to not being zero-indexed
                 if self.strict:
@@ -430,16 +945,8 @@ class PdfReader(PdfDocCommon):
                     retval, indirect_reference.idnum, indirect_reference.generation
                 )
         else:
-            if hasattr(self.stream, "getbuffer"):
-                buf = bytes(self.stream.getbuffer())
-            else:
-                p = self.stream.tell()
-                self.stream.seek(0, 0)
-                buf = self.stream.read(-1)
-                self.stream.seek(p, 0)
-            m = re.search(
-                rf"\s{indirect_reference.idnum}\s+{indirect_reference.generation}\s+obj".encode(),
-                buf,
+            m = self._find_object_header(
+                self.stream, indirect_reference.idnum, indirect_reference.generation
             )
             if m is not None:
                 logger_warning(
@@ -447,11 +954,13 @@ class PdfReader(PdfDocCommon):
                     __name__,
                 )
                 if indirect_reference.generation not in self.xref:
-                    self.xref[indirect_reference.generation] = {}
-                self.xref[indirect_reference.generation][indirect_reference.idnum] = (
-                    m.start(0) + 1
-                )
-                self.stream.seek(m.end(0) + 1)
+                    self.xref[indirect_reference.generation] = new_xref_generation(
+                        indirect_reference.generation
+                    )
+                self.xref[indirect_reference.generation][indirect_reference.idnum] = m[
+                    1
+                ]
+                self.stream.seek(m[2] + 1)
                 skip_over_whitespace(self.stream)
                 self.stream.seek(-1, 1)
                 retval = read_object(self.stream, self)  # type: ignore
@@ -478,6 +987,40 @@ class PdfReader(PdfDocCommon):
         )
         return retval
 
+    def _find_object_header(
+        self, stream: StreamType, idnum: int, generation: Optional[int] = None
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Search the file for the header of an object missing from the xref.
+
+        All the ``N G obj`` headers are indexed in a single scan of the file,
+        on the first miss; later lookups are answered from that index. When
+        an object is found several times, the last occurrence is the one of
+        the latest incremental update.
+
+        Args:
+            stream: The PDF file stream.
+            idnum: Object number to look for.
+            generation: Generation number to look for; ``None`` matches any.
+
+        Returns:
+            The generation number, the offset of the header and the offset
+            after the ``obj`` keyword of the last matching header, or ``None``
+            if the object is not found.
+        """
+        if self._obj_header_index is None:
+            index: Dict[int, List[Tuple[int, int, int]]] = {}
+            buf = read_stream_buffer(stream)
+            for m in re.finditer(rb"\s(\d+)\s+(\d+)\s+obj", buf):
+                index.setdefault(int(m.group(1)), []).append(
+                    (int(m.group(2)), m.start(1), m.end(0))
+                )
+            self._obj_header_index = index
+        for entry in reversed(self._obj_header_index.get(idnum, ())):
+            if generation is None or entry[0] == generation:
+                return entry
+        return None
+
     def read_object_header(self, stream: StreamType) -> Tuple[int, int]:
         # Should never be necessary to read out whitespace, since the
         # cross-reference table should put us in the right spot to read the
@@ -519,23 +1062,43 @@ class PdfReader(PdfDocCommon):
             if self.strict:
                 raise PdfReadError(msg)
             logger_warning(msg, __name__)
+        if isinstance(obj, DictionaryObject) and obj.get("/Type") in (
+            "/Catalog",
+            "/Pages",
+            "/Page",
+        ):
+            self._pinned_objects.add((generation, idnum))
         self.resolved_objects[(generation, idnum)] = obj
         if obj is not None:
             obj.indirect_reference = IndirectObject(idnum, generation, self)
         return obj
 
+    def _is_evictable(self, key: Tuple[Any, Any]) -> bool:
+        """Tell whether a cached object may be dropped and parsed again later."""
+        if key in self._pinned_objects:
+            return False
+        generation, idnum = key
+        return idnum in self.xref.get(generation, ()) or (
+            generation == 0 and idnum in self.xref_objStm
+        )
+
     def _replace_object(self, indirect: IndirectObject, obj: PdfObject) -> PdfObject:
         # function reserved for future dev
         if indirect.pdf != self:
             raise ValueError("Cannot update PdfReader with external object")
         if (indirect.generation, indirect.idnum) not in self.resolved_objects:
             raise ValueError("Cannot find referenced object")
+        self._pinned_objects.add((indirect.generation, indirect.idnum))
         self.resolved_objects[(indirect.generation, indirect.idnum)] = obj
         obj.indirect_reference = indirect
         return obj
 
     def read(self, stream: StreamType) -> None:
         self._basic_validation(stream)
+        if self._structure is not None and self._load_structure(
+            stream, self._structure
+        ):
+            return
         self._find_eof_marker(stream)
         startxref = self._find_startxref_pos(stream)
 
@@ -548,10 +1111,138 @@ class PdfReader(PdfDocCommon):
 
         # read all cross reference tables and their trailers
         self._read_xref_tables_and_trailers(stream, startxref, xref_issue_nr)
+        self._pin_trailer_objects()
+
+        # The xref entries are validated lazily by get_object(), on first
+        # access; validate_xref() does it for the whole table at once.
 
+    def _pin_trailer_objects(self) -> None:
+        for key in (TK.ROOT, TK.INFO, TK.ENCRYPT):
+            ref = self.trailer.raw_get(key) if key in self.trailer else None
+            if isinstance(ref, IndirectObject):
+                self._pinned_objects.add((ref.generation, ref.idnum))
+
+    @staticmethod
+    def _structure_checksum(stream: StreamType) -> str:
+        """Fingerprint the size, the header and the end of the file."""
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        stream.seek(0, 0)
+        head = stream.read(_STRUCTURE_CHECKSUM_SIZE)
+        stream.seek(max(size - _STRUCTURE_CHECKSUM_SIZE, 0), 0)
+        tail = stream.read(_STRUCTURE_CHECKSUM_SIZE)
+        return f"{size}:{hashlib.sha256(head + tail).hexdigest()}"
+
+    def _load_structure(self, stream: StreamType, structure: Dict[str, Any]) -> bool:
+        """
+        Take the cross-reference data, trailer and page map from *structure*.
+
+        Returns:
+            False, without changing the reader, if *structure* does not match
+            the file.
+        """
+        if structure.get("version") != STRUCTURE_VERSION or structure.get(
+            "checksum"
+        ) != self._structure_checksum(stream):
+            return False
+        try:
+            trailer = read_object(BytesIO(structure["trailer"]), self)
+        except Exception as e:
+            logger_warning(f"Invalid structure trailer: {e}", __name__)
+            return False
+        if not isinstance(trailer, DictionaryObject):
+            return False
+        self.xref = structure["xref"]
+        self.xref_free_entry = structure["xref_free_entry"]
+        self.xref_objStm = structure["xref_objStm"]
+        self.xref_index = structure["xref_index"]
+        self.trailer = trailer
+        self._page_refs = structure["pages"]
+        self._pin_trailer_objects()
+        self.structure_loaded = True
+        return True
+
+    def dump_structure(self) -> Dict[str, Any]:
+        """
+        Export the parsed cross-reference tables, trailer and page map.
+
+        The result can be pickled, and passed as *structure* to a later
+        :class:`PdfReader` of the same file to skip parsing them. The page
+        tree is not walked: the page map is only included once every page has
+        been retrieved, and never for encrypted files.
+
+        Returns:
+            A dictionary describing the structure of the file, along with a
+            checksum of the size, the header and the end of the file.
+        """
+        pages = None if self.is_encrypted else self._resolved_page_refs()
+        trailer = BytesIO()
+        self.trailer.write_to_stream(trailer)
+        return {
+            "version": STRUCTURE_VERSION,
+            "checksum": self._structure_checksum(self.stream),
+            "xref": deepcopy(self.xref),
+            "xref_free_entry": deepcopy(self.xref_free_entry),
+            "xref_objStm": deepcopy(self.xref_objStm),
+            "xref_index": self.xref_index,
+            "trailer": trailer.getvalue(),
+            "pages": None if pages is None else list(pages),
+        }
+
+    def _fix_shifted_xref_entry(self, indirect_reference: IndirectObject) -> bool:
+        """
+        Look up an object in a xref table that is not zero-indexed.
+
+        Such tables are shifted by ``xref_index`` entries: the object may be
+        found at the offset registered for ``idnum + xref_index``. The entry is
+        corrected if so.
+
+        Args:
+            indirect_reference: The object to look up.
+
+        Returns:
+            True if the object was found; the stream is then positioned after
+            its header.
+        """
+        if not self.xref_index or self.strict:
+            return False
+        xref_entry = self.xref[indirect_reference.generation]
+        shifted = xref_entry.get(indirect_reference.idnum + self.xref_index)
+        if shifted is None:
+            return False
+        self.stream.seek(shifted, 0)
+        try:
+            pid, pgen = self.read_object_header(self.stream)
+        except ValueError:
+            return False
+        if pid != indirect_reference.idnum or pgen != indirect_reference.generation:
+            return False
+        xref_entry[indirect_reference.idnum] = shifted
+        return True
+
+    def _drop_xref_entry(self, idnum: int, generation: int) -> None:
+        logger_warning(
+            f"Ignoring wrong pointing object {idnum} {generation} "
+            f"(offset {self.xref[generation][idnum]})",
+            __name__,
+        )
+        del self.xref[generation][idnum]
+
+    def validate_xref(self) -> None:
+        """
+        Check every entry of the cross-reference tables at once.
+
+        Entries are otherwise only checked when the object is first accessed.
+        In non-strict mode, the entries of a table that is not zero-indexed
+        are corrected, and entries that do not point to an object header are
+        removed.
+        """
+        if self.strict:
+            return
+        stream = self.stream
+        loc = stream.tell()
         # if not zero-indexed, verify that the table is correct; change it if necessary
-        if self.xref_index and not self.strict:
-            loc = stream.tell()
+        if self.xref_index:
             for gen, xref_entry in self.xref.items():
                 if gen == 65535:
                     continue
@@ -571,26 +1262,20 @@ class PdfReader(PdfDocCommon):
                         del self.xref[gen][id]
                     # if not, then either it's just plain wrong, or the
                     # non-zero-index is actually correct
-            stream.seek(loc, 0)  # return to where it was
 
         # remove wrong objects (not pointing to correct structures) - cf #2326
-        if not self.strict:
-            loc = stream.tell()
-            for gen, xref_entry in self.xref.items():
-                if gen == 65535:
-                    continue
-                ids = list(xref_entry.keys())
-                for id in ids:
-                    stream.seek(xref_entry[id], 0)
-                    try:
-                        self.read_object_header(stream)
-                    except ValueError:
-                        logger_warning(
-                            f"Ignoring wrong pointing object {id} {gen} (offset {xref_entry[id]})",
-                            __name__,
-                        )
-                        del xref_entry[id]  # we can delete the id, we are parsing ids
-            stream.seek(loc, 0)  # return to where it was
+        for gen, xref_entry in self.xref.items():
+            if gen == 65535:
+                continue
+            ids = list(xref_entry.keys())
+            for id in ids:
+                stream.seek(xref_entry[id], 0)
+                try:
+                    self.read_object_header(stream)
+                except ValueError:
+                    # we can delete the id, we are parsing ids
+                    self._drop_xref_entry(id, gen)
+        stream.seek(loc, 0)  # return to where it was
 
     def _basic_validation(self, stream: StreamType) -> None:
         """Ensure file is not empty. Read at most 5 bytes."""
@@ -688,6 +1373,9 @@ class PdfReader(PdfDocCommon):
             read_non_whitespace(stream)
             stream.seek(-1, 1)
             cnt = 0
+            offsets: List[int] = []
+            generations: List[int] = []
+            entry_types: List[bytes] = []
             while cnt < size:
                 line = stream.read(20)
 
@@ -717,15 +1405,7 @@ class PdfReader(PdfDocCommon):
                     offset, generation = int(offset_b), int(generation_b)
                 except Exception:
                     # if something wrong occurred
-                    if hasattr(stream, "getbuffer"):
-                        buf = bytes(stream.getbuffer())
-                    else:
-                        p = stream.tell()
-                        stream.seek(0, 0)
-                        buf = stream.read(-1)
-                        stream.seek(p)
-
-                    f = re.search(f"{num}\\s+(\\d+)\\s+obj".encode(), buf)
+                    f = self._find_object_header(stream, num)
                     if f is None:
                         logger_warning(
                             f"entry {num} in Xref table invalid; object not found",
@@ -738,31 +1418,14 @@ class PdfReader(PdfDocCommon):
                             f"entry {num} in Xref table invalid but object found",
                             __name__,
                         )
-                        generation = int(f.group(1))
-                        offset = f.start()
-
-                if generation not in self.xref:
-                    self.xref[generation] = {}
-                    self.xref_free_entry[generation] = {}
-                if num in self.xref[generation]:
-                    # It really seems like we should allow the last
-                    # xref table in the file to override previous
-                    # ones. Since we read the file backwards, assume
-                    # any existing key is already set correctly.
-                    pass
-                else:
-                    if entry_type_b == b"n":
-                        self.xref[generation][num] = offset
-                    try:
-                        self.xref_free_entry[generation][num] = entry_type_b == b"f"
-                    except Exception:
-                        pass
-                    try:
-                        self.xref_free_entry[65535][num] = entry_type_b == b"f"
-                    except Exception:
-                        pass
+                        generation, offset, _ = f
+
+                offsets.append(offset)
+                generations.append(generation)
+                entry_types.append(entry_type_b)
                 cnt += 1
                 num += 1
+            self._add_xref_table_entries(num - cnt, offsets, generations, entry_types)
             read_non_whitespace(stream)
             stream.seek(-1, 1)
             trailer_tag = stream.read(7)
@@ -772,12 +1435,109 @@ class PdfReader(PdfDocCommon):
             else:
                 break
 
+    def _add_xref_table_entries(
+        self,
+        start: int,
+        offsets: List[int],
+        generations: List[int],
+        entry_types: List[bytes],
+    ) -> None:
+        """
+        Store the entries of a subsection of a cross-reference table.
+
+        Runs of entries of generation 0 are stored at once when possible, the
+        other entries one by one.
+
+        Args:
+            start: The number of the first object of the subsection.
+            offsets: The byte offset of each entry.
+            generations: The generation number of each entry.
+            entry_types: The type of each entry, ``b"n"`` or ``b"f"``.
+        """
+        i = 0
+        while i < len(generations):
+            j = i
+            while j < len(generations) and generations[j] == 0:
+                j += 1
+            if j > i and self._load_xref_table_run(
+                start + i, offsets[i:j], entry_types[i:j]
+            ):
+                i = j
+                continue
+            for k in range(i, max(j, i + 1)):
+                self._add_xref_table_entry(
+                    start + k, offsets[k], generations[k], entry_types[k]
+                )
+            i = max(j, i + 1)
+
+    def _add_xref_table_entry(
+        self, num: int, offset: int, generation: int, entry_type_b: bytes
+    ) -> None:
+        if generation not in self.xref:
+            self.xref[generation] = new_xref_generation(generation)
+            self.xref_free_entry[generation] = new_free_entry_generation(generation)
+        if num in self.xref[generation]:
+            # It really seems like we should allow the last
+            # xref table in the file to override previous
+            # ones. Since we read the file backwards, assume
+            # any existing key is already set correctly.
+            return
+        if entry_type_b == b"n":
+            self.xref[generation][num] = offset
+        try:
+            self.xref_free_entry[generation][num] = entry_type_b == b"f"
+        except Exception:
+            pass
+        try:
+            self.xref_free_entry[65535][num] = entry_type_b == b"f"
+        except Exception:
+            pass
+
+    def _load_xref_table_run(
+        self, start: int, offsets: List[int], entry_types: List[bytes]
+    ) -> bool:
+        """
+        Store consecutive entries of generation 0 at once.
+
+        This is the same as calling :meth:`_add_xref_table_entry` for each of
+        them, provided none of these objects is already known from a more
+        recent section.
+
+        Returns:
+            True if the entries have been stored.
+        """
+        end = start + len(offsets)
+        if 0 not in self.xref:
+            self.xref[0] = new_xref_generation(0)
+            self.xref_free_entry[0] = new_free_entry_generation(0)
+        table = self.xref[0]
+        if not (isinstance(table, XrefOffsets) and table.is_vacant(start, end)):
+            return False
+        try:
+            column = array("q", offsets)
+        except OverflowError:
+            return False
+        if not table.load(start, [column], bytes(t == b"n" for t in entry_types)):
+            return False
+        flags = array("b", (t == b"f" for t in entry_types))
+        for generation in (0, 65535):
+            free = self.xref_free_entry.get(generation)
+            if free is None:
+                continue
+            if not (
+                isinstance(free, XrefFlags)
+                and free.load(start, [flags], b"\x01" * len(flags))
+            ):
+                for num, flag in enumerate(flags, start):
+                    free[num] = bool(flag)
+        return True
+
     def _read_xref_tables_and_trailers(
         self, stream: StreamType, startxref: Optional[int], xref_issue_nr: int
     ) -> None:
-        self.xref: Dict[int, Dict[Any, Any]] = {}
-        self.xref_free_entry: Dict[int, Dict[Any, Any]] = {}
-        self.xref_objStm: Dict[int, Tuple[Any, Any]] = {}
+        self.xref: Dict[int, MutableMapping[Any, Any]] = {}
+        self.xref_free_entry: Dict[int, MutableMapping[Any, Any]] = {}
+        self.xref_objStm: MutableMapping[Any, Tuple[Any, Any]] = XrefObjectStreams()
         self.trailer = DictionaryObject()
         while startxref is not None:
             # load the xref table
@@ -899,7 +1659,6 @@ class PdfReader(PdfDocCommon):
         xrefstream = cast(ContentStream, read_object(stream, self))
         assert cast(str, xrefstream["/Type"]) == "/XRef"
         self.cache_indirect_object(generation, idnum, xrefstream)
-        stream_data = BytesIO(b_(xrefstream.get_data()))
         # Index pairs specify the subsections in the dictionary. If
         # none create one subsection that spans everything.
         idx_pairs = xrefstream.get("/Index", [0, xrefstream.get("/Size")])
@@ -908,28 +1667,62 @@ class PdfReader(PdfDocCommon):
         if self.strict and len(entry_sizes) > 3:
             raise PdfReadError(f"Too many entry sizes: {entry_sizes}")
 
-        def get_entry(i: int) -> Union[int, Tuple[int, ...]]:
-            # Reads the correct number of bytes for each entry. See the
-            # discussion of the W parameter in PDF spec table 17.
-            if entry_sizes[i] > 0:
-                d = stream_data.read(entry_sizes[i])
-                return convert_to_int(d, entry_sizes[i])
-
-            # PDF Spec Table 17: A value of zero for an element in the
-            # W array indicates...the default value shall be used
-            if i == 0:
-                return 1  # First value defaults to 1
-            else:
-                return 0
-
-        def used_before(num: int, generation: Union[int, Tuple[int, ...]]) -> bool:
-            # We move backwards through the xrefs, don't replace any.
-            return num in self.xref.get(generation, []) or num in self.xref_objStm  # type: ignore
-
+        count = sum(size for _, size in self._pairs(idx_pairs))
+        fields = self._decode_xref_stream_fields(
+            b_(xrefstream.get_data()), entry_sizes, count
+        )
         # Iterate through each subsection
-        self._read_xref_subsections(idx_pairs, get_entry, used_before)
+        self._read_xref_subsections(idx_pairs, fields)
         return xrefstream
 
+    @staticmethod
+    def _decode_xref_stream_fields(
+        data: bytes, entry_sizes: List[int], count: int
+    ) -> List["array[int]"]:
+        """
+        Decode the three fields of the entries of a cross-reference stream.
+
+        Each column of the /W-strided table is gathered at once with extended
+        slices into big-endian 8-byte slots, which are loaded into an array.
+        Entries cut by the end of the data are decoded one by one, the missing
+        bytes being read as nothing, like a short read would.
+
+        Args:
+            data: The decoded stream data.
+            entry_sizes: The /W array, giving the size of each field.
+            count: The number of entries described by /Index.
+
+        Returns:
+            One array of ``count`` signed 64-bit integers per field.
+        """
+        widths = [int(w) for w in entry_sizes[:3]]
+        row_size = sum(widths)
+        complete = min(count, len(data) // row_size) if row_size else 0
+        fields = []
+        offset = 0
+        for i, width in enumerate(widths):
+            if width == 0:
+                # PDF Spec Table 17: A value of zero for an element in the
+                # W array indicates...the default value shall be used
+                fields.append(array("q", [1 if i == 0 else 0]) * count)
+                continue
+            if width > 8:
+                raise PdfReadError("invalid size in convert_to_int")
+            slots = bytearray(8 * complete)
+            end = row_size * complete
+            for k in range(width):
+                slots[8 - width + k :: 8] = data[offset + k : end : row_size]
+            field = array("q", slots)
+            if sys.byteorder == "little":
+                field.byteswap()
+            for row in range(complete, count):
+                start = row * row_size + offset
+                value = convert_to_int(data[start : start + width], width)
+                field.append(cast(int, value))
+            fields.append(field)
+            offset += width
+        return fields
+
     @staticmethod
     def _get_xref_issues(stream: StreamType, startxref: int) -> int:
         """
@@ -964,13 +1757,13 @@ class PdfReader(PdfDocCommon):
     def _rebuild_xref_table(self, stream: StreamType) -> None:
         self.xref = {}
         stream.seek(0, 0)
-        f_ = stream.read(-1)
+        f_ = read_stream_buffer(stream)
 
         for m in re.finditer(rb"[\r\n \t][ \t]*(\d+)[ \t]+(\d+)[ \t]+obj", f_):
             idnum = int(m.group(1))
             generation = int(m.group(2))
             if generation not in self.xref:
-                self.xref[generation] = {}
+                self.xref[generation] = new_xref_generation(generation)
             self.xref[generation][idnum] = m.start(1)
         stream.seek(0, 0)
         for m in re.finditer(rb"[\r\n \t][ \t]*trailer[\r\n \t]*(<<)", f_):
@@ -981,39 +1774,81 @@ class PdfReader(PdfDocCommon):
                 self.trailer[key] = value
 
     def _read_xref_subsections(
-        self,
-        idx_pairs: List[int],
-        get_entry: Callable[[int], Union[int, Tuple[int, ...]]],
-        used_before: Callable[[int, Union[int, Tuple[int, ...]]], bool],
+        self, idx_pairs: List[int], fields: List["array[int]"]
     ) -> None:
+        xref_types, fields1, fields2 = fields
+        row = 0
         for start, size in self._pairs(idx_pairs):
             # The subsections must increase
-            for num in range(start, start + size):
-                # The first entry is the type
-                xref_type = get_entry(0)
+            types = xref_types[row : row + size]
+            field1s = fields1[row : row + size]
+            field2s = fields2[row : row + size]
+            row += size
+            if self._load_vacant_xref_subsection(start, types, field1s, field2s):
+                continue
+            for num, xref_type, field1, field2 in zip(
+                range(start, start + size), types, field1s, field2s
+            ):
                 # The rest of the elements depend on the xref_type
                 if xref_type == 0:
                     # linked list of free objects
-                    next_free_object = get_entry(1)  # noqa: F841
-                    next_generation = get_entry(2)  # noqa: F841
+                    pass
                 elif xref_type == 1:
-                    # objects that are in use but are not compressed
-                    byte_offset = get_entry(1)
-                    generation = get_entry(2)
+                    # objects that are in use but are not compressed;
+                    # we move backwards through the xrefs, don't replace any
+                    byte_offset, generation = field1, field2
                     if generation not in self.xref:
-                        self.xref[generation] = {}  # type: ignore
-                    if not used_before(num, generation):
-                        self.xref[generation][num] = byte_offset  # type: ignore
+                        self.xref[generation] = new_xref_generation(generation)
+                    if num not in self.xref[generation] and num not in self.xref_objStm:
+                        self.xref[generation][num] = byte_offset
                 elif xref_type == 2:
-                    # compressed objects
-                    objstr_num = get_entry(1)
-                    obstr_idx = get_entry(2)
-                    generation = 0  # PDF spec table 18, generation is 0
-                    if not used_before(num, generation):
+                    # compressed objects, PDF spec table 18, generation is 0
+                    objstr_num, obstr_idx = field1, field2
+                    if num not in self.xref.get(0, ()) and num not in self.xref_objStm:
                         self.xref_objStm[num] = (objstr_num, obstr_idx)
                 elif self.strict:
                     raise PdfReadError(f"Unknown xref type: {xref_type}")
 
+    def _load_vacant_xref_subsection(
+        self,
+        start: int,
+        types: "array[int]",
+        field1s: "array[int]",
+        field2s: "array[int]",
+    ) -> bool:
+        """
+        Store a whole subsection of a cross-reference stream at once.
+
+        This is only possible when none of its objects is already known from a
+        more recent section, and when all its entries are free, compressed or
+        in use with generation 0; otherwise the entries are to be stored one by
+        one.
+
+        Returns:
+            True if the subsection has been stored.
+        """
+        end = start + len(types)
+        offsets = self.xref.get(0)
+        if offsets is None:
+            offsets = new_xref_generation(0)
+        objstm = self.xref_objStm
+        if not (
+            isinstance(offsets, XrefOffsets)
+            and isinstance(objstm, XrefObjectStreams)
+            and offsets.is_vacant(start, end)
+            and objstm.is_vacant(start, end)
+        ):
+            return False
+        in_use = bytes(t == 1 and g == 0 for t, g in zip(types, field2s))
+        compressed = bytes(t == 2 for t in types)
+        if in_use.count(1) + compressed.count(1) + types.count(0) != len(types):
+            return False
+        if in_use.count(1):
+            self.xref[0] = offsets
+        return offsets.load(start, [field1s], in_use) and objstm.load(
+            start, [field1s, field2s], compressed
+        )
+
     def _pairs(self, array: List[int]) -> Iterable[Tuple[int, int]]:
         i = 0
         while True:
@@ -31,13 +31,16 @@ __author_email__ = "biziqe@mathieu.fenniak.net"
 
 import functools
 import logging
+import mmap
+import os
 import re
 import sys
 import warnings
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import DEFAULT_BUFFER_SIZE, BytesIO
-from os import SEEK_CUR
+from os import SEEK_CUR, SEEK_END, SEEK_SET, PathLike
+from weakref import WeakSet, WeakValueDictionary
 from typing import (
     IO,
     Any,
@@ -320,6 +323,212 @@ def read_previous_line(stream: StreamType) -> bytes:
     return b"".join(line_content[::-1])
 
 
+class MemoryMappedStream:
+    """
+    Read-only, seekable stream backed by a memory-mapped file.
+
+    The file is mapped instead of read into memory: the operating system only
+    pages in the parts that are actually accessed, so resident memory scales
+    with the objects touched rather than with the file size.
+
+    Args:
+        path: Path of the file to map.
+    """
+
+    def __init__(self, path: Union[str, "PathLike[str]"]) -> None:
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._size = len(self._mmap)
+        self._pos = 0
+        self.name = str(path)
+        self.mode = "rb"
+        # objects whose data is still a FileSlice of the file, by id
+        self._slice_users: "WeakValueDictionary[int, Any]" = WeakValueDictionary()
+        _mapped_streams.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap.closed
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        start = self._pos
+        if start >= self._size:
+            return b""
+        if size is None or size < 0:
+            end = self._size
+        else:
+            end = min(start + size, self._size)
+        self._pos = end
+        return self._mmap[start:end]
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            pos = offset
+        elif whence == SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"negative seek value {pos}")
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def getbuffer(self) -> memoryview:
+        """Return a zero-copy view on the whole mapped file."""
+        return memoryview(self._mmap)
+
+    def slice(self, start: int, end: int) -> "FileSlice":
+        """Return a reference to the bytes from ``start`` to ``end - 1``."""
+        return FileSlice(self, start, min(end, self._size))
+
+    def add_slice_user(self, user: Any) -> None:
+        """
+        Register an object holding a :class:`FileSlice` of this file.
+
+        Its ``load_file_data()`` method is called before the file is closed.
+        """
+        self._slice_users[id(user)] = user
+
+    def remove_slice_user(self, user: Any) -> None:
+        self._slice_users.pop(id(user), None)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def load_slices(self) -> None:
+        """Copy into memory the data of the objects still slicing the file."""
+        for user in list(self._slice_users.values()):
+            user.load_file_data()
+
+    def close(self) -> None:
+        if self._mmap.closed:
+            return
+        self.load_slices()
+        self._mmap.close()
+
+    def __enter__(self) -> "MemoryMappedStream":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.close()
+
+
+_mapped_streams: "WeakSet[MemoryMappedStream]" = WeakSet()
+
+
+def load_mapped_slices(path: Union[str, "PathLike[str]"]) -> None:
+    """
+    Copy into memory the data sliced from the memory-mapped file *path*.
+
+    Must be called before the file is overwritten: accessing a mapping of a
+    truncated file crashes the process.
+
+    Args:
+        path: Path of the file about to be written.
+    """
+    if not os.path.exists(path):
+        return
+    for stream in list(_mapped_streams):
+        if (
+            not stream.closed
+            and os.path.exists(stream.name)
+            and os.path.samefile(stream.name, path)
+        ):
+            stream.load_slices()
+
+
+class FileSlice:
+    """
+    Bytes of a memory-mapped file, left in the file until they are needed.
+
+    The bytes can be written out through :meth:`view` without ever being
+    copied in memory.
+
+    Args:
+        source: The file.
+        start: Offset of the first byte.
+        end: Offset after the last byte.
+    """
+
+    __slots__ = ("source", "start", "end")
+
+    def __init__(self, source: MemoryMappedStream, start: int, end: int) -> None:
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def view(self) -> memoryview:
+        """
+        Return a zero-copy view on the bytes.
+
+        The file cannot be closed while the view is alive: release it as soon
+        as possible, e.g. with a ``with`` statement.
+        """
+        return self.source.getbuffer()[self.start : self.end]
+
+    def read(self) -> bytes:
+        """Return a copy of the bytes."""
+        with self.view() as view:
+            return view.tobytes()
+
+
+def stream_buffer(stream: StreamType) -> Optional[memoryview]:
+    """
+    Return a view on the whole stream data if the stream exposes one.
+
+    In-memory and memory-mapped streams allow tokenizing their content in
+    place, with a cursor, instead of reading it byte per byte.
+
+    Args:
+        stream: The data stream.
+
+    Returns:
+        A memoryview on the stream data, or None when the stream has no
+        underlying buffer (e.g. a regular file object).
+    """
+    getbuffer = getattr(stream, "getbuffer", None)
+    if getbuffer is None:
+        return None
+    return cast(memoryview, getbuffer())
+
+
+def read_stream_buffer(stream: StreamType) -> Union[bytes, memoryview]:
+    """
+    Return the whole content of the stream, without copy when possible.
+
+    The stream position is left unchanged.
+
+    Args:
+        stream: The data stream to read.
+
+    Returns:
+        A memoryview on the stream data for memory-mapped and in-memory
+        streams, the read bytes otherwise.
+    """
+    buf = stream_buffer(stream)
+    if buf is not None:
+        return buf
+    p = stream.tell()
+    stream.seek(0, 0)
+    buf = stream.read(-1)
+    stream.seek(p, 0)
+    return buf
+
+
 def matrix_multiply(
     a: TransformationMatrixType, b: TransformationMatrixType
 ) -> TransformationMatrixType:
@@ -32,9 +32,12 @@ import collections
 import decimal
 import enum
 import hashlib
+import os
 import re
 import uuid
-from io import BytesIO, FileIO, IOBase
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from io import BufferedWriter, BytesIO, FileIO, IOBase, RawIOBase
 from pathlib import Path
 from types import TracebackType
 from typing import (
@@ -47,6 +50,7 @@ from typing import (
     List,
     Optional,
     Pattern,
+    Set,
     Tuple,
     Type,
     Union,
@@ -60,11 +64,14 @@ from ._page import PageObject
 from ._page_labels import nums_clear_range, nums_insert, nums_next
 from ._reader import PdfReader
 from ._utils import (
+    MemoryMappedStream,
     StrByteType,
     StreamType,
     _get_max_pdf_version_header,
     b_,
+    load_mapped_slices,
     logger_warning,
+    stream_buffer,
 )
 from .constants import AnnotationDictionaryAttributes as AA
 from .constants import CatalogAttributes as CA
@@ -81,13 +88,16 @@ from .constants import (
 )
 from .constants import CatalogDictionary as CD
 from .constants import Core as CO
+from .constants import FilterTypes as FT
 from .constants import (
     FieldDictionaryAttributes as FA,
 )
 from .constants import PageAttributes as PG
 from .constants import PagesAttributes as PA
+from .constants import StreamAttributes as SA
 from .constants import TrailerKeys as TK
-from .errors import PyPdfError
+from .errors import PdfReadError, PyPdfError
+from .filters import FlateDecode
 from .generic import (
     PAGE_FIT,
     ArrayObject,
@@ -97,6 +107,7 @@ from .generic import (
     DecodedStreamObject,
     Destination,
     DictionaryObject,
+    EncodedStreamObject,
     Fit,
     FloatObject,
     IndirectObject,
@@ -124,6 +135,11 @@ from .types import (
 from .xmp import XmpInformation
 
 OPTIONAL_READ_WRITE_FIELD = FieldFlag(0)
+# maximum number of objects packed in each object stream
+OBJECT_STREAM_SIZE = 100
+# the objects are serialized with many small writes, gathered in a buffer of
+# this size when writing to an unbuffered file
+WRITE_BUFFER_SIZE = 1 << 20
 ALL_DOCUMENT_PERMISSIONS = UserAccessPermissions.all()
 
 
@@ -140,6 +156,17 @@ class ObjectDeletionFlag(enum.IntFlag):
     IMAGES = XOBJECT_IMAGES | INLINE_IMAGES | DRAWING_IMAGES
 
 
+def _get_subsections(idnums: List[int]) -> List[Tuple[int, int]]:
+    """Split sorted object numbers into runs, as (first number, count)."""
+    subsections: List[Tuple[int, int]] = []
+    for idnum in idnums:
+        if subsections and sum(subsections[-1]) == idnum:
+            subsections[-1] = (subsections[-1][0], subsections[-1][1] + 1)
+        else:
+            subsections.append((idnum, 1))
+    return subsections
+
+
 def _rolling_checksum(stream: BytesIO, blocksize: int = 65536) -> str:
     hash = hashlib.md5()
     for block in iter(lambda: stream.read(blocksize), b""):
@@ -153,6 +180,16 @@ class PdfWriter(PdfDocCommon):
     cloning a PDF file during initialization.
 
     Typically data is added from a :class:`PdfReader<pypdf.PdfReader>`.
+
+    Args:
+        fileobj: The file to write to, used when the writer is a context
+            manager.
+        clone_from: A PDF file, or its reader, to start from.
+        incremental: Instead of cloning *clone_from*, update it: its objects
+            keep their numbers and are only loaded when used, and
+            :meth:`write` appends the objects added or changed to a copy of
+            the original file, or to the original file itself when written
+            to its path.
     """
 
     # for commonality
@@ -170,6 +207,7 @@ class PdfWriter(PdfDocCommon):
         self,
         fileobj: StrByteType = "",
         clone_from: Union[None, PdfReader, StrByteType, Path] = None,
+        incremental: bool = False,
     ) -> None:
         self._header = b"%PDF-1.3"
         self._objects: List[PdfObject] = []
@@ -216,7 +254,10 @@ class PdfWriter(PdfDocCommon):
         if clone_from is not None:
             if not isinstance(clone_from, PdfReader):
                 clone_from = PdfReader(clone_from)
-            self.clone_document_from_reader(clone_from)
+            if not incremental:
+                self.clone_document_from_reader(clone_from)
+        elif incremental:
+            raise ValueError("An incremental update requires clone_from")
         self.fileobj = fileobj
         self.with_as_usage = False
 
@@ -224,6 +265,25 @@ class PdfWriter(PdfDocCommon):
         self._encrypt_entry: Optional[DictionaryObject] = None
         self._ID: Union[ArrayObject, None] = None
 
+        # state of a streamed output, see start_streaming()
+        self._output: Optional[StreamType] = None
+        self._output_target: Union[None, Path, StrByteType] = None
+        self._output_object_streams = False
+        self._output_header = ""
+        self._written: Dict[int, Tuple[int, int, int]] = {}
+        """The xref entries of the objects already written, by object number."""
+        self._output_compress_identical = False
+        self._written_digests: Dict[bytes, int] = {}
+        """The numbers of the objects already written, by hash value."""
+
+        # state of an incremental update, see _load_original_document()
+        self._original: Optional[PdfReader] = None
+        self._original_objects: Dict[int, Tuple[int, bytes]] = {}
+        """The generation and hash value of the objects loaded from the original."""
+        if incremental:
+            assert isinstance(clone_from, PdfReader)
+            self._load_original_document(clone_from)
+
     @property
     def root_object(self) -> DictionaryObject:
         """
@@ -350,10 +410,127 @@ class PdfWriter(PdfDocCommon):
         indirect_reference: Union[int, IndirectObject],
     ) -> PdfObject:
         if isinstance(indirect_reference, int):
-            return self._objects[indirect_reference - 1]
-        if indirect_reference.pdf != self:
+            idnum = indirect_reference
+        elif indirect_reference.pdf != self:
             raise ValueError("pdf must be self")
-        return self._objects[indirect_reference.idnum - 1]
+        else:
+            idnum = indirect_reference.idnum
+        obj = self._objects[idnum - 1]
+        if obj is None and self._original is not None:
+            return self._load_original_object(idnum)
+        return obj
+
+    def _load_original_document(self, reader: PdfReader) -> None:
+        """
+        Start an incremental update of the file read by *reader*.
+
+        The objects of the file keep their numbers. They are loaded from the
+        reader when they are used, except for the catalog and the pages, and
+        their hash value is recorded to find the ones changed when writing.
+        """
+        stream = reader.stream
+        stream.seek(0, os.SEEK_END)
+        self._original_length = stream.tell()
+        reader._find_eof_marker(stream)
+        self._original_startxref = reader._find_startxref_pos(stream)
+        if reader._get_xref_issues(stream, self._original_startxref) != 0:
+            raise PdfReadError(
+                "The cross-reference table is damaged: "
+                "the file cannot be updated incrementally"
+            )
+        stream.seek(self._original_startxref, 0)
+        x = stream.read(1)
+        if x in b"\r\n":
+            x = stream.read(1)
+        # the update uses the same kind of cross-reference section
+        self._original_xref_stream = x != b"x"
+        name = getattr(stream, "name", None)
+        self._original_path = name if isinstance(name, str) else None
+
+        self._original = reader
+        self._header = reader.pdf_header.encode()
+        self._objects = [None] * (cast(int, reader.trailer[TK.SIZE]) - 1)
+        self._idnum_hash.clear()
+        trailer = reader.trailer
+        self._root = self._copy_original(trailer.raw_get(TK.ROOT))
+        self._root_object = cast(DictionaryObject, self._root.get_object())
+        self._pages = self._root_object.raw_get(CO.PAGES)
+        if TK.INFO in trailer:
+            self._info_obj = self._copy_original(trailer.raw_get(TK.INFO))
+        else:
+            self._info_obj = self._add_object(DictionaryObject())
+        if TK.ID in trailer:
+            self._ID = self._copy_original(trailer[TK.ID])
+        if TK.ENCRYPT in trailer:
+            # the objects changed are encrypted as the original ones
+            self._encryption = reader._encryption
+            self._encrypt_entry = cast(
+                DictionaryObject,
+                self._copy_original(trailer.raw_get(TK.ENCRYPT)).get_object(),
+            )
+
+        # the pages are PageObject in the writer
+        self.flattened_pages = None
+        self._flatten()
+        assert self.flattened_pages is not None
+        for page in self.flattened_pages:
+            ref = page.indirect_reference
+            if ref is not None:
+                self._objects[ref.idnum - 1] = page
+                self._original_objects[ref.idnum] = (
+                    ref.generation,
+                    page._hash_digest(),
+                )
+
+    def _load_original_object(self, idnum: int) -> Optional[PdfObject]:
+        """Load an object of the file updated incrementally."""
+        reader = self._original
+        assert reader is not None
+        generation = 0
+        if idnum not in reader.xref_objStm:
+            for gen, offsets in reader.xref.items():
+                if idnum in offsets and not reader.xref_free_entry.get(
+                    gen, {}
+                ).get(idnum, False):
+                    generation = gen
+                    break
+        original = reader.get_object(IndirectObject(idnum, generation, reader))
+        if original is None or isinstance(original, NullObject):
+            # free or missing object
+            return original
+        obj = self._copy_original(original)
+        if obj is original:
+            obj = copy(original)
+        obj.indirect_reference = IndirectObject(idnum, generation, self)
+        self._objects[idnum - 1] = obj
+        self._original_objects[idnum] = (generation, obj._hash_digest())
+        return obj
+
+    def _copy_original(self, data: Any) -> Any:
+        """
+        Copy an object read from the file updated incrementally, without
+        loading the objects it refers to: the references are made to the
+        same numbers in this writer.
+        """
+        if data.__class__ is IndirectObject:
+            return IndirectObject(data.idnum, data.generation, self)
+        copied: DictionaryObject
+        if isinstance(data, StreamObject):
+            copied = (
+                EncodedStreamObject() if SA.FILTER in data else DecodedStreamObject()
+            )
+            # the data is not read if it is still in the file
+            copied._data = data._raw_data()
+        elif isinstance(data, dict):
+            copied = DictionaryObject()
+        elif isinstance(data, list):
+            return ArrayObject(self._copy_original(item) for item in data)
+        else:
+            return data
+        copied.update(
+            {key: self._copy_original(value) for key, value in dict.items(data)}
+        )
+        return copied
 
     def _replace_object(
         self,
@@ -364,7 +541,9 @@ class PdfWriter(PdfDocCommon):
             if indirect_reference.pdf != self:
                 raise ValueError("pdf must be self")
             indirect_reference = indirect_reference.idnum
-        gen = self._objects[indirect_reference - 1].indirect_reference.generation  # type: ignore
+        if indirect_reference in self._written:
+            raise PyPdfError(f"Object {indirect_reference} is already written")
+        gen = self.get_object(indirect_reference).indirect_reference.generation  # type: ignore
         if (
             getattr(obj, "indirect_reference", None) is not None
             and obj.indirect_reference.pdf != self  # type: ignore
@@ -465,7 +644,7 @@ class PdfWriter(PdfDocCommon):
         Returns:
             The added PageObject.
         """
-        return self._add_page(page, list.append, excluded_keys)
+        return self._add_page(page, lambda kids, p: kids.append(p), excluded_keys)
 
     def insert_page(
         self,
@@ -1088,7 +1267,7 @@ class PdfWriter(PdfDocCommon):
 
     def _compute_document_identifier(self) -> ByteStringObject:
         stream = BytesIO()
-        self._write_pdf_structure(stream)
+        self._write_pdf_structure(stream, self._number_reachable_objects())
         stream.seek(0)
         return ByteStringObject(_rolling_checksum(stream).encode("utf8"))
 
@@ -1144,6 +1323,10 @@ class PdfWriter(PdfDocCommon):
                 "AES-128", "AES-256-R5", "AES-256". If it is valid,
                 `use_128bit` will be ignored.
         """
+        if self._written:
+            raise PyPdfError("Cannot encrypt objects which are already written")
+        if self._original is not None:
+            raise PyPdfError("An incremental update cannot encrypt the file")
         if owner_password is None:
             owner_password = user_password
 
@@ -1170,7 +1353,15 @@ class PdfWriter(PdfDocCommon):
             self._add_object(entry)
         self._encrypt_entry = entry
 
-    def write_stream(self, stream: StreamType) -> None:
+    def write_stream(self, stream: StreamType, object_streams: bool = False) -> None:
+        if isinstance(stream, RawIOBase):
+            # each small write would be a system call
+            buffered = BufferedWriter(stream, WRITE_BUFFER_SIZE)
+            try:
+                self.write_stream(buffered, object_streams)
+            finally:
+                buffered.detach()
+            return
         if hasattr(stream, "mode") and "b" not in stream.mode:
             logger_warning(
                 f"File <{stream.name}> to write to is not in binary mode. "
@@ -1181,13 +1372,23 @@ class PdfWriter(PdfDocCommon):
         if not self._root:
             self._root = self._add_object(self._root_object)
 
+        if self._original is not None:
+            self._write_incremental_update(stream, True)
+            return
+
         self._sweep_indirect_references(self._root)
+        numbers = self._number_reachable_objects()
 
-        object_positions = self._write_pdf_structure(stream)
+        if object_streams:
+            self._write_compressed_pdf_structure(stream, numbers)
+            return
+        object_positions = self._write_pdf_structure(stream, numbers)
         xref_location = self._write_xref_table(stream, object_positions)
-        self._write_trailer(stream, xref_location)
+        self._write_trailer(stream, xref_location, numbers)
 
-    def write(self, stream: Union[Path, StrByteType]) -> Tuple[bool, IO[Any]]:
+    def write(
+        self, stream: Union[Path, StrByteType], object_streams: bool = False
+    ) -> Tuple[bool, IO[Any]]:
         """
         Write the collection of pages added to this object out as a PDF file.
 
@@ -1196,6 +1397,13 @@ class PdfWriter(PdfDocCommon):
                 the write method and the tell method, similar to a file object, or
                 be a file path, just like the fileobj, just named it stream to keep
                 existing workflow.
+            object_streams: Pack the objects which are not streams into
+                compressed object streams, and write a cross-reference stream
+                instead of a cross-reference table. This requires PDF 1.5:
+                the header is raised to ``%PDF-1.5`` if needed.
+                Ignored when the file is streamed, see :meth:`start_streaming`,
+                and for an incremental update, which uses the same kind of
+                cross-reference section as the original file.
 
         Returns:
             A tuple (bool, IO)
@@ -1205,66 +1413,791 @@ class PdfWriter(PdfDocCommon):
         if stream == "":
             raise ValueError(f"Output(stream={stream}) is empty.")
 
+        if self._output is not None:
+            return self._finish_streaming(stream)
+
+        if self._original is not None and self._is_original_file(stream):
+            # only the update is written, after the original bytes
+            with open(stream, "r+b") as f:  # type: ignore[arg-type]
+                if f.seek(0, os.SEEK_END) != self._original_length:
+                    raise PyPdfError(
+                        f"{stream} has changed since it was read: "
+                        "it cannot be updated incrementally"
+                    )
+                self._write_incremental_update(f, False)
+            return True, f
+
         if isinstance(stream, (str, Path)):
+            # the objects cloned from the file may still be slices of it
+            load_mapped_slices(stream)
             stream = FileIO(stream, "wb")
             self.with_as_usage = True  #
             my_file = True
 
-        self.write_stream(stream)
+        self.write_stream(stream, object_streams)
 
         if self.with_as_usage:
             stream.close()
 
         return my_file, stream
 
-    def _write_pdf_structure(self, stream: StreamType) -> List[int]:
-        object_positions = []
-        stream.write(self.pdf_header.encode() + b"\n")
+    def compress_identical_objects(self) -> None:
+        """
+        Keep a single copy of the objects having the same content.
+
+        Documents produced by the same application often carry identical
+        fonts, color profiles or images: the references to the copies are
+        made to point to the first of them and the copies are removed.
+        Objects referring to copies become identical themselves once the
+        references are updated, so the search is repeated until no copy is
+        left. Pages are never merged.
+
+        This is meant to be called just before :meth:`write`: objects merged
+        now would be modified together afterwards. When the file is streamed,
+        pass ``compress_identical_objects=True`` to :meth:`start_streaming`
+        instead.
+
+        Raises:
+            PyPdfError: The PDF file is being streamed.
+        """
+        if self._output is not None:
+            raise PyPdfError(
+                "The PDF file is being streamed: "
+                "use start_streaming(compress_identical_objects=True)"
+            )
+        if not self._root:
+            self._root = self._add_object(self._root_object)
+        self._sweep_indirect_references(self._root)
+        trailer_objects = self._get_trailer_objects()
+        self._merge_identical_objects(
+            [
+                idnum
+                for idnum, obj in enumerate(self._objects, 1)
+                if obj is not None and idnum not in trailer_objects
+            ],
+            {},
+        )
+
+    def compress_streams(self, level: int = -1, workers: Optional[int] = None) -> None:
+        """
+        Apply a FlateDecode filter to the streams which have no filter yet.
+
+        Content streams built by :meth:`PageObject.merge_page` or
+        :meth:`PageObject.add_transformation` for instance are otherwise
+        written uncompressed. As zlib releases the GIL, the streams are
+        compressed by a pool of threads. A stream is left as is if compressing
+        it does not make it smaller, as are the XMP metadata streams which
+        PDF/A requires to be readable without filter.
+
+        This is meant to be called just before :meth:`write`.
+
+        Args:
+            level: The compression level, from 0 to 9, or -1 for the default
+                level of zlib.
+            workers: The number of threads, the number of processors by
+                default.
+
+        Raises:
+            PyPdfError: The PDF file is being streamed.
+        """
+        if self._output is not None:
+            raise PyPdfError(
+                "The PDF file is being streamed: its streams cannot be compressed"
+            )
+        if not self._root:
+            self._root = self._add_object(self._root_object)
+        self._sweep_indirect_references(self._root)
+
+        streams: List[Tuple[int, StreamObject]] = [
+            (i, obj)
+            for i, obj in enumerate(self._objects)
+            if isinstance(obj, StreamObject)
+            and SA.FILTER not in obj
+            and obj.get("/Type") != "/Metadata"
+        ]
+        # the data of a content stream may have to be rebuilt from its
+        # operations, which is better done before starting the threads
+        data = [b_(obj.get_data()) for _, obj in streams]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(data) > 1:
+            with ThreadPoolExecutor(workers) as executor:
+                compressed = list(
+                    executor.map(FlateDecode.encode, data, [level] * len(data))
+                )
+        else:
+            compressed = [FlateDecode.encode(d, level) for d in data]
+
+        for (i, obj), raw, encoded_data in zip(streams, data, compressed):
+            if len(encoded_data) >= len(raw):
+                continue
+            encoded = EncodedStreamObject()
+            encoded.update(obj)
+            encoded[NameObject(SA.FILTER)] = NameObject(FT.FLATE_DECODE)
+            encoded._data = encoded_data
+            encoded.indirect_reference = IndirectObject(i + 1, 0, self)
+            self._objects[i] = encoded
+
+    def start_streaming(
+        self,
+        stream: Union[Path, StrByteType],
+        object_streams: bool = False,
+        compress_identical_objects: bool = False,
+    ) -> None:
+        """
+        Start writing the PDF file, writing the objects as soon as they are
+        finished instead of keeping them in memory until :meth:`write`.
+
+        The finished objects are written by :meth:`flush`, which is called at
+        the end of each :meth:`merge` and :meth:`append`. They are the objects
+        which cannot be reached from the catalog without going through a page:
+        the contents, resources and annotations of the pages. Once written,
+        they are released and must not be modified anymore. The pages and
+        the document-level objects (outline, named destinations, form...)
+        are kept until :meth:`write` is called with the same *stream* to
+        complete the file.
+
+        Args:
+            stream: An object to write the file to, supporting the write and
+                the tell methods, or a file path.
+            object_streams: Pack the objects which are not streams into
+                compressed object streams, as :meth:`write` does.
+            compress_identical_objects: Write a single copy of the objects
+                having the same content, as
+                :meth:`compress_identical_objects` does. Each object is
+                compared with the objects written before it.
+        """
+        if self._output is not None:
+            raise PyPdfError("The PDF file is already being written")
+        if self._original is not None:
+            raise PyPdfError("An incremental update cannot be streamed")
+        self._output_target = stream
+        if isinstance(stream, (str, Path)):
+            load_mapped_slices(stream)
+            stream = BufferedWriter(FileIO(stream, "wb"), WRITE_BUFFER_SIZE)
+        self._output = stream
+        self._output_object_streams = object_streams
+        self._output_compress_identical = compress_identical_objects
+        self._output_header = self._get_output_header(object_streams)
+        self._write_header(stream, self._output_header)
+
+    def flush(self) -> None:
+        """
+        Write the objects which are finished, when the PDF file is streamed.
+
+        See :meth:`start_streaming`. Does nothing otherwise.
+        """
+        if self._output is None:
+            return
+        self._write_pending_objects(self._get_retained_objects())
+
+    def _finish_streaming(
+        self, stream: Union[Path, StrByteType]
+    ) -> Tuple[bool, IO[Any]]:
+        target = self._output_target
+        if stream is not target and not (
+            isinstance(stream, (str, Path))
+            and isinstance(target, (str, Path))
+            and Path(stream) == Path(target)
+        ):
+            raise ValueError("The PDF file is being streamed to another output")
+        output = cast(IO[Any], self._output)
+
+        if not self._root:
+            self._root = self._add_object(self._root_object)
+        self._sweep_indirect_references(self._root)
+        self._write_pending_objects(set())
+
+        # the version may have been raised by the documents merged since
+        header = self._get_output_header(self._output_object_streams)
+        if (
+            header != self._output_header
+            and len(header) == len(self._output_header)
+            and output.seekable()
+        ):
+            end = output.tell()
+            output.seek(0)
+            output.write(header.encode())
+            output.seek(end)
+
+        if self._output_object_streams:
+            self._write_xref_stream(
+                output, self._written, len(self._objects) + 1, None
+            )
+        else:
+            object_positions = [
+                self._written[idnum][1] if idnum in self._written else None
+                for idnum in range(1, len(self._objects) + 1)
+            ]
+            xref_location = self._write_xref_table(output, object_positions)
+            self._write_trailer(output, xref_location, None)
+
+        my_file = isinstance(target, (str, Path))
+        if my_file or self.with_as_usage:
+            output.close()
+        self._output = None
+        self._output_target = None
+        return my_file, output
+
+    def _get_retained_objects(self) -> Set[int]:
+        """
+        Get the objects kept in memory while the PDF file is streamed.
+
+        Returns:
+            The numbers of the objects reachable from the catalog and from
+            the information dictionary without going through a page, the pages
+            included.
+        """
+        retained: Set[int] = set()
+        stack: List[PdfObject] = [self._root, self._info_obj]
+        if self._encrypt_entry is not None:
+            stack.append(self._encrypt_entry)
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, IndirectObject):
+                if (
+                    obj.pdf is not self
+                    or obj.idnum in retained
+                    or obj.idnum in self._written
+                ):
+                    continue
+                retained.add(obj.idnum)
+                obj = self._objects[obj.idnum - 1]
+                if isinstance(obj, DictionaryObject) and obj.get(PA.TYPE) == CO.PAGE:
+                    continue
+            if isinstance(obj, DictionaryObject):
+                stack.extend(obj.values())
+            elif isinstance(obj, ArrayObject):
+                stack.extend(obj)
+        return retained
+
+    def _write_pending_objects(self, retained: Set[int]) -> None:
+        """
+        Write the objects not written yet to the streamed PDF file, except
+        the *retained* ones, and replace them by placeholders.
+        """
+        output = cast(StreamType, self._output)
+        pending = []
+        idnum = 0
+        # sweeping an object may add the objects it refers to
+        while idnum < len(self._objects):
+            idnum += 1
+            obj = self._objects[idnum - 1]
+            if obj is None or idnum in self._written or idnum in retained:
+                continue
+            self._sweep_indirect_references(obj)
+            pending.append(idnum)
+
+        if self._output_compress_identical:
+            trailer_objects = self._get_trailer_objects()
+            self._written_digests = self._merge_identical_objects(
+                [idnum for idnum in pending if idnum not in trailer_objects],
+                self._written_digests,
+            )
+            pending = [
+                idnum for idnum in pending if self._objects[idnum - 1] is not None
+            ]
+
+        packed = []
+        for idnum in pending:
+            obj = self._objects[idnum - 1]
+            if not self._output_object_streams or not self._can_pack(obj):
+                offset = self._write_indirect_object(output, idnum, obj)
+                self._written[idnum] = (1, offset, 0)
+            else:
+                packed.append((idnum, obj))
+        for start in range(0, len(packed), OBJECT_STREAM_SIZE):
+            objstm_idnum = len(self._objects) + 1
+            self._objects.append(NullObject())
+            pending.append(objstm_idnum)
+            self._write_object_stream(
+                output,
+                objstm_idnum,
+                packed[start : start + OBJECT_STREAM_SIZE],
+                self._written,
+            )
+
+        for idnum in pending:
+            placeholder = NullObject()
+            placeholder.indirect_reference = IndirectObject(idnum, 0, self)
+            self._objects[idnum - 1] = placeholder
+
+    def _get_trailer_objects(self) -> Set[int]:
+        """Get the numbers of the objects referred to by the trailer."""
+        trailer_objects = {self._root.idnum}
+        if isinstance(self._info_obj, IndirectObject):
+            trailer_objects.add(self._info_obj.idnum)
+        if self._encrypt_entry is not None:
+            assert self._encrypt_entry.indirect_reference is not None
+            trailer_objects.add(self._encrypt_entry.indirect_reference.idnum)
+        return trailer_objects
+
+    def _merge_identical_objects(
+        self, candidates: List[int], kept: Dict[bytes, int]
+    ) -> Dict[bytes, int]:
+        """
+        Remove the objects having the same hash value as another one, and
+        make the references to them point to the one kept.
+
+        Args:
+            candidates: The numbers of the objects which may be removed. The
+                first of identical objects is kept.
+            kept: The numbers of objects which cannot be removed, but which
+                the candidates are compared with, by hash value.
+
+        Returns:
+            *kept* updated with the candidates left.
+        """
+        referrers = self._get_referrers(set(candidates))
+        while True:
+            digests = dict(kept)
+            replaced: Dict[int, int] = {}
+            for idnum in candidates:
+                first = digests.setdefault(
+                    self._objects[idnum - 1].hash_value(), idnum
+                )
+                if first != idnum:
+                    replaced[idnum] = first
+            if not replaced:
+                return digests
+            for idnum, first in replaced.items():
+                self._objects[idnum - 1] = None  # type: ignore[call-overload]
+                ref = IndirectObject(first, 0, self)
+                moved = referrers.pop(idnum, [])
+                for data, key in moved:
+                    data[key] = ref
+                # the object kept may be found identical to another one later
+                referrers.setdefault(first, []).extend(moved)
+            candidates = [idnum for idnum in candidates if idnum not in replaced]
+
+            # the objects cloned since, or resolved by hash value, are the
+            # ones kept
+            for translated in self._id_translated.values():
+                for key, idnum in translated.items():
+                    if isinstance(idnum, int) and idnum in replaced:
+                        translated[key] = replaced[idnum]
+            for digest, ref in self._idnum_hash.items():
+                if ref.pdf is self and ref.idnum in replaced:
+                    self._idnum_hash[digest] = IndirectObject(
+                        replaced[ref.idnum], 0, self
+                    )
+
+    def _get_referrers(self, idnums: Set[int]) -> Dict[int, List[Tuple[Any, Any]]]:
+        """
+        Find the references to some objects of this writer.
+
+        Args:
+            idnums: The numbers of the objects referred to.
+
+        Returns:
+            The array or dictionary holding each reference, and its index or
+            key there, by number of the object referred to.
+        """
+        referrers: Dict[int, List[Tuple[Any, Any]]] = {}
+        for obj in self._objects:
+            stack: List[Any] = [obj]
+            while stack:
+                data = stack.pop()
+                # the builtin types are much faster to check than PdfObject
+                if isinstance(data, dict):
+                    items: Iterable[Tuple[Any, Any]] = dict.items(data)
+                elif isinstance(data, list):
+                    items = enumerate(data)
+                else:
+                    continue
+                for key, value in items:
+                    if value.__class__ is not IndirectObject:
+                        stack.append(value)
+                    elif value.pdf is self and value.idnum in idnums:
+                        referrers.setdefault(value.idnum, []).append((data, key))
+        return referrers
+
+    def _get_output_header(self, object_streams: bool) -> str:
+        if object_streams:
+            return _get_max_pdf_version_header(self.pdf_header, "%PDF-1.5")
+        return self.pdf_header
+
+    def _write_header(self, stream: StreamType, header: str) -> None:
+        stream.write(header.encode() + b"\n")
         stream.write(b"%\xE2\xE3\xCF\xD3\n")
 
-        for i, obj in enumerate(self._objects):
-            if obj is not None:
-                idnum = i + 1
-                object_positions.append(stream.tell())
-                stream.write(f"{idnum} 0 obj\n".encode())
-                if self._encryption and obj != self._encrypt_entry:
-                    obj = self._encryption.encrypt_object(obj, idnum, 0)
-                obj.write_to_stream(stream)
-                stream.write(b"\nendobj\n")
+    def _write_indirect_object(
+        self, stream: StreamType, idnum: int, obj: PdfObject, generation: int = 0
+    ) -> int:
+        """Write an indirect object and return its offset."""
+        offset = stream.tell()
+        stream.write(f"{idnum} {generation} obj\n".encode())
+        if self._encryption and obj is not self._encrypt_entry:
+            obj = self._encryption.encrypt_object(obj, idnum, generation)
+        obj.write_to_stream(stream)
+        stream.write(b"\nendobj\n")
+        return offset
+
+    def _number_reachable_objects(self) -> Dict[int, int]:
+        """
+        Number the objects which can be reached from the trailer, in their
+        order in the writer. The other ones, such as the contents replaced
+        or the pages removed, are not written.
+
+        Returns:
+            The object numbers in the output, by object number in the writer.
+        """
+        reachable: Set[int] = set()
+        stack: List[Any] = [self._get_trailer(0, None)]
+        while stack:
+            data = stack.pop()
+            if data.__class__ is IndirectObject:
+                idnum = data.idnum
+                if data.pdf is not self or idnum in reachable:
+                    continue
+                if not 0 < idnum <= len(self._objects):
+                    continue
+                data = self._objects[idnum - 1]
+                if data is None:
+                    continue
+                reachable.add(idnum)
+            # the builtin types are much faster to check than PdfObject
+            if isinstance(data, dict):
+                stack.extend(dict.values(data))
+            elif isinstance(data, list):
+                stack.extend(data)
+        return {idnum: number for number, idnum in enumerate(sorted(reachable), 1)}
+
+    def _renumber_references(self, data: Any, numbers: Dict[int, int]) -> Any:
+        """
+        Make the references of an object follow the numbers of the output.
+
+        Args:
+            data: The object.
+            numbers: The object numbers in the output, by object number in
+                the writer.
+
+        Returns:
+            *data*, or a copy of it if a reference changed. A reference to an
+            object which is not written is replaced by null.
+        """
+        if data.__class__ is IndirectObject:
+            if data.pdf is not self:
+                return data
+            idnum = numbers.get(data.idnum)
+            if idnum is None:
+                return NullObject()
+            if idnum == data.idnum:
+                return data
+            return IndirectObject(idnum, data.generation, self)
+        if isinstance(data, dict):
+            items: Iterable[Tuple[Any, Any]] = dict.items(data)
+        elif isinstance(data, list):
+            items = enumerate(data)
+        else:
+            return data
+        copied = None
+        for key, value in items:
+            new_value = self._renumber_references(value, numbers)
+            if new_value is not value:
+                if copied is None:
+                    copied = copy(data)
+                copied[key] = new_value
+        return data if copied is None else copied
+
+    def _write_pdf_structure(
+        self, stream: StreamType, numbers: Dict[int, int]
+    ) -> List[Optional[int]]:
+        object_positions: List[Optional[int]] = []
+        self._write_header(stream, self.pdf_header)
+
+        # objects are renumbered only if some are left out
+        renumber = len(numbers) < len(self._objects)
+        for idnum, number in numbers.items():
+            obj = self._objects[idnum - 1]
+            if renumber:
+                obj = self._renumber_references(obj, numbers)
+            object_positions.append(self._write_indirect_object(stream, number, obj))
         return object_positions
 
-    def _write_xref_table(self, stream: StreamType, object_positions: List[int]) -> int:
+    def _is_original_file(self, stream: Union[Path, StrByteType]) -> bool:
+        """Tell whether *stream* is the path of the file updated incrementally."""
+        return (
+            isinstance(stream, (str, Path))
+            and self._original_path is not None
+            and os.path.exists(stream)
+            and os.path.samefile(stream, self._original_path)
+        )
+
+    def _write_incremental_update(
+        self, stream: StreamType, copy_original: bool
+    ) -> None:
+        """
+        Write the objects added or changed since the original file was read,
+        with a cross-reference section and a trailer pointing to the original
+        ones with /Prev.
+
+        Args:
+            stream: The stream to write to.
+            copy_original: Whether the original file is copied first. If not,
+                *stream* is the original file, positioned at its end.
+        """
+        reader = self._original
+        assert reader is not None
+        if copy_original:
+            buf = stream_buffer(reader.stream)
+            if buf is None:
+                reader.stream.seek(0, 0)
+                for block in iter(lambda: reader.stream.read(1 << 20), b""):
+                    stream.write(block)
+            else:
+                with buf:
+                    stream.write(buf)
+        reader.stream.seek(-1, os.SEEK_END)
+        if reader.stream.read(1) not in (b"\n", b"\r"):
+            stream.write(b"\n")
+
+        self._sweep_indirect_references(self._root)
+        # the objects never loaded are unchanged: only the others are compared
+        entries: Dict[int, Tuple[int, int, int]] = {}
+        for idnum, obj in enumerate(self._objects, 1):
+            if obj is None:
+                continue
+            generation, digest = self._original_objects.get(idnum, (0, b""))
+            if obj._hash_digest() != digest:
+                entries[idnum] = (
+                    1,
+                    self._write_indirect_object(stream, idnum, obj, generation),
+                    generation,
+                )
+
+        if not entries:
+            return
+        if self._original_xref_stream:
+            self._write_xref_stream(
+                stream,
+                entries,
+                len(self._objects) + 1,
+                None,
+                self._original_startxref,
+            )
+            return
         xref_location = stream.tell()
-        stream.write(b"xref\n")
-        stream.write(f"0 {len(self._objects) + 1}\n".encode())
+        # many readers expect a table to start with object 0
+        stream.write(b"xref\n0 1\n")
         stream.write(f"{0:0>10} {65535:0>5} f \n".encode())
-        for offset in object_positions:
-            stream.write(f"{offset:0>10} {0:0>5} n \n".encode())
+        for start, count in _get_subsections(sorted(entries)):
+            stream.write(f"{start} {count}\n".encode())
+            for idnum in range(start, start + count):
+                _, offset, generation = entries[idnum]
+                stream.write(f"{offset:0>10} {generation:0>5} n \n".encode())
+        self._write_trailer(stream, xref_location, None, self._original_startxref)
+
+    def _write_xref_table(
+        self, stream: StreamType, object_positions: List[Optional[int]]
+    ) -> int:
+        """
+        Write the cross-reference table, *object_positions* giving the offset
+        of each object, or None for the removed ones.
+        """
+        xref_location = stream.tell()
+        # the free entries are linked, starting from the object 0
+        free = [
+            idnum
+            for idnum, offset in enumerate(object_positions, 1)
+            if offset is None
+        ]
+        next_free = dict(zip([0, *free], [*free, 0]))
+        rows = [
+            f"xref\n0 {len(object_positions) + 1}\n",
+            f"{next_free[0]:0>10} {65535:0>5} f \n",
+        ]
+        rows.extend(
+            f"{next_free[idnum]:0>10} {1:0>5} f \n"
+            if offset is None
+            else f"{offset:0>10} {0:0>5} n \n"
+            for idnum, offset in enumerate(object_positions, 1)
+        )
+        stream.write("".join(rows).encode())
         return xref_location
 
-    def _write_trailer(self, stream: StreamType, xref_location: int) -> None:
+    def _write_trailer(
+        self,
+        stream: StreamType,
+        xref_location: int,
+        numbers: Optional[Dict[int, int]],
+        prev: Optional[int] = None,
+    ) -> None:
         """
         Write the PDF trailer to the stream.
 
         To quote the PDF specification:
             [The] trailer [gives] the location of the cross-reference table and
             of certain special objects within the body of the file.
+
+        Args:
+            stream: The stream to write to.
+            xref_location: The offset of the cross-reference table.
+            numbers: The object numbers in the output, by object number in the
+                writer, or None if all the objects are written unchanged.
+            prev: The offset of the previous cross-reference section, for an
+                incremental update.
         """
         stream.write(b"trailer\n")
+        size = len(self._objects) if numbers is None else len(numbers)
+        trailer = self._get_trailer(size + 1, numbers, prev)
+        trailer.write_to_stream(stream)
+        stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
+
+    def _get_trailer(
+        self,
+        size: int,
+        numbers: Optional[Dict[int, int]],
+        prev: Optional[int] = None,
+    ) -> DictionaryObject:
         trailer = DictionaryObject()
         trailer.update(
             {
-                NameObject(TK.SIZE): NumberObject(len(self._objects) + 1),
+                NameObject(TK.SIZE): NumberObject(size),
                 NameObject(TK.ROOT): self._root,
                 NameObject(TK.INFO): self._info_obj,
             }
         )
+        if prev is not None:
+            trailer[NameObject(TK.PREV)] = NumberObject(prev)
         if self._ID:
             trailer[NameObject(TK.ID)] = self._ID
         if self._encrypt_entry:
             trailer[NameObject(TK.ENCRYPT)] = self._encrypt_entry.indirect_reference
-        trailer.write_to_stream(stream)
-        stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
+        if numbers is not None and len(numbers) < len(self._objects):
+            trailer = self._renumber_references(trailer, numbers)
+        return trailer
+
+    def _can_pack(self, obj: PdfObject) -> bool:
+        # streams cannot be compressed in object streams, nor can the
+        # encryption dictionary
+        return not isinstance(obj, StreamObject) and obj is not self._encrypt_entry
+
+    def _write_compressed_pdf_structure(
+        self, stream: StreamType, numbers: Dict[int, int]
+    ) -> None:
+        """
+        Write the objects, packing those which are not streams into object
+        streams, followed by a cross-reference stream.
+
+        The object streams and the cross-reference stream are numbered after
+        the objects written, numbered by *numbers*.
+        """
+        self._write_header(stream, self._get_output_header(True))
+
+        # xref entries by object number, as (type, field 2, field 3)
+        entries: Dict[int, Tuple[int, int, int]] = {}
+        packed: List[Tuple[int, PdfObject]] = []
+        # objects are renumbered only if some are left out
+        renumber = len(numbers) < len(self._objects)
+        for idnum, number in numbers.items():
+            obj = self._objects[idnum - 1]
+            if not self._can_pack(obj):
+                if renumber:
+                    obj = self._renumber_references(obj, numbers)
+                entries[number] = (
+                    1,
+                    self._write_indirect_object(stream, number, obj),
+                    0,
+                )
+            elif renumber:
+                packed.append((number, self._renumber_references(obj, numbers)))
+            else:
+                packed.append((number, obj))
+
+        size = len(numbers) + 1
+        for start in range(0, len(packed), OBJECT_STREAM_SIZE):
+            self._write_object_stream(
+                stream, size, packed[start : start + OBJECT_STREAM_SIZE], entries
+            )
+            size += 1
+        self._write_xref_stream(stream, entries, size, numbers)
+
+    def _write_object_stream(
+        self,
+        stream: StreamType,
+        objstm_idnum: int,
+        objects: List[Tuple[int, PdfObject]],
+        entries: Dict[int, Tuple[int, int, int]],
+    ) -> None:
+        """
+        Write *objects* packed in a compressed object stream and record their
+        xref entries, along with the one of the object stream.
+        """
+        offsets = []
+        body = BytesIO()
+        for index, (idnum, obj) in enumerate(objects):
+            entries[idnum] = (2, objstm_idnum, index)
+            offsets.append(f"{idnum} {body.tell()}")
+            # the strings of the objects are encrypted with the object
+            # stream, not on their own
+            obj.write_to_stream(body)
+            body.write(b"\n")
+        head = (" ".join(offsets) + "\n").encode()
+        objstm = DecodedStreamObject()
+        objstm.set_data(head + body.getvalue())
+        objstm[NameObject("/Type")] = NameObject("/ObjStm")
+        objstm[NameObject("/N")] = NumberObject(len(offsets))
+        objstm[NameObject("/First")] = NumberObject(len(head))
+        entries[objstm_idnum] = (
+            1,
+            self._write_indirect_object(stream, objstm_idnum, objstm.flate_encode()),
+            0,
+        )
+
+    def _write_xref_stream(
+        self,
+        stream: StreamType,
+        entries: Dict[int, Tuple[int, int, int]],
+        xref_idnum: int,
+        numbers: Optional[Dict[int, int]],
+        prev: Optional[int] = None,
+    ) -> None:
+        """
+        Write the cross-reference stream, numbered *xref_idnum*, and the end
+        of the file.
+
+        The objects missing from *entries* are recorded as free. *numbers*
+        gives the object numbers in the output, by object number in the
+        writer, or is None if all the objects are written unchanged.
+
+        For an incremental update, *prev* is the offset of the previous
+        cross-reference section, and only the objects of *entries* are listed.
+        """
+        # the cross-reference stream is never encrypted
+        xref_location = stream.tell()
+        entries = {**entries, xref_idnum: (1, xref_location, 0)}
+        field2_size = (max(xref_location, xref_idnum).bit_length() + 7) // 8
+        widths = (1, max(1, field2_size), 2)
+        if prev is None:
+            rows = [(0, 0, 65535)]
+            rows.extend(
+                entries.get(idnum, (0, 0, 0)) for idnum in range(1, xref_idnum + 1)
+            )
+        else:
+            rows = [entries[idnum] for idnum in sorted(entries)]
+        data = b"".join(
+            t.to_bytes(1, "big")
+            + field2.to_bytes(widths[1], "big")
+            + field3.to_bytes(2, "big")
+            for t, field2, field3 in rows
+        )
+        xref_stream = DecodedStreamObject()
+        xref_stream.set_data(data)
+        xref_stream.update(self._get_trailer(xref_idnum + 1, numbers, prev))
+        xref_stream[NameObject("/Type")] = NameObject("/XRef")
+        xref_stream[NameObject("/W")] = ArrayObject(
+            [NumberObject(w) for w in widths]
+        )
+        if prev is not None:
+            xref_stream[NameObject("/Index")] = ArrayObject(
+                NumberObject(n)
+                for subsection in _get_subsections(sorted(entries))
+                for n in subsection
+            )
+        stream.write(f"{xref_idnum} 0 obj\n".encode())
+        xref_stream.flate_encode().write_to_stream(stream)
+        stream.write(f"\nendobj\nstartxref\n{xref_location}\n%%EOF\n".encode())
 
     def add_metadata(self, infos: Dict[str, Any]) -> None:
         """
@@ -1314,42 +2247,48 @@ class PdfWriter(PdfDocCommon):
         Args:
             root: The root of the PDF object tree to sweep.
         """
+        # entries: (data, parent, key in parent, top-level object holding it)
         stack: Deque[
             Tuple[
                 Any,
                 Optional[Any],
                 Any,
-                List[PdfObject],
+                Any,
             ]
         ] = collections.deque()
-        discovered = []
-        parent = None
-        grant_parents: List[PdfObject] = []
-        key_or_id = None
+        # numbers of the objects already swept
+        discovered: Set[int] = set()
+        # references of the other documents already resolved by the sweep:
+        # objects shared by many pages (e.g. their parent) are hashed once
+        resolved: Dict[Tuple[int, int, int], IndirectObject] = {}
+        # number of stack entries left to process under each top-level object
+        pending: Dict[int, int] = {id(root): 1}
+        # top-level objects changed by the sweep, with their reference in
+        # _idnum_hash: the hash is updated once they are completely swept
+        changed: Dict[int, Optional[IndirectObject]] = {}
 
         # Start from root
-        stack.append((root, parent, key_or_id, grant_parents))
+        stack.append((root, None, None, root))
 
         while len(stack):
-            data, parent, key_or_id, grant_parents = stack.pop()
+            data, parent, key_or_id, top = stack.pop()
 
             # Build stack for a processing depth-first
             if isinstance(data, (ArrayObject, DictionaryObject)):
                 for key, value in data.items():
-                    stack.append(
-                        (
-                            value,
-                            data,
-                            key,
-                            grant_parents + [parent] if parent is not None else [],
-                        )
-                    )
+                    stack.append((value, data, key, top))
+                pending[id(top)] += len(data)
             elif isinstance(data, IndirectObject) and data.pdf != self:
-                data = self._resolve_indirect_object(data)
+                foreign = (id(data.pdf), data.idnum, data.generation)
+                if foreign not in resolved:
+                    resolved[foreign] = self._resolve_indirect_object(data)
+                data = resolved[foreign]
 
-                if str(data) not in discovered:
-                    discovered.append(str(data))
-                    stack.append((data.get_object(), None, None, []))
+                if data.idnum not in discovered:
+                    discovered.add(data.idnum)
+                    obj = data.get_object()
+                    stack.append((obj, None, None, obj))
+                    pending[id(obj)] = pending.get(id(obj), 0) + 1
 
             # Check if data has a parent and if it is a dict or
             # an array update the value
@@ -1359,26 +2298,30 @@ class PdfWriter(PdfDocCommon):
                     # objects, so we need to change this value.
                     data = self._resolve_indirect_object(self._add_object(data))
 
-                update_hashes = []
-
-                # Data changed and thus the hash value changed
-                if parent[key_or_id] != data:
-                    update_hashes = [parent.hash_value()] + [
-                        grant_parent.hash_value() for grant_parent in grant_parents
-                    ]
+                if isinstance(parent, DictionaryObject):
+                    value = parent.raw_get(key_or_id)
+                else:
+                    value = parent[key_or_id]
+                if value is not data and not (
+                    isinstance(value, IndirectObject) and value == data
+                ):
+                    # Data changed and thus the hash value changed
+                    if id(top) not in changed:
+                        changed[id(top)] = self._idnum_hash.pop(top.hash_value(), None)
                     parent[key_or_id] = data
 
+            pending[id(top)] -= 1
+            if pending[id(top)] == 0:
+                del pending[id(top)]
                 # Update old hash value to new hash value
-                for old_hash in update_hashes:
-                    indirect_reference = self._idnum_hash.pop(old_hash, None)
-
-                    if indirect_reference is not None:
-                        indirect_reference_obj = indirect_reference.get_object()
+                indirect_reference = changed.pop(id(top), None)
+                if indirect_reference is not None:
+                    indirect_reference_obj = indirect_reference.get_object()
 
-                        if indirect_reference_obj is not None:
-                            self._idnum_hash[
-                                indirect_reference_obj.hash_value()
-                            ] = indirect_reference
+                    if indirect_reference_obj is not None:
+                        self._idnum_hash[
+                            indirect_reference_obj.hash_value()
+                        ] = indirect_reference
 
     def _resolve_indirect_object(self, data: IndirectObject) -> IndirectObject:
         """
@@ -2205,18 +3148,21 @@ class PdfWriter(PdfDocCommon):
 
     def _create_stream(
         self, fileobj: Union[Path, StrByteType, PdfReader]
-    ) -> Tuple[IOBase, Optional[Encryption]]:
+    ) -> Tuple[Union[IOBase, MemoryMappedStream], Optional[Encryption]]:
         # If the fileobj parameter is a string, assume it is a path
-        # and create a file object at that location. If it is a file,
+        # and map the file at that location into memory. If it is a file,
         # copy the file's contents into a BytesIO stream object; if
         # it is a PdfReader, copy that reader's stream into a
         # BytesIO stream.
         # If fileobj is none of the above types, it is not modified
         encryption_obj = None
-        stream: IOBase
+        stream: Union[IOBase, MemoryMappedStream]
         if isinstance(fileobj, (str, Path)):
-            with FileIO(fileobj, "rb") as f:
-                stream = BytesIO(f.read())
+            if os.path.getsize(fileobj) > 0:
+                stream = MemoryMappedStream(fileobj)
+            else:
+                with FileIO(fileobj, "rb") as f:
+                    stream = BytesIO(f.read())
         elif isinstance(fileobj, PdfReader):
             if fileobj._encryption:
                 encryption_obj = fileobj._encryption
@@ -2486,6 +3432,14 @@ class PdfWriter(PdfDocCommon):
         if "/B" not in excluded_fields:
             self.add_filtered_articles("", srcpages, reader)
 
+        if self._output is not None:
+            for pag in srcpages.values():
+                # do not keep the source pages alive
+                del pag.original_page
+            if reader is not fileobj:
+                self.reset_translation(reader)
+            self.flush()
+
     def _add_articles_thread(
         self,
         thread: DictionaryObject,  # thread entry from the reader's array of threads
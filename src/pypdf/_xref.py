@@ -0,0 +1,190 @@
+"""
+Compact storage for the cross-reference data of a PdfReader.
+
+A document with hundreds of thousands of objects would otherwise keep one
+dictionary entry, with a boxed integer key and value, per object. Here the
+entries are kept in arrays indexed by object number, which are exposed
+through the mapping API the reader has always used (``xref[gen][num]``,
+``num in xref_objStm``, ...).
+
+Object numbers far beyond the ones already stored, and values which do not
+fit the arrays, are kept in a regular dictionary, so that a damaged file
+cannot trigger huge allocations.
+"""
+
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterator, List, MutableMapping, Tuple
+
+# the arrays are grown sequentially: an object number may be at most that far
+# beyond the current size to be stored in them
+_MAX_GAP = 1 << 16
+
+
+class _XrefArrays(MutableMapping[int, Any]):
+    """Mapping of object numbers to records stored in parallel arrays."""
+
+    typecodes: Tuple[str, ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._arrays: List["array[int]"] = [array(t) for t in self.typecodes]
+        self._present = bytearray()
+        self._count = 0
+        self._sparse: Dict[Any, Any] = {}
+        self.update(*args, **kwargs)
+
+    def _get(self, num: int) -> Any:
+        return self._arrays[0][num]
+
+    def _set(self, num: int, value: Any) -> None:
+        self._arrays[0][num] = value
+
+    def _grow(self, size: int) -> None:
+        size = max(size, 2 * len(self._present))
+        missing = size - len(self._present)
+        for a in self._arrays:
+            a.frombytes(bytes(missing * a.itemsize))
+        self._present.extend(bytes(missing))
+
+    def _is_present(self, num: Any) -> bool:
+        try:
+            return num >= 0 and self._present[num] != 0
+        except (IndexError, TypeError):
+            return False
+
+    def __getitem__(self, num: int) -> Any:
+        if self._is_present(num):
+            return self._get(num)
+        return self._sparse[num]
+
+    def __contains__(self, num: object) -> bool:
+        return self._is_present(num) or num in self._sparse
+
+    def __setitem__(self, num: int, value: Any) -> None:
+        if (
+            num not in self._sparse
+            and isinstance(num, int)
+            and 0 <= num <= len(self._present) + _MAX_GAP
+        ):
+            if num >= len(self._present):
+                self._grow(num + 1)
+            try:
+                self._set(num, value)
+            except (OverflowError, TypeError):
+                pass
+            else:
+                if not self._present[num]:
+                    self._present[num] = 1
+                    self._count += 1
+                return
+            if self._present[num]:
+                self._present[num] = 0
+                self._count -= 1
+        self._sparse[num] = value
+
+    def __delitem__(self, num: int) -> None:
+        if self._is_present(num):
+            self._present[num] = 0
+            self._count -= 1
+        else:
+            del self._sparse[num]
+
+    def is_vacant(self, start: int, end: int) -> bool:
+        """Tell whether no object numbered from ``start`` to ``end - 1`` is stored."""
+        return self._present.find(1, start, end) == -1 and not any(
+            start <= num < end for num in self._sparse if isinstance(num, int)
+        )
+
+    def load(self, start: int, columns: List["array[int]"], mask: bytes) -> bool:
+        """
+        Store the records of a range of objects at once.
+
+        Object ``start + i`` gets the i-th value of each column when ``mask[i]``
+        is 1. Unless all the bits of the mask are set, the range must have been
+        checked with :meth:`is_vacant`.
+
+        Returns:
+            False, without storing anything, when the range is not suitable
+            for the arrays (e.g. too far beyond the objects stored so far).
+        """
+        end = start + len(mask)
+        if start < 0 or start > len(self._present) + _MAX_GAP:
+            return False
+        if any(start <= num < end for num in self._sparse if isinstance(num, int)):
+            return False
+        if end > len(self._present):
+            self._grow(end)
+        for a, column in zip(self._arrays, columns):
+            a[start:end] = column
+        self._count += mask.count(1) - self._present.count(1, start, end)
+        self._present[start:end] = mask
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        yield from compress(range(len(self._present)), self._present)
+        yield from list(self._sparse)
+
+    def __len__(self) -> int:
+        return self._count + len(self._sparse)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+
+class XrefOffsets(_XrefArrays):
+    """Byte offsets of the objects of one generation, by object number."""
+
+    typecodes = ("q",)
+
+
+class XrefFlags(_XrefArrays):
+    """Boolean flags (e.g. free entries) of one generation, by object number."""
+
+    typecodes = ("b",)
+
+    def _get(self, num: int) -> bool:
+        return bool(self._arrays[0][num])
+
+    def _set(self, num: int, value: Any) -> None:
+        self._arrays[0][num] = bool(value)
+
+
+class XrefObjectStreams(_XrefArrays):
+    """Object stream number and index of the compressed objects."""
+
+    typecodes = ("q", "q")
+
+    def _get(self, num: int) -> Tuple[int, int]:
+        return self._arrays[0][num], self._arrays[1][num]
+
+    def _set(self, num: int, value: Any) -> None:
+        stmnum, idx = value
+        # check both before storing anything
+        array("q", (stmnum, idx))
+        self._arrays[0][num] = stmnum
+        self._arrays[1][num] = idx
+
+
+def new_xref_generation(generation: int) -> MutableMapping[int, Any]:
+    """
+    Return an empty table for the offsets of the objects of ``generation``.
+
+    Nearly all objects are of generation 0: other generations are sparse and
+    kept in plain dictionaries.
+    """
+    if generation == 0:
+        return XrefOffsets()
+    return {}
+
+
+def new_free_entry_generation(generation: int) -> MutableMapping[int, Any]:
+    """
+    Return an empty table for the free flags of the objects of ``generation``.
+
+    Besides generation 0, the flags of generation 65535 are dense, as they are
+    recorded for every entry of the cross-reference tables.
+    """
+    if generation in (0, 65535):
+        return XrefFlags()
+    return {}
+
@@ -37,15 +37,26 @@ __author_email__ = "biziqe@mathieu.fenniak.net"
 import math
 import struct
 import zlib
+from functools import lru_cache
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from itertools import groupby
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._utils import (
     b_,
     deprecate_with_replacement,
     deprecation_no_replacement,
     logger_warning,
-    ord_,
 )
 from .constants import CcittFaxDecodeParameters as CCITT
 from .constants import ColorSpaces
@@ -62,6 +73,11 @@ from .generic import (
     NullObject,
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 
 def decompress(data: bytes) -> bytes:
     """
@@ -69,7 +85,8 @@ def decompress(data: bytes) -> bytes:
 
     This function attempts to decompress the input data using zlib. If the
     decompression fails due to a zlib error, it falls back to using a
-    decompression object with a larger window size.
+    decompression object with a larger window size, which returns whatever
+    could be decompressed before the point of failure.
 
     Args:
         data: The input data to be decompressed.
@@ -80,14 +97,185 @@ def decompress(data: bytes) -> bytes:
     try:
         return zlib.decompress(data)
     except zlib.error:
-        d = zlib.decompressobj(zlib.MAX_WBITS | 32)
-        result_str = b""
-        for b in [data[i : i + 1] for i in range(len(data))]:
+        return _decompress_damaged(data)
+
+
+# size of the chunks fed to the decompression object of damaged data
+RECOVERY_CHUNK_SIZE = 1 << 16
+
+
+def _decompress_damaged(data: bytes) -> bytes:
+    view = memoryview(data)
+    chunks = (
+        view[pos : pos + RECOVERY_CHUNK_SIZE]
+        for pos in range(0, len(view), RECOVERY_CHUNK_SIZE)
+    )
+    return b"".join(_iter_decompress(chunks))
+
+
+def _iter_decompress(
+    chunks: Iterable[Union[bytes, memoryview]], max_length: int = 0
+) -> Iterator[bytes]:
+    # the chunks are fed to a decompression object, keeping a copy of it before
+    # each of them: when a chunk fails, its halves are fed from that copy, down
+    # to the byte where decompression fails, and nothing is returned beyond it
+    d = zlib.decompressobj(zlib.MAX_WBITS | 32)
+    for chunk in chunks:
+        pending = memoryview(chunk)
+        size = len(pending)
+        while pending:
+            saved = d.copy()
             try:
-                result_str += d.decompress(b)
+                output = d.decompress(pending[:size], max_length)
             except zlib.error:
-                pass
-        return result_str
+                if size == 1:
+                    return
+                d = saved
+                size //= 2
+                continue
+            # with max_length, the input may be consumed partly
+            pending = pending[size - len(d.unconsumed_tail) :]
+            size = min(size, len(pending))
+            if output:
+                yield output
+    output = d.flush()
+    if output:
+        yield output
+
+
+def _iter_slices(data: bytes, size: int) -> Iterator[bytes]:
+    for pos in range(0, len(data), size):
+        yield data[pos : pos + size]
+
+
+@lru_cache(maxsize=8)
+def _low_sample_bits(size: int, bits: int) -> int:
+    # mask of the low ``bits - 1`` bits of each sample of ``bits`` bits in an
+    # integer of ``size`` bits; built from whole bytes, as a repeated pattern
+    unit = bits * 8 // math.gcd(bits, 8)
+    pattern = sum((1 << (bits - 1)) - 1 << i for i in range(0, unit, bits))
+    count = -(-size // unit)
+    mask = int.from_bytes(pattern.to_bytes(unit // 8, "big") * count, "big")
+    return mask >> (count * unit - size)
+
+
+def _add_samples(x: int, y: int, low: int) -> int:
+    # sample-wise addition of two integers, modulo the sample size: the bits
+    # in ``low`` are added without carrying over to the next sample, the high
+    # bit of each sample being set apart
+    return ((x & low) + (y & low)) ^ ((x ^ y) & ~low)
+
+
+def _sample_sums(x: int, size: int, stride: int, bits: int) -> int:
+    # adds to each sample of ``x`` the one ``stride`` bits before it (i.e.
+    # more significant), as decoded: all the samples are processed at once by
+    # adding ``x`` shifted by 1, 2, 4... strides
+    low = _low_sample_bits(size, bits)
+    shift = stride
+    while shift < size:
+        x = _add_samples(x, x >> shift, low)
+        shift *= 2
+    return x
+
+
+def _running_sums(data: bytes, stride: int) -> bytes:
+    # adds to each byte the one ``stride`` bytes before it, as decoded
+    size = len(data)
+    x = _sample_sums(int.from_bytes(data, "big"), 8 * size, 8 * stride, 8)
+    return x.to_bytes(size, "big")
+
+
+def _png_sub_row(row: bytes, prev: bytes, bpp: int) -> bytes:
+    return _running_sums(row, bpp)
+
+
+def _png_up_row(row: bytes, prev: bytes, bpp: int) -> bytes:
+    width = len(row)
+    x = int.from_bytes(row, "big")
+    y = int.from_bytes(prev, "big")
+    return _add_samples(x, y, _low_sample_bits(8 * width, 8)).to_bytes(width, "big")
+
+
+def _png_average_row(row: bytes, prev: bytes, bpp: int) -> bytes:
+    out = bytearray(row)
+    for i in range(bpp):
+        lane = []
+        left = 0
+        for x, up in zip(row[i::bpp], prev[i::bpp]):
+            left = (x + ((left + up) >> 1)) & 255
+            lane.append(left)
+        out[i::bpp] = bytes(lane)
+    return out
+
+
+def _png_paeth_row(row: bytes, prev: bytes, bpp: int) -> bytes:
+    out = bytearray(row)
+    for i in range(bpp):
+        lane = []
+        left = up_left = 0
+        for x, up in zip(row[i::bpp], prev[i::bpp]):
+            # distances of left + up - up_left to left, up and up_left
+            dist_left = abs(up - up_left)
+            dist_up = abs(left - up_left)
+            dist_up_left = abs(left + up - 2 * up_left)
+            if dist_left <= dist_up and dist_left <= dist_up_left:
+                left = (x + left) & 255
+            elif dist_up <= dist_up_left:
+                left = (x + up) & 255
+            else:
+                left = (x + up_left) & 255
+            up_left = up
+            lane.append(left)
+        out[i::bpp] = bytes(lane)
+    return out
+
+
+_PNG_ROW_DECODERS = {
+    1: _png_sub_row,
+    2: _png_up_row,
+    3: _png_average_row,
+    4: _png_paeth_row,
+}
+
+
+def _decode_png_prediction_numpy(
+    data: bytes, filters: bytes, rowlength: int, bpp: int
+) -> bytes:
+    width = rowlength - 1
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, rowlength)[:, 1:].copy()
+    kinds = np.frombuffer(filters, dtype=np.uint8)
+    # Sub rows do not depend on the previous row: decode them all at once
+    sub_rows = kinds == 1
+    if width % bpp == 0 and sub_rows.any():
+        pixels = rows[sub_rows].reshape(-1, width // bpp, bpp)
+        rows[sub_rows] = np.cumsum(pixels, axis=1, dtype=np.uint8).reshape(-1, width)
+        kinds = np.where(sub_rows, 0, kinds)
+    bounds = [0, *(np.flatnonzero(np.diff(kinds)) + 1).tolist(), len(kinds)]
+    for start, end in zip(bounds, bounds[1:]):
+        filter_byte = int(kinds[start])
+        if filter_byte == 2:
+            # uint8 sums wrap around modulo 256
+            rows[start:end] = np.cumsum(rows[start:end], axis=0, dtype=np.uint8)
+            if start:
+                rows[start:end] += rows[start - 1]
+        elif filter_byte != 0:
+            decode_row = _PNG_ROW_DECODERS[filter_byte]
+            for i in range(start, end):
+                prev = rows[i - 1].tobytes() if i else bytes(width)
+                rows[i] = np.frombuffer(
+                    decode_row(rows[i].tobytes(), prev, bpp), dtype=np.uint8
+                )
+    return rows.tobytes()
+
+
+def _decode_tiff_prediction_numpy(
+    data: bytes, columns: int, colors: int, bits_per_component: int
+) -> bytes:
+    dtype = np.dtype(np.uint8 if bits_per_component == 8 else ">u2")
+    samples = np.frombuffer(data, dtype=dtype).reshape(-1, columns, colors)
+    # unsigned sums wrap around modulo 2 ** bits_per_component
+    samples = np.cumsum(samples, axis=1, dtype=dtype.newbyteorder("="))
+    return samples.astype(dtype).tobytes()
 
 
 class FlateDecode:
@@ -153,13 +341,9 @@ class FlateDecode:
 
             # TIFF prediction:
             if predictor == 2:
-                rowlength -= 1  # remove the predictor byte
-                bpp = rowlength // columns
-                str_data = bytearray(str_data)
-                for i in range(len(str_data)):
-                    if i % rowlength >= bpp:
-                        str_data[i] = (str_data[i] + str_data[i - bpp]) % 256
-                str_data = bytes(str_data)
+                str_data = FlateDecode._decode_tiff_prediction(
+                    str_data, columns, colors, bits_per_component
+                )
             # PNG prediction:
             elif 10 <= predictor <= 15:
                 str_data = FlateDecode._decode_png_prediction(
@@ -170,68 +354,108 @@ class FlateDecode:
                 raise PdfReadError(f"Unsupported flatedecode predictor {predictor!r}")
         return str_data
 
+    @staticmethod
+    def iter_decode(
+        chunks: Iterable[bytes],
+        decode_parms: Optional[DictionaryObject] = None,
+        chunk_size: int = 1 << 16,
+    ) -> Iterator[bytes]:
+        """
+        Decode flate-encoded data a chunk at a time.
+
+        Data with a predictor is decoded at once, with :meth:`decode`.
+
+        Args:
+          chunks: the encoded data, in chunks of any size.
+          decode_parms: a dictionary of values, as for :meth:`decode`.
+          chunk_size: maximum size of the decoded chunks.
+
+        Returns:
+          An iterator over the decoded data.
+        """
+        predictor = 1
+        if decode_parms:
+            try:
+                predictor = decode_parms.get("/Predictor", 1)
+            except (AttributeError, TypeError):  # Type Error is NullObject
+                pass  # Usually an array with a null object was read
+        if predictor != 1:
+            data = FlateDecode.decode(b"".join(chunks), decode_parms)
+            return _iter_slices(data, chunk_size)
+        return _iter_decompress(chunks, chunk_size)
+
+    @staticmethod
+    def _decode_tiff_prediction(
+        data: bytes, columns: int, colors: int, bits_per_component: int
+    ) -> bytes:
+        # each sample is stored as its difference with the same component of
+        # the pixel on its left, modulo 2 ** bits_per_component; each row
+        # starts on a byte boundary
+        rowlength = math.ceil(columns * colors * bits_per_component / 8)
+        if (
+            np is not None
+            and bits_per_component in (8, 16)
+            and data
+            and len(data) % rowlength == 0
+        ):
+            return _decode_tiff_prediction_numpy(
+                data, columns, colors, bits_per_component
+            )
+
+        output = bytearray()
+        for pos in range(0, len(data), rowlength):
+            row = data[pos : pos + rowlength]
+            # the padding bits and the partial samples of a truncated last row
+            # are left as they are
+            length = 8 * len(row)
+            size = min(
+                columns * colors * bits_per_component,
+                length - length % bits_per_component,
+            )
+            padding = length - size
+            x = int.from_bytes(row, "big")
+            samples = _sample_sums(
+                x >> padding, size, colors * bits_per_component, bits_per_component
+            )
+            x = samples << padding | x & ((1 << padding) - 1)
+            output += x.to_bytes(len(row), "big")
+        return bytes(output)
+
     @staticmethod
     def _decode_png_prediction(data: bytes, columns: int, rowlength: int) -> bytes:
         # PNG prediction can vary from row to row
         if len(data) % rowlength != 0:
             raise PdfReadError("Image data is not rectangular")
-        output = []
-        prev_rowdata = (0,) * rowlength
-        bpp = (rowlength - 1) // columns  # recomputed locally to not change params
-        for row in range(0, len(data), rowlength):
-            rowdata: List[int] = list(data[row : row + rowlength])
-            filter_byte = rowdata[0]
-
-            if filter_byte == 0:
-                pass
-            elif filter_byte == 1:
-                for i in range(bpp + 1, rowlength):
-                    rowdata[i] = (rowdata[i] + rowdata[i - bpp]) % 256
-            elif filter_byte == 2:
-                for i in range(1, rowlength):
-                    rowdata[i] = (rowdata[i] + prev_rowdata[i]) % 256
-            elif filter_byte == 3:
-                for i in range(1, bpp + 1):
-                    # left = 0
-                    floor = prev_rowdata[i] // 2
-                    rowdata[i] = (rowdata[i] + floor) % 256
-                for i in range(bpp + 1, rowlength):
-                    left = rowdata[i - bpp]
-                    floor = (left + prev_rowdata[i]) // 2
-                    rowdata[i] = (rowdata[i] + floor) % 256
-            elif filter_byte == 4:
-                for i in range(1, bpp + 1):
-                    # left = 0
-                    up = prev_rowdata[i]
-                    # up_left = 0
-                    paeth = up
-                    rowdata[i] = (rowdata[i] + paeth) % 256
-                for i in range(bpp + 1, rowlength):
-                    left = rowdata[i - bpp]
-                    up = prev_rowdata[i]
-                    up_left = prev_rowdata[i - bpp]
-
-                    p = left + up - up_left
-                    dist_left = abs(p - left)
-                    dist_up = abs(p - up)
-                    dist_up_left = abs(p - up_left)
-
-                    if dist_left <= dist_up and dist_left <= dist_up_left:
-                        paeth = left
-                    elif dist_up <= dist_up_left:
-                        paeth = up
-                    else:
-                        paeth = up_left
-
-                    rowdata[i] = (rowdata[i] + paeth) % 256
-            else:
-                # unsupported PNG filter
-                raise PdfReadError(
-                    f"Unsupported PNG filter {filter_byte!r}"
-                )  # pragma: no cover
-            prev_rowdata = tuple(rowdata)
-            output.extend(rowdata[1:])
-        return bytes(output)
+        width = rowlength - 1
+        # recomputed locally to not change params; at least one byte per pixel
+        bpp = max(1, width // columns)
+        filters = data[::rowlength]
+        unsupported = filters.translate(None, bytes(range(5)))
+        if unsupported:
+            # unsupported PNG filter
+            raise PdfReadError(f"Unsupported PNG filter {unsupported[0]!r}")
+        if np is not None and data:
+            return _decode_png_prediction_numpy(data, filters, rowlength, bpp)
+
+        # the rows without their filter bytes, decoded in place
+        rows = bytearray(data)
+        del rows[::rowlength]
+        start = 0
+        for filter_byte, group in groupby(filters):
+            end = start + width * len(list(group))
+            if filter_byte == 2 and end - start > width * width:
+                # long runs of Up rows (e.g. cross-reference streams) are
+                # decoded at once, from the row before them
+                prev = rows[start - width : start] if start else bytes(width)
+                rows[start:end] = _running_sums(prev + rows[start:end], width)[width:]
+            elif filter_byte != 0:
+                decode_row = _PNG_ROW_DECODERS[filter_byte]
+                for pos in range(start, end, width):
+                    prev = rows[pos - width : pos] if pos else bytes(width)
+                    row = rows[pos : pos + width]
+                    rows[pos : pos + width] = decode_row(row, prev, bpp)
+            start = end
+        return bytes(rows)
 
     @staticmethod
     def encode(data: bytes, level: int = -1) -> bytes:
@@ -280,26 +504,44 @@ class ASCIIHexDecode:
 
         if isinstance(data, str):
             data = data.encode()
-        retval = b""
-        hex_pair = b""
-        index = 0
-        while True:
-            if index >= len(data):
-                logger_warning("missing EOD in ASCIIHexDecode, check if output is OK", __name__)
-                break  # reach End Of String even if no EOD
-            char = data[index : index + 1]
-            if char == b">":
+        return b"".join(ASCIIHexDecode.iter_decode((data,)))
+
+    @staticmethod
+    def iter_decode(chunks: Iterable[bytes], **kwargs: Any) -> Iterator[bytes]:
+        """
+        Decode ASCII-Hex encoded data a chunk at a time.
+
+        Args:
+          chunks: the encoded data, in chunks of any size.
+
+        Returns:
+          An iterator over the decoded data.
+
+        Raises:
+          ValueError: If the data has characters that are neither hexadecimal
+            digits nor white-space.
+        """
+        digit = b""  # odd digit left over from the previous chunk
+        for chunk in chunks:
+            end = chunk.find(b">")
+            if end >= 0:
+                chunk = chunk[:end]
+            digits = digit + bytes(chunk).translate(None, _ASCII_HEX_IGNORED)
+            cut = len(digits) & ~1
+            digit = digits[cut:]
+            if cut:
+                yield bytes.fromhex(digits[:cut].decode("latin-1"))
+            if end >= 0:
                 break
-            elif char.isspace():
-                index += 1
-                continue
-            hex_pair += char
-            if len(hex_pair) == 2:
-                retval += bytes((int(hex_pair, base=16),))
-                hex_pair = b""
-            index += 1
-        assert hex_pair == b""
-        return retval
+        else:
+            logger_warning("missing EOD in ASCIIHexDecode, check if output is OK", __name__)
+        if digit:
+            # a final odd digit is followed by an implied 0
+            yield bytes.fromhex(digit.decode("latin-1") + "0")
+
+
+# white-space between the hexadecimal digits
+_ASCII_HEX_IGNORED = b"\0\t\n\x0b\x0c\r "
 
 
 class RunLengthDecode:
@@ -337,75 +579,76 @@ class RunLengthDecode:
         """
         # decode_parms is unused here
 
-        lst = []
-        index = 0
-        while True:
-            if index >= len(data):
-                logger_warning("missing EOD in RunLengthDecode, check if output is OK", __name__)
-                break  # reach End Of String even if no EOD
-            length = data[index]
-            index += 1
-            if length == 128:
-                if index < len(data):
+        return b"".join(RunLengthDecode.iter_decode((data,)))
+
+    @staticmethod
+    def iter_decode(chunks: Iterable[bytes], **kwargs: Any) -> Iterator[bytes]:
+        """
+        Decode run length encoded data a chunk at a time.
+
+        Args:
+          chunks: the encoded data, in chunks of any size.
+
+        Returns:
+          An iterator over the decoded data.
+
+        Raises:
+          PdfStreamError: If there is data after the EOD marker.
+        """
+        data = b""  # unfinished run of the previous chunk
+        eod = False
+        for chunk in chunks:
+            if eod:
+                if chunk:
                     raise PdfStreamError("early EOD in RunLengthDecode")
-                else:
-                    break
-            elif length < 128:
-                length += 1
-                lst.append(data[index : (index + length)])
-                index += length
-            else:  # >128
-                length = 257 - length
-                lst.append(bytes((data[index],)) * length)
-                index += 1
-        return b"".join(lst)
+                continue
+            data = data + chunk if data else chunk
+            lst = []
+            index = 0
+            while index < len(data):
+                length = data[index]
+                if length == 128:
+                    if index + 1 < len(data):
+                        raise PdfStreamError("early EOD in RunLengthDecode")
+                    eod = True
+                    index += 1
+                elif length < 128:
+                    if index + length + 2 > len(data):
+                        break
+                    lst.append(data[index + 1 : index + length + 2])
+                    index += length + 2
+                else:  # >128
+                    if index + 2 > len(data):
+                        break
+                    lst.append(data[index + 1 : index + 2] * (257 - length))
+                    index += 2
+            data = data[index:]
+            yield b"".join(lst)
+        if not eod:
+            logger_warning("missing EOD in RunLengthDecode, check if output is OK", __name__)
+            # a truncated literal run is copied as far as it goes
+            if data and data[0] < 128:
+                yield data[1:]
 
 
 class LZWDecode:
     """
-    Taken from:
+    Decode and encode LZW compressed data, with the variable code length
+    (9 to 12 bits, most significant bit first) used by PDF and TIFF.
 
-    http://www.java2s.com/Open-Source/Java-Document/PDF/PDF-
-    Renderer/com/sun/pdfview/decode/LZWDecode.java.htm
+    See ISO 32000, §7.4.4 LZWDecode and FlateDecode Filters.
     """
 
+    CLEAR_TABLE = 256
+    EOD = 257
+    MAX_CODE_LENGTH = 12
+
     class Decoder:
-        def __init__(self, data: bytes) -> None:
-            self.STOP = 257
-            self.CLEARDICT = 256
+        def __init__(self, data: bytes, early_change: int = 1) -> None:
             self.data = data
-            self.bytepos = 0
-            self.bitpos = 0
-            self.dict = [""] * 4096
-            for i in range(256):
-                self.dict[i] = chr(i)
-            self.reset_dict()
-
-        def reset_dict(self) -> None:
-            self.dictlen = 258
-            self.bitspercode = 9
-
-        def next_code(self) -> int:
-            fillbits = self.bitspercode
-            value = 0
-            while fillbits > 0:
-                if self.bytepos >= len(self.data):
-                    return -1
-                nextbits = ord_(self.data[self.bytepos])
-                bitsfromhere = 8 - self.bitpos
-                bitsfromhere = min(bitsfromhere, fillbits)
-                value |= (
-                    (nextbits >> (8 - self.bitpos - bitsfromhere))
-                    & (0xFF >> (8 - bitsfromhere))
-                ) << (fillbits - bitsfromhere)
-                fillbits -= bitsfromhere
-                self.bitpos += bitsfromhere
-                if self.bitpos >= 8:
-                    self.bitpos = 0
-                    self.bytepos = self.bytepos + 1
-            return value
-
-        def decode(self) -> str:
+            self.early_change = early_change
+
+        def decode(self) -> bytes:
             """
             TIFF 6.0 specification explains in sufficient details the steps to
             implement the LZW encode() and decode() algorithms.
@@ -417,56 +660,174 @@ class LZWDecode:
             Raises:
               PdfReadError: If the stop code is missing
             """
-            cW = self.CLEARDICT
-            baos = ""
-            while True:
-                pW = cW
-                cW = self.next_code()
-                if cW == -1:
-                    raise PdfReadError("Missed the stop code in LZWDecode!")
-                if cW == self.STOP:
-                    break
-                elif cW == self.CLEARDICT:
-                    self.reset_dict()
-                elif pW == self.CLEARDICT:
-                    baos += self.dict[cW]
+            clear_table = LZWDecode.CLEAR_TABLE
+            eod = LZWDecode.EOD
+            max_table_size = 1 << LZWDecode.MAX_CODE_LENGTH
+            # the clear table and EOD codes have no string
+            initial_table = [bytes((i,)) for i in range(256)] + [b"", b""]
+            table = initial_table[:]
+            code_length = 9
+            # the code length grows when the table size (+1 with early change)
+            # reaches this size
+            next_length_at = (1 << code_length) - self.early_change
+            output = bytearray()
+            prev = None
+            bits = 0  # bit buffer, of bitcount bits
+            bitcount = 0
+            for byte in self.data:
+                bits = (bits << 8) | byte
+                bitcount += 8
+                if bitcount < code_length:
+                    continue
+                bitcount -= code_length
+                code = bits >> bitcount
+                bits &= (1 << bitcount) - 1
+                if code == clear_table:
+                    table = initial_table[:]
+                    code_length = 9
+                    next_length_at = (1 << code_length) - self.early_change
+                    prev = None
+                    continue
+                if code == eod:
+                    return bytes(output)
+                if code < len(table):
+                    entry = table[code]
+                    if prev is not None:
+                        new_entry = prev + entry[:1]
+                elif prev is not None:
+                    # the code being defined: previous string + its first byte
+                    entry = new_entry = prev + prev[:1]
                 else:
-                    if cW < self.dictlen:
-                        baos += self.dict[cW]
-                        p = self.dict[pW] + self.dict[cW][0]
-                        self.dict[self.dictlen] = p
-                        self.dictlen += 1
-                    else:
-                        p = self.dict[pW] + self.dict[pW][0]
-                        baos += p
-                        self.dict[self.dictlen] = p
-                        self.dictlen += 1
+                    entry = b""
+                output += entry
+                if prev is not None and len(table) < max_table_size:
+                    table.append(new_entry)
                     if (
-                        self.dictlen >= (1 << self.bitspercode) - 1
-                        and self.bitspercode < 12
+                        len(table) >= next_length_at
+                        and code_length < LZWDecode.MAX_CODE_LENGTH
                     ):
-                        self.bitspercode += 1
-            return baos
+                        code_length += 1
+                        next_length_at = (1 << code_length) - self.early_change
+                prev = entry
+            raise PdfReadError("Missed the stop code in LZWDecode!")
+
+    class Encoder:
+        def __init__(self, data: bytes, early_change: int = 1) -> None:
+            self.data = data
+            self.early_change = early_change
+            self.output = bytearray()
+            self.bits = 0  # bit buffer, of bitcount bits
+            self.bitcount = 0
+            self.reset_table()
+
+        def reset_table(self) -> None:
+            self.code_length = 9
+            # the code length follows the table of the decoder, which adds the
+            # string of a code once it has read the next code
+            self.decoder_table_size = 258
+            self.first_code = True
+
+        def write(self, code: int) -> None:
+            self.bits = (self.bits << self.code_length) | code
+            self.bitcount += self.code_length
+            if self.bitcount >= 32:
+                self.bitcount -= 32
+                self.output += (self.bits >> self.bitcount).to_bytes(4, "big")
+                self.bits &= (1 << self.bitcount) - 1
+
+        def write_string_code(self, code: int) -> None:
+            self.write(code)
+            if self.first_code:
+                self.first_code = False
+            elif self.decoder_table_size < 1 << LZWDecode.MAX_CODE_LENGTH:
+                self.decoder_table_size += 1
+                if (
+                    self.decoder_table_size + self.early_change
+                    >= 1 << self.code_length
+                    and self.code_length < LZWDecode.MAX_CODE_LENGTH
+                ):
+                    self.code_length += 1
+
+        def encode(self) -> bytes:
+            max_table_size = 1 << LZWDecode.MAX_CODE_LENGTH
+            write_string_code = self.write_string_code
+            self.write(LZWDecode.CLEAR_TABLE)
+            # strings are identified by the code of their prefix << 8 | their
+            # last byte
+            table: Dict[int, int] = {}
+            next_code = 258
+            code = -1
+            for byte in self.data:
+                if code < 0:
+                    code = byte
+                    continue
+                key = code << 8 | byte
+                if key in table:
+                    code = table[key]
+                    continue
+                write_string_code(code)
+                if next_code < max_table_size:
+                    table[key] = next_code
+                    next_code += 1
+                else:
+                    # the table is full: start over
+                    self.write(LZWDecode.CLEAR_TABLE)
+                    self.reset_table()
+                    table.clear()
+                    next_code = 258
+                code = byte
+            if code >= 0:
+                write_string_code(code)
+            self.write(LZWDecode.EOD)
+            # the last byte is padded with zeros
+            padding = -self.bitcount % 8
+            self.output += (self.bits << padding).to_bytes(
+                (self.bitcount + padding) // 8, "big"
+            )
+            return bytes(self.output)
 
     @staticmethod
     def decode(
         data: bytes,
         decode_parms: Optional[DictionaryObject] = None,
         **kwargs: Any,
-    ) -> str:
+    ) -> bytes:
         """
         Decode an LZW encoded data stream.
 
         Args:
-          data: bytes`` or ``str`` text to decode.
-          decode_parms: a dictionary of parameter values.
+          data: ``bytes`` to decode.
+          decode_parms: a dictionary of parameter values; only /EarlyChange
+            is used.
 
         Returns:
           decoded data.
         """
-        # decode_parms is unused here
+        early_change = 1
+        if decode_parms:
+            try:
+                early_change = decode_parms.get(LZW.EARLY_CHANGE, 1)
+            except (AttributeError, TypeError):  # Type Error is NullObject
+                pass  # Usually an array with a null object was read
+        return LZWDecode.Decoder(data, early_change).decode()
 
-        return LZWDecode.Decoder(data).decode()
+    @staticmethod
+    def encode(data: bytes, early_change: int = 1) -> bytes:
+        """
+        Compress the input data with LZW.
+
+        The output starts with a clear table code, which is repeated whenever
+        the table is full, and ends with an EOD code.
+
+        Args:
+            data: The data to be compressed.
+            early_change: The /EarlyChange parameter of the stream the data is
+                written to.
+
+        Returns:
+            The compressed data.
+        """
+        return LZWDecode.Encoder(data, early_change).encode()
 
 
 class ASCII85Decode:
@@ -482,25 +843,58 @@ class ASCII85Decode:
 
         if isinstance(data, str):
             data = data.encode("ascii")
-        group_index = b = 0
-        out = bytearray()
-        for char in data:
-            if ord("!") <= char <= ord("u"):
-                group_index += 1
-                b = b * 85 + (char - 33)
-                if group_index == 5:
-                    out += struct.pack(b">L", b)
-                    group_index = b = 0
-            elif char == ord("z"):
-                assert group_index == 0
-                out += b"\0\0\0\0"
-            elif char == ord("~"):
-                if group_index:
-                    for _ in range(5 - group_index):
-                        b = b * 85 + 84
-                    out += struct.pack(b">L", b)[: group_index - 1]
+        return b"".join(ASCII85Decode.iter_decode((data,)))
+
+    @staticmethod
+    def iter_decode(chunks: Iterable[bytes], **kwargs: Any) -> Iterator[bytes]:
+        """
+        Decode ASCII85 encoded data a chunk at a time.
+
+        Characters other than the digits, ``z`` and the ``~>`` EOD marker are
+        ignored.
+
+        Args:
+          chunks: the encoded data, in chunks of any size.
+
+        Returns:
+          An iterator over the decoded data.
+        """
+        group = b""  # incomplete group of 5 digits of the previous chunk
+        for chunk in chunks:
+            end = chunk.find(b"~")
+            if end >= 0:
+                chunk = chunk[:end]
+            digits = group + bytes(chunk).translate(None, _ASCII85_IGNORED)
+            digits = digits.replace(b"z", b"!!!!!")
+            cut = len(digits) - len(digits) % 5
+            group = digits[cut:]
+            if cut:
+                yield _decode_ascii85_groups(digits[:cut])
+            if end >= 0:
+                if group:
+                    # the missing digits of the last group are taken as "u"
+                    data = _decode_ascii85_groups(group.ljust(5, b"u"))
+                    yield data[: len(group) - 1]
                 break
-        return bytes(out)
+
+
+# bytes that are neither ASCII85 digits nor z
+_ASCII85_IGNORED = bytes(
+    c for c in range(256) if not (ord("!") <= c <= ord("u") or c == ord("z"))
+)
+_ASCII85_VALUES = bytes.maketrans(bytes(range(33, 118)), bytes(range(85)))
+
+
+def _decode_ascii85_groups(digits: bytes) -> bytes:
+    # digits holds whole groups of 5 digits, each one for 4 bytes
+    values = digits.translate(_ASCII85_VALUES)
+    groups = [
+        (((a * 85 + b) * 85 + c) * 85 + d) * 85 + e
+        for a, b, c, d, e in zip(
+            values[::5], values[1::5], values[2::5], values[3::5], values[4::5]
+        )
+    ]
+    return struct.pack(f">{len(groups)}L", *groups)
 
 
 class DCTDecode:
@@ -649,6 +1043,23 @@ class CCITTFaxDecode:
         return tiff_header + data
 
 
+def _get_filters(stream: Any) -> List[Tuple[Any, Any]]:
+    # the filters of a stream, with their parameters
+    filters = stream.get(SA.FILTER, ())
+    if isinstance(filters, IndirectObject):
+        filters = cast(ArrayObject, filters.get_object())
+    if not isinstance(filters, ArrayObject):
+        # we have a single filter instance
+        filters = (filters,)
+    decodparms = stream.get(SA.DECODE_PARMS, ({},) * len(filters))
+    if not isinstance(decodparms, (list, tuple)):
+        decodparms = (decodparms,)
+    return [
+        (filter_type, {} if isinstance(params, NullObject) else params)
+        for filter_type, params in zip(filters, decodparms)
+    ]
+
+
 def decode_stream_data(stream: Any) -> Union[bytes, str]:  # utils.StreamObject
     """
     Decode the stream data based on the specified filters.
@@ -667,51 +1078,88 @@ def decode_stream_data(stream: Any) -> Union[bytes, str]:  # utils.StreamObject
     Raises:
         NotImplementedError: If an unsupported filter type is encountered.
     """
-    filters = stream.get(SA.FILTER, ())
-    if isinstance(filters, IndirectObject):
-        filters = cast(ArrayObject, filters.get_object())
-    if not isinstance(filters, ArrayObject):
-        # we have a single filter instance
-        filters = (filters,)
-    decodparms = stream.get(SA.DECODE_PARMS, ({},) * len(filters))
-    if not isinstance(decodparms, (list, tuple)):
-        decodparms = (decodparms,)
     data: bytes = b_(stream._data)
     # If there is not data to decode we should not try to decode the data.
     if data:
-        for filter_type, params in zip(filters, decodparms):
-            if isinstance(params, NullObject):
-                params = {}
-            if filter_type in (FT.FLATE_DECODE, FTA.FL):
-                data = FlateDecode.decode(data, params)
-            elif filter_type in (FT.ASCII_HEX_DECODE, FTA.AHx):
-                data = ASCIIHexDecode.decode(data)
-            elif filter_type in (FT.RUN_LENGTH_DECODE, FTA.RL):
-                data = RunLengthDecode.decode(data)
-            elif filter_type in (FT.LZW_DECODE, FTA.LZW):
-                data = LZWDecode.decode(data, params)  # type: ignore
-            elif filter_type in (FT.ASCII_85_DECODE, FTA.A85):
-                data = ASCII85Decode.decode(data)
-            elif filter_type == FT.DCT_DECODE:
-                data = DCTDecode.decode(data)
-            elif filter_type == FT.JPX_DECODE:
-                data = JPXDecode.decode(data)
-            elif filter_type == FT.CCITT_FAX_DECODE:
-                height = stream.get(IA.HEIGHT, ())
-                data = CCITTFaxDecode.decode(data, params, height)
-            elif filter_type == "/Crypt":
-                if "/Name" not in params and "/Type" not in params:
-                    pass
-                else:
-                    raise NotImplementedError(
-                        "/Crypt filter with /Name or /Type not supported yet"
-                    )
-            else:
-                # Unsupported filter
-                raise NotImplementedError(f"unsupported filter {filter_type}")
+        for filter_type, params in _get_filters(stream):
+            data = _decode_filter(data, filter_type, params, stream)
+    return data
+
+
+def _decode_filter(data: bytes, filter_type: Any, params: Any, stream: Any) -> bytes:
+    if filter_type in (FT.FLATE_DECODE, FTA.FL):
+        data = FlateDecode.decode(data, params)
+    elif filter_type in (FT.ASCII_HEX_DECODE, FTA.AHx):
+        data = ASCIIHexDecode.decode(data)
+    elif filter_type in (FT.RUN_LENGTH_DECODE, FTA.RL):
+        data = RunLengthDecode.decode(data)
+    elif filter_type in (FT.LZW_DECODE, FTA.LZW):
+        data = LZWDecode.decode(data, params)
+    elif filter_type in (FT.ASCII_85_DECODE, FTA.A85):
+        data = ASCII85Decode.decode(data)
+    elif filter_type == FT.DCT_DECODE:
+        data = DCTDecode.decode(data)
+    elif filter_type == FT.JPX_DECODE:
+        data = JPXDecode.decode(data)
+    elif filter_type == FT.CCITT_FAX_DECODE:
+        height = stream.get(IA.HEIGHT, ())
+        data = CCITTFaxDecode.decode(data, params, height)
+    elif filter_type == "/Crypt":
+        if "/Name" not in params and "/Type" not in params:
+            pass
+        else:
+            raise NotImplementedError(
+                "/Crypt filter with /Name or /Type not supported yet"
+            )
+    else:
+        # Unsupported filter
+        raise NotImplementedError(f"unsupported filter {filter_type}")
     return data
 
 
+def iter_decode_stream_data(
+    stream: Any, chunk_size: int = 1 << 16
+) -> Iterator[bytes]:  # utils.StreamObject
+    """
+    Decode the stream data based on the specified filters, a chunk at a time.
+
+    Unlike :func:`decode_stream_data`, the whole decoded data is never held
+    in memory, provided the filters can be decoded incrementally: this is the
+    case of FlateDecode (without predictor), ASCIIHexDecode, ASCII85Decode
+    and RunLengthDecode, while DCTDecode and JPXDecode data is passed through.
+    The data of the other filters is decoded at once.
+
+    Args:
+        stream: The input stream object containing the data and filters.
+        chunk_size: The size of the chunks the data is read in. The decoded
+            chunks are about that size, but can be larger for filters which
+            expand the data.
+
+    Returns:
+        An iterator over the decoded stream data.
+
+    Raises:
+        NotImplementedError: If an unsupported filter type is encountered.
+    """
+    # If there is not data to decode we should not try to decode the data.
+    if not len(stream._raw_data()):
+        return iter(())
+    chunks: Iterable[bytes] = stream._iter_raw_data(chunk_size)
+    for filter_type, params in _get_filters(stream):
+        if filter_type in (FT.FLATE_DECODE, FTA.FL):
+            chunks = FlateDecode.iter_decode(chunks, params, chunk_size)
+        elif filter_type in (FT.ASCII_HEX_DECODE, FTA.AHx):
+            chunks = ASCIIHexDecode.iter_decode(chunks)
+        elif filter_type in (FT.RUN_LENGTH_DECODE, FTA.RL):
+            chunks = RunLengthDecode.iter_decode(chunks)
+        elif filter_type in (FT.ASCII_85_DECODE, FTA.A85):
+            chunks = ASCII85Decode.iter_decode(chunks)
+        elif filter_type not in (FT.DCT_DECODE, FT.JPX_DECODE):
+            data = _decode_filter(b"".join(chunks), filter_type, params, stream)
+            chunks = _iter_slices(data, chunk_size)
+    return iter(chunks)
+
+
 def decodeStreamData(stream: Any) -> Union[str, bytes]:  # deprecated
     """Deprecated. Use decode_stream_data."""
     deprecate_with_replacement("decodeStreamData", "decode_stream_data", "4.0.0")
@@ -748,9 +1196,8 @@ def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes,
         obj_as_text = x_object_obj.__repr__()
 
     size = (x_object_obj[IA.WIDTH], x_object_obj[IA.HEIGHT])
-    data = x_object_obj.get_data()  # type: ignore
-    if isinstance(data, str):  # pragma: no cover
-        data = data.encode()
+    # decoded without keeping a copy on the stream
+    data = b"".join(x_object_obj.iter_decoded())  # type: ignore
     colors = x_object_obj.get("/Colors", 1)
     color_space: Any = x_object_obj.get("/ColorSpace", NullObject()).get_object()
     if isinstance(color_space, list) and len(color_space) == 1:
@@ -42,6 +42,7 @@ from .._utils import (
     read_non_whitespace,
     read_until_regex,
     str_,
+    stream_buffer,
 )
 from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfReadError, PdfStreamError
 
@@ -57,12 +58,26 @@ class PdfObject(PdfObjectProtocol):
     def hash_value_data(self) -> bytes:
         return ("%s" % self).encode()
 
+    def _hash_digest(self) -> bytes:
+        """
+        Digest of the type and the value of the object.
+
+        Arrays and dictionaries keep it until they are modified, streams keep
+        the digest of their data until it is replaced.
+
+        Returns:
+            The raw digest computed with ``hash_func``.
+        """
+        return self.hash_func(
+            b"%s:%s" % (self.__class__.__name__.encode(), self.hash_value_data())
+        ).digest()
+
     def hash_value(self) -> bytes:
         return (
             "%s:%s"
             % (
                 self.__class__.__name__,
-                self.hash_func(self.hash_value_data()).hexdigest(),
+                self._hash_digest().hex(),
             )
         ).encode()
 
@@ -315,6 +330,13 @@ class IndirectObject(PdfObject):
     def __repr__(self) -> str:
         return f"IndirectObject({self.idnum!r}, {self.generation!r}, {id(self.pdf)})"
 
+    def _hash_digest(self) -> bytes:
+        # a reference is identified by its numbers and its document, not by
+        # the object it points to
+        return self.hash_func(
+            b"IndirectObject:%d %d %d" % (self.idnum, self.generation, id(self.pdf))
+        ).digest()
+
     def __eq__(self, other: object) -> bool:
         return (
             other is not None
@@ -453,7 +475,16 @@ class NumberObject(int, PdfObject):
 
     @staticmethod
     def read_from_stream(stream: StreamType) -> Union["NumberObject", "FloatObject"]:
-        num = read_until_regex(stream, NumberObject.NumberPattern)
+        buf = stream_buffer(stream)
+        if buf is None:
+            num = read_until_regex(stream, NumberObject.NumberPattern)
+        else:
+            with buf:
+                pos = stream.tell()
+                m = NumberObject.NumberPattern.search(buf, pos)
+                end = len(buf) if m is None else m.start()
+                num = bytes(buf[pos:end])
+            stream.seek(end, 0)
         if num.find(b".") != -1:
             return FloatObject(num)
         return NumberObject(num)
@@ -566,21 +597,21 @@ class TextStringObject(str, PdfObject):  # noqa: SLOT000
                 "the encryption_key parameter of write_to_stream", "5.0.0"
             )
         bytearr = self.get_encoded_bytes()
-        stream.write(b"(")
+        # the string is rendered before being written at once
+        out = bytearray(b"(")
         for c in bytearr:
             if not chr(c).isalnum() and c != b" ":
-                # This:
-                #   stream.write(rf"\{c:0>3o}".encode())
-                # gives
-                #   https://github.com/davidhalter/parso/issues/207
-                stream.write(("\\%03o" % c).encode())
+                out += b"\\%03o" % c
             else:
-                stream.write(b_(chr(c)))
-        stream.write(b")")
+                out.append(c)
+        out += b")"
+        stream.write(out)
 
 
 class NameObject(str, PdfObject):  # noqa: SLOT000
     delimiter_pattern = re.compile(rb"\s+|[\(\)<>\[\]{}/%]")
+    # names written as they are by renumber()
+    plain_name_pattern = re.compile(r"/[!\"$&'*-.0-~]*")
     surfix = b"/"
     renumber_table: ClassVar[Dict[str, bytes]] = {
         "#": b"#23",
@@ -613,6 +644,9 @@ class NameObject(str, PdfObject):  # noqa: SLOT000
         stream.write(self.renumber())
 
     def renumber(self) -> bytes:
+        if self.plain_name_pattern.fullmatch(self):
+            # nothing to escape
+            return self.encode()
         out = self[0].encode("utf-8")
         if out != b"/":
             deprecate_no_replacement(
@@ -647,10 +681,35 @@ class NameObject(str, PdfObject):  # noqa: SLOT000
 
     @staticmethod
     def read_from_stream(stream: StreamType, pdf: Any) -> "NameObject":  # PdfReader
-        name = stream.read(1)
-        if name != NameObject.surfix:
-            raise PdfReadError("name read error")
-        name += read_until_regex(stream, NameObject.delimiter_pattern)
+        buf = stream_buffer(stream)
+        if buf is None:
+            name = stream.read(1)
+            if name != NameObject.surfix:
+                raise PdfReadError("name read error")
+            name += read_until_regex(stream, NameObject.delimiter_pattern)
+        else:
+            with buf:
+                pos = stream.tell()
+                if buf[pos : pos + 1] != NameObject.surfix:
+                    raise PdfReadError("name read error")
+                m = NameObject.delimiter_pattern.search(buf, pos + 1)
+                end = len(buf) if m is None else m.start()
+                name = bytes(buf[pos:end])
+            stream.seek(end, 0)
+        return NameObject._from_bytes(name, pdf)
+
+    @staticmethod
+    def _from_bytes(name: bytes, pdf: Any) -> "NameObject":  # PdfReader
+        """
+        Decode the raw bytes of a name, including its leading slash.
+
+        Args:
+            name: The name as read from the file, e.g. ``b"/Type"``.
+            pdf: The reader, for the strict mode.
+
+        Returns:
+            The decoded name.
+        """
         try:
             # Name objects should represent irregular characters
             # with a '#' followed by the symbol's hex number
@@ -32,13 +32,17 @@ __author_email__ = "biziqe@mathieu.fenniak.net"
 import logging
 import re
 import sys
+from functools import wraps
 from io import BytesIO
+from itertools import count
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Match,
     Optional,
     Sequence,
     Set,
@@ -50,6 +54,9 @@ from typing import (
 from .._protocols import PdfReaderProtocol, PdfWriterProtocol, XmpInformationProtocol
 from .._utils import (
     WHITESPACES,
+    WHITESPACES_AS_REGEXP,
+    FileSlice,
+    MemoryMappedStream,
     StreamType,
     b_,
     deprecate_no_replacement,
@@ -58,6 +65,7 @@ from .._utils import (
     read_non_whitespace,
     read_until_regex,
     skip_over_comment,
+    stream_buffer,
 )
 from ..constants import (
     CheckboxRadioButtonAttributes,
@@ -93,7 +101,79 @@ NumberSigns = b"+-"
 IndirectPattern = re.compile(rb"[+-]?(\d+)\s+(\d+)\s+R[^a-zA-Z]")
 
 
+# stamps of the modifications of arrays and dictionaries
+_hash_versions = count(1)
+
+
+def _container_digest(container: Any, compute: Callable[[], bytes]) -> bytes:
+    """
+    Return the digest of an array or a dictionary, computing it when needed.
+
+    The digest is kept in ``container._hash_cache`` along with the version of
+    the container and the versions of the containers nested directly in it
+    (not through an indirect reference), as these may be modified on their
+    own. Every modification gives a container a new version.
+
+    Args:
+        container: The ``ArrayObject`` or ``DictionaryObject`` to hash.
+        compute: Function computing the digest of the container.
+
+    Returns:
+        The digest of the container.
+    """
+    cache = container._hash_cache
+    if (
+        cache is not None
+        and cache[0] == container._hash_version
+        and all(child._hash_version == version for child, version in cache[2])
+    ):
+        return cast(bytes, cache[1])
+    nested = []
+    seen = {id(container)}
+    stack = [container]
+    while stack:
+        obj = stack.pop()
+        for item in dict.values(obj) if isinstance(obj, dict) else obj:
+            if hasattr(item.__class__, "_hash_cache") and id(item) not in seen:
+                seen.add(id(item))
+                nested.append((item, item._hash_version))
+                stack.append(item)
+    digest = compute()
+    container._hash_cache = (container._hash_version, digest, nested)
+    return digest
+
+
+def _invalidate_hash(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a mutating method of a container to give it a new version."""
+
+    @wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        self._hash_version = next(_hash_versions)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ArrayObject(List[Any], PdfObject):
+    # see _container_digest
+    _hash_version = 0
+    _hash_cache: Optional[Tuple[int, bytes, List[Tuple[Any, int]]]] = None
+
+    __setitem__ = _invalidate_hash(list.__setitem__)
+    __delitem__ = _invalidate_hash(list.__delitem__)
+    __imul__ = _invalidate_hash(list.__imul__)
+    append = _invalidate_hash(list.append)
+    extend = _invalidate_hash(list.extend)
+    insert = _invalidate_hash(list.insert)
+    pop = _invalidate_hash(list.pop)
+    remove = _invalidate_hash(list.remove)
+    clear = _invalidate_hash(list.clear)
+    sort = _invalidate_hash(list.sort)
+    reverse = _invalidate_hash(list.reverse)
+
+    def _hash_digest(self) -> bytes:
+        return _container_digest(self, super()._hash_digest)
+
     def clone(
         self,
         pdf_dest: PdfWriterProtocol,
@@ -206,6 +286,14 @@ class ArrayObject(List[Any], PdfObject):
         pdf: Optional[PdfReaderProtocol],
         forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
     ) -> "ArrayObject":
+        buf = stream_buffer(stream)
+        if buf is not None:
+            with buf:
+                arr, pos = _read_array_from_buffer(
+                    buf, stream.tell(), stream, pdf, forced_encoding
+                )
+            stream.seek(pos, 0)
+            return arr
         arr = ArrayObject()
         tmp = stream.read(1)
         if tmp != b"[":
@@ -227,6 +315,20 @@ class ArrayObject(List[Any], PdfObject):
 
 
 class DictionaryObject(Dict[Any, Any], PdfObject):
+    # see _container_digest
+    _hash_version = 0
+    _hash_cache: Optional[Tuple[int, bytes, List[Tuple[Any, int]]]] = None
+
+    __delitem__ = _invalidate_hash(dict.__delitem__)
+    __ior__ = _invalidate_hash(dict.__ior__)
+    update = _invalidate_hash(dict.update)
+    pop = _invalidate_hash(dict.pop)
+    popitem = _invalidate_hash(dict.popitem)
+    clear = _invalidate_hash(dict.clear)
+
+    def _hash_digest(self) -> bytes:
+        return _container_digest(self, super()._hash_digest)
+
     def clone(
         self,
         pdf_dest: PdfWriterProtocol,
@@ -396,6 +498,7 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
             raise ValueError("key must be PdfObject")
         if not isinstance(value, PdfObject):
             raise ValueError("value must be PdfObject")
+        self._hash_version = next(_hash_versions)
         return dict.__setitem__(self, key, value)
 
     def setdefault(self, key: Any, value: Optional[Any] = None) -> Any:
@@ -403,6 +506,7 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
             raise ValueError("key must be PdfObject")
         if not isinstance(value, PdfObject):
             raise ValueError("value must be PdfObject")
+        self._hash_version = next(_hash_versions)
         return dict.setdefault(self, key, value)  # type: ignore
 
     def __getitem__(self, key: Any) -> PdfObject:
@@ -456,33 +560,14 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
         pdf: Optional[PdfReaderProtocol],
         forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
     ) -> "DictionaryObject":
-        def get_next_obj_pos(
-            p: int, p1: int, rem_gens: List[int], pdf: PdfReaderProtocol
-        ) -> int:
-            out = p1
-            for gen in rem_gens:
-                loc = pdf.xref[gen]
-                try:
-                    out = min(out, min([x for x in loc.values() if p < x <= p1]))
-                except ValueError:
-                    pass
-            return out
-
-        def read_unsized_from_stream(
-            stream: StreamType, pdf: PdfReaderProtocol
-        ) -> bytes:
-            # we are just pointing at beginning of the stream
-            eon = get_next_obj_pos(stream.tell(), 2**32, list(pdf.xref), pdf) - 1
-            curr = stream.tell()
-            rw = stream.read(eon - stream.tell())
-            p = rw.find(b"endstream")
-            if p < 0:
-                raise PdfReadError(
-                    f"Unable to find 'endstream' marker for obj starting at {curr}."
+        buf = stream_buffer(stream)
+        if buf is not None:
+            with buf:
+                retval, pos = _read_dictionary_from_buffer(
+                    buf, stream.tell(), stream, pdf, forced_encoding
                 )
-            stream.seek(curr + p + 9)
-            return rw[: p - 1]
-
+            stream.seek(pos, 0)
+            return retval
         tmp = stream.read(2)
         if tmp != b"<<":
             raise PdfReadError(
@@ -529,6 +614,51 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
                 if pdf is not None and pdf.strict:
                     raise PdfReadError(msg)
                 logger_warning(msg, __name__)
+        return DictionaryObject._read_stream_data(stream, pdf, data)
+
+    @staticmethod
+    def _read_stream_data(
+        stream: StreamType, pdf: Optional[PdfReaderProtocol], data: Dict[Any, Any]
+    ) -> "DictionaryObject":
+        """
+        Read the stream data following the dictionary ``data``, if any.
+
+        Args:
+            stream: The data stream, positioned after the closing ``>>``.
+            pdf: The reader the object belongs to.
+            data: The entries of the dictionary.
+
+        Returns:
+            A StreamObject when the dictionary is followed by the ``stream``
+            keyword, a DictionaryObject otherwise.
+        """
+
+        def get_next_obj_pos(
+            p: int, p1: int, rem_gens: List[int], pdf: PdfReaderProtocol
+        ) -> int:
+            out = p1
+            for gen in rem_gens:
+                loc = pdf.xref[gen]
+                try:
+                    out = min(out, min([x for x in loc.values() if p < x <= p1]))
+                except ValueError:
+                    pass
+            return out
+
+        def read_unsized_from_stream(
+            stream: StreamType, pdf: PdfReaderProtocol
+        ) -> bytes:
+            # we are just pointing at beginning of the stream
+            eon = get_next_obj_pos(stream.tell(), 2**32, list(pdf.xref), pdf) - 1
+            curr = stream.tell()
+            rw = stream.read(eon - stream.tell())
+            p = rw.find(b"endstream")
+            if p < 0:
+                raise PdfReadError(
+                    f"Unable to find 'endstream' marker for obj starting at {curr}."
+                )
+            stream.seek(curr + p + 9)
+            return rw[: p - 1]
 
         pos = stream.tell()
         s = read_non_whitespace(stream)
@@ -560,7 +690,12 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
             if length is None:  # if the PDF is damaged
                 length = -1
             pstart = stream.tell()
-            if length > 0:
+            if length > 0 and isinstance(stream, MemoryMappedStream):
+                # the data is left in the file until it is needed, so that
+                # it can be copied to another file without being read
+                data["__streamdata__"] = stream.slice(pstart, pstart + length)
+                stream.seek(data["__streamdata__"].end, 0)
+            elif length > 0:
                 data["__streamdata__"] = stream.read(length)
             else:
                 data["__streamdata__"] = read_until_regex(
@@ -580,7 +715,13 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
                 end = stream.read(9)
                 if end == b"endstream":
                     # we found it by looking back one character further.
-                    data["__streamdata__"] = data["__streamdata__"][:-1]
+                    streamdata = data["__streamdata__"]
+                    if isinstance(streamdata, FileSlice):
+                        data["__streamdata__"] = FileSlice(
+                            streamdata.source, streamdata.start, streamdata.end - 1
+                        )
+                    else:
+                        data["__streamdata__"] = streamdata[:-1]
                 elif pdf is not None and not pdf.strict:
                     stream.seek(pstart, 0)
                     data["__streamdata__"] = read_unsized_from_stream(stream, pdf)
@@ -834,10 +975,50 @@ def _reset_node_tree_relationship(child_obj: Any) -> None:
 
 
 class StreamObject(DictionaryObject):
+    # the data while it is still in the file it was read from
+    _data_slice: Optional[FileSlice] = None
+
     def __init__(self) -> None:
-        self._data: Union[bytes, str] = b""
+        self._data = b""
         self.decoded_self: Optional[DecodedStreamObject] = None
 
+    @property
+    def _data(self) -> Union[bytes, str]:
+        if self._data_slice is not None:
+            self.load_file_data()
+        return self._stream_data
+
+    @_data.setter
+    def _data(self, data: Union[bytes, str, FileSlice]) -> None:
+        if self._data_slice is not None:
+            self._data_slice.source.remove_slice_user(self)
+        if isinstance(data, FileSlice):
+            self._data_slice = data
+            self._stream_data = b""
+            data.source.add_slice_user(self)
+        else:
+            self._data_slice = None
+            self._stream_data = data
+        self._data_digest: Optional[bytes] = None
+
+    def _raw_data(self) -> Union[bytes, str, FileSlice]:
+        """Return the data, without reading it if it is still in the file."""
+        if self._data_slice is not None:
+            return self._data_slice
+        return self._stream_data
+
+    def load_file_data(self) -> None:
+        """
+        Read the data into memory if it was left in the file it was read from.
+
+        This is done before the file is closed, or when the data is used.
+        """
+        data_slice = self._data_slice
+        if data_slice is not None:
+            self._stream_data = data_slice.read()
+            self._data_slice = None
+            data_slice.source.remove_slice_user(self)
+
     def _clone(
         self,
         src: DictionaryObject,
@@ -855,7 +1036,8 @@ class StreamObject(DictionaryObject):
             force_duplicate:
             ignore_fields:
         """
-        self._data = cast("StreamObject", src)._data
+        # the data is not read if it is still in the source file
+        self._data = cast("StreamObject", src)._raw_data()
         try:
             decoded_self = cast("StreamObject", src).decoded_self
             if decoded_self is None:
@@ -869,16 +1051,61 @@ class StreamObject(DictionaryObject):
             pass
         super()._clone(src, pdf_dest, force_duplicate, ignore_fields, visited)
 
+    def _iter_raw_data(self, chunk_size: int) -> Iterator[bytes]:
+        # the data still in the file is read a chunk at a time; it may be
+        # loaded in between, e.g. when the file is closed
+        pos = 0
+        while True:
+            data_slice = self._data_slice
+            if data_slice is None:
+                data = b_(self._stream_data)
+                for pos in range(pos, len(data), chunk_size):
+                    yield data[pos : pos + chunk_size]
+                return
+            if pos >= len(data_slice):
+                return
+            start = data_slice.start + pos
+            end = min(start + chunk_size, data_slice.end)
+            yield FileSlice(data_slice.source, start, end).read()
+            pos += chunk_size
+
     def get_data(self) -> Union[bytes, str]:
         return self._data
 
+    def iter_decoded(self, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        """
+        Iterate over the decoded data, a chunk at a time.
+
+        Unlike :meth:`get_data`, the decoded data is not kept on the stream,
+        and for the filters which can be decoded incrementally (see
+        :func:`pypdf.filters.iter_decode_stream_data`), it is never held in
+        memory as a whole. Data still in the file it was read from is read as
+        it is decoded.
+
+        Args:
+            chunk_size: The size of the chunks the data is read in; the
+                decoded chunks can be larger, depending on the filters.
+
+        Returns:
+            An iterator over the decoded data.
+        """
+        data = b_(self.get_data())
+        for pos in range(0, len(data), chunk_size):
+            yield data[pos : pos + chunk_size]
+
     def set_data(self, data: bytes) -> None:
         self._data = data
 
-    def hash_value_data(self) -> bytes:
-        data = super().hash_value_data()
-        data += b_(self._data)
-        return data
+    def _hash_digest(self) -> bytes:
+        # the data is hashed once, until it is replaced
+        if self._data_digest is None:
+            data = self._raw_data()
+            if isinstance(data, FileSlice):
+                with data.view() as view:
+                    self._data_digest = self.hash_func(view).digest()
+            else:
+                self._data_digest = self.hash_func(b_(data)).digest()
+        return self.hash_func(super()._hash_digest() + self._data_digest).digest()
 
     def write_to_stream(
         self, stream: StreamType, encryption_key: Union[None, str, bytes] = None
@@ -887,11 +1114,17 @@ class StreamObject(DictionaryObject):
             deprecate_no_replacement(
                 "the encryption_key parameter of write_to_stream", "5.0.0"
             )
-        self[NameObject(SA.LENGTH)] = NumberObject(len(self._data))
+        data = self._raw_data()
+        self[NameObject(SA.LENGTH)] = NumberObject(len(data))
         DictionaryObject.write_to_stream(self, stream)
         del self[SA.LENGTH]
         stream.write(b"\nstream\n")
-        stream.write(self._data)
+        if isinstance(data, FileSlice):
+            # copied straight from the source file
+            with data.view() as view:
+                stream.write(view)
+        else:
+            stream.write(data)
         stream.write(b"\nendstream")
 
     @staticmethod
@@ -974,19 +1207,31 @@ class EncodedStreamObject(StreamObject):
             self.decoded_self = decoded
             return decoded.get_data()
 
+    # This overrides the parent method:
+    def iter_decoded(self, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        from ..filters import iter_decode_stream_data
+
+        if self.decoded_self is not None:
+            return self.decoded_self.iter_decoded(chunk_size)
+        return iter_decode_stream_data(self, chunk_size)
+
     # This overrides the parent method:
     def set_data(self, data: bytes) -> None:  # deprecated
-        from ..filters import FlateDecode
+        from ..filters import FlateDecode, LZWDecode
 
-        if self.get(SA.FILTER, "") == FT.FLATE_DECODE:
+        if self.get(SA.FILTER, "") in (FT.FLATE_DECODE, FT.LZW_DECODE):
             if not isinstance(data, bytes):
                 raise TypeError("data must be bytes")
             assert self.decoded_self is not None
             self.decoded_self.set_data(data)
-            super().set_data(FlateDecode.encode(data))
+            if self[SA.FILTER] == FT.FLATE_DECODE:
+                super().set_data(FlateDecode.encode(data))
+            else:
+                super().set_data(LZWDecode.encode(data))
         else:
             raise PdfReadError(
-                "Streams encoded with different filter from only FlateDecode is not supported"
+                "Streams encoded with different filter from only FlateDecode "
+                "and LZWDecode is not supported"
             )
 
 
@@ -1030,17 +1275,16 @@ class ContentStream(DecodedStreamObject):
             super().set_data(b"")
         else:
             stream = stream.get_object()
+            # the streams are decoded without keeping a copy on them
             if isinstance(stream, ArrayObject):
                 data = b""
                 for s in stream:
-                    data += b_(s.get_object().get_data())
+                    data += b"".join(s.get_object().iter_decoded())
                     if len(data) == 0 or data[-1] != b"\n":
                         data += b"\n"
                 super().set_data(bytes(data))
             else:
-                stream_data = stream.get_data()
-                assert stream_data is not None
-                super().set_data(b_(stream_data))
+                super().set_data(b"".join(stream.iter_decoded()))
             self.forced_encoding = forced_encoding
 
     def clone(
@@ -1105,34 +1349,44 @@ class ContentStream(DecodedStreamObject):
 
     def _parse_content_stream(self, stream: StreamType) -> None:
         # 7.8.2 Content Streams
-        stream.seek(0, 0)
+        buf = stream_buffer(stream)
+        assert buf is not None  # always parsed from an in-memory stream
         operands: List[Union[int, str, PdfObject]] = []
-        while True:
-            peek = read_non_whitespace(stream)
-            if peek == b"" or peek == 0:
-                break
-            stream.seek(-1, 1)
-            if peek.isalpha() or peek in (b"'", b'"'):
-                operator = read_until_regex(stream, NameObject.delimiter_pattern)
-                if operator == b"BI":
-                    # begin inline image - a completely different parsing
-                    # mechanism is required, of course... thanks buddy...
-                    assert operands == []
-                    ii = self._read_inline_image(stream)
-                    self._operations.append((ii, b"INLINE IMAGE"))
+        pos = 0
+        with buf:
+            while True:
+                # skip the whitespaces and read the operator, if any
+                m = _OPERATOR_PATTERN.match(buf, pos)
+                pos = m.end()  # type: ignore[union-attr]
+                operator = m.group(1)  # type: ignore[union-attr]
+                if operator is not None:
+                    if operator == b"BI":
+                        # begin inline image - a completely different parsing
+                        # mechanism is required, of course... thanks buddy...
+                        assert operands == []
+                        stream.seek(pos, 0)
+                        ii = self._read_inline_image(stream)
+                        pos = stream.tell()
+                        self._operations.append((ii, b"INLINE IMAGE"))
+                    else:
+                        self._operations.append((operands, operator))
+                        operands = []
+                elif pos >= len(buf):
+                    break
+                elif buf[pos] == b"%"[0]:
+                    # If we encounter a comment in the content stream, we have to
+                    # handle it here.  Typically, read_object will handle
+                    # encountering a comment -- but read_object assumes that
+                    # following the comment must be the object we're trying to
+                    # read.  In this case, it could be an operator instead.
+                    m = _EOL_PATTERN.search(buf, pos)
+                    pos = len(buf) if m is None else m.end()
                 else:
-                    self._operations.append((operands, operator))
-                    operands = []
-            elif peek == b"%":
-                # If we encounter a comment in the content stream, we have to
-                # handle it here.  Typically, read_object will handle
-                # encountering a comment -- but read_object assumes that
-                # following the comment must be the object we're trying to
-                # read.  In this case, it could be an operator instead.
-                while peek not in (b"\r", b"\n", b""):
-                    peek = stream.read(1)
-            else:
-                operands.append(read_object(stream, None, self.forced_encoding))
+                    operand, pos = _read_object_from_buffer(
+                        buf, pos, stream, None, self.forced_encoding
+                    )
+                    operands.append(operand)
+        stream.seek(pos, 0)
 
     def _read_inline_image(self, stream: StreamType) -> Dict[str, Any]:
         # begin reading just after the "BI" - begin image
@@ -1271,6 +1525,170 @@ def read_object(
     stream: StreamType,
     pdf: Optional[PdfReaderProtocol],
     forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
+) -> Union[PdfObject, int, str, ContentStream]:
+    buf = stream_buffer(stream)
+    if buf is None:
+        return _read_object_from_stream(stream, pdf, forced_encoding)
+    with buf:
+        obj, pos = _read_object_from_buffer(
+            buf, stream.tell(), stream, pdf, forced_encoding
+        )
+    stream.seek(pos, 0)
+    return obj
+
+
+_WHITESPACES_PATTERN = re.compile(WHITESPACES_AS_REGEXP + b"*")
+_SPACES_PATTERN = re.compile(rb"\s*")
+_EOL_PATTERN = re.compile(rb"[\r\n]")
+# names, indirect references and numbers, told apart by Match.lastindex
+_TOKEN_PATTERN = re.compile(
+    rb"(/[^\s()<>\[\]{}/%]*)"
+    rb"|([+-]?\d+)\s+(\d+)\s+R(?=[^a-zA-Z])"
+    rb"|([+\-.0-9][+,\-.0-9]*)"
+)
+_NAME_TOKEN, _REFERENCE_TOKEN = 1, 3
+_NUMBER_PATTERN = re.compile(rb"[+\-.0-9][+,\-.0-9]*")
+_OPERATOR_PATTERN = re.compile(
+    WHITESPACES_AS_REGEXP + rb"*([A-Za-z'\"][^\s()<>\[\]{}/%]*)?"
+)
+
+
+def _read_object_from_buffer(
+    buf: memoryview,
+    pos: int,
+    stream: StreamType,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: Union[None, str, List[str], Dict[int, str]],
+) -> Tuple[Any, int]:
+    """
+    Tokenize the object starting at ``pos`` directly in the stream buffer.
+
+    Names, numbers, indirect references, arrays and dictionaries are scanned
+    with a cursor and precompiled patterns; the less frequent objects are
+    read from ``stream``, positioned accordingly.
+
+    Args:
+        buf: The whole data of ``stream``.
+        pos: The offset of the object in ``buf``.
+        stream: The data stream ``buf`` comes from.
+        pdf: The reader the object belongs to.
+        forced_encoding: The encoding to use for strings.
+
+    Returns:
+        The object and the offset following it.
+    """
+    m = _TOKEN_PATTERN.match(buf, pos)
+    if m is not None:
+        kind = m.lastindex
+        if kind == _NAME_TOKEN:
+            return NameObject._from_bytes(m.group(1), pdf), m.end()
+        if kind == _REFERENCE_TOKEN:
+            # like a number, unless " R" is found within 20 bytes
+            if m.end() - pos < 20:
+                assert pdf is not None  # hint for mypy
+                return IndirectObject(int(m.group(2)), int(m.group(3)), pdf), m.end()
+            m = cast(Match[bytes], _NUMBER_PATTERN.match(buf, pos))
+        num = m.group()
+        if num.find(b".") != -1:
+            return FloatObject(num), m.end()
+        return NumberObject(num), m.end()
+    if pos < len(buf):
+        tok = buf[pos]
+        if tok == b"["[0]:
+            return _read_array_from_buffer(buf, pos, stream, pdf, forced_encoding)
+        if tok == b"<"[0] and buf[pos + 1 : pos + 2] == b"<":
+            return _read_dictionary_from_buffer(
+                buf, pos, stream, pdf, forced_encoding
+            )
+        if tok == b"%"[0]:
+            # comment
+            m = _EOL_PATTERN.search(buf, pos)
+            if m is None:
+                raise PdfStreamError("File ended unexpectedly.")
+            pos = _WHITESPACES_PATTERN.match(buf, m.end()).end()  # type: ignore[union-attr]
+            return _read_object_from_buffer(buf, pos, stream, pdf, forced_encoding)
+    # strings, booleans, null and errors
+    stream.seek(pos, 0)
+    return _read_object_from_stream(stream, pdf, forced_encoding), stream.tell()
+
+
+def _read_array_from_buffer(
+    buf: memoryview,
+    pos: int,
+    stream: StreamType,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: Union[None, str, List[str], Dict[int, str]],
+) -> Tuple[ArrayObject, int]:
+    if buf[pos : pos + 1] != b"[":
+        raise PdfReadError("Could not read array")
+    arr = ArrayObject()
+    pos += 1
+    while True:
+        pos = _SPACES_PATTERN.match(buf, pos).end()  # type: ignore[union-attr]
+        if pos >= len(buf):
+            raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+        if buf[pos] == b"]"[0]:
+            return arr, pos + 1
+        obj, pos = _read_object_from_buffer(buf, pos, stream, pdf, forced_encoding)
+        arr.append(obj)
+
+
+def _read_dictionary_from_buffer(
+    buf: memoryview,
+    pos: int,
+    stream: StreamType,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: Union[None, str, List[str], Dict[int, str]],
+) -> Tuple[DictionaryObject, int]:
+    if buf[pos : pos + 2] != b"<<":
+        raise PdfReadError(
+            f"Dictionary read error at byte {hex(min(pos + 2, len(buf)))}: "
+            "stream must begin with '<<'"
+        )
+    pos += 2
+    data: Dict[Any, Any] = {}
+    while True:
+        pos = _WHITESPACES_PATTERN.match(buf, pos).end()  # type: ignore[union-attr]
+        if pos >= len(buf):
+            raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+        tok = buf[pos]
+        if tok == b"%"[0]:
+            m = _EOL_PATTERN.search(buf, pos)
+            pos = len(buf) if m is None else m.end()
+            continue
+        if tok == b">"[0]:
+            pos += 2
+            break
+        try:
+            key, pos = _read_object_from_buffer(buf, pos, stream, pdf, None)
+            pos = _WHITESPACES_PATTERN.match(buf, pos).end()  # type: ignore[union-attr]
+            value, pos = _read_object_from_buffer(
+                buf, pos, stream, pdf, forced_encoding
+            )
+        except Exception as exc:
+            if pdf is not None and pdf.strict:
+                raise PdfReadError(exc.__repr__())
+            logger_warning(exc.__repr__(), __name__)
+            retval = DictionaryObject()
+            retval.update(data)
+            return retval, pos  # return partial data
+
+        if not data.get(key):
+            data[key] = value
+        else:
+            # multiple definitions of key not permitted
+            msg = f"Multiple definitions in dictionary at byte {hex(pos)} for key {key}"
+            if pdf is not None and pdf.strict:
+                raise PdfReadError(msg)
+            logger_warning(msg, __name__)
+    stream.seek(pos, 0)
+    return DictionaryObject._read_stream_data(stream, pdf, data), stream.tell()
+
+
+def _read_object_from_stream(
+    stream: StreamType,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
 ) -> Union[PdfObject, int, str, ContentStream]:
     tok = stream.read(1)
     stream.seek(-1, 1)  # reset to start
@@ -1305,7 +1723,7 @@ def read_object(
                 raise PdfStreamError("File ended unexpectedly.")
         tok = read_non_whitespace(stream)
         stream.seek(-1, 1)
-        return read_object(stream, pdf, forced_encoding)
+        return _read_object_from_stream(stream, pdf, forced_encoding)
     elif tok in b"0123456789+-.":
         # number object OR indirect reference
         peek = stream.read(20)
@@ -1,13 +1,17 @@
 # pylint: disable=wrong-import-position, missing-class-docstring, unused-argument
 """Unit tests for alfred_pdf_tools"""
+import os
+import shutil
 import sys
+import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import call, patch
+from unittest.mock import PropertyMock, call, patch
 
 sys.path.append("./src")
 
 from alfred_pdf_tools import (
+    STRUCTURE_CACHE_MAX_AGE,
     crop,
     decrypt,
     deskew,
@@ -15,10 +19,13 @@ from alfred_pdf_tools import (
     extract_text,
     merge,
     optimize,
+    read_pdf,
+    save_structures,
     scale,
     slice_,
     split_count,
     split_size,
+    unsaved_structures,
 )
 from pypdf import PdfReader
 
@@ -41,21 +48,24 @@ class AlfredPdfToolsTests(unittest.TestCase):
         self.assertIsNone(deskew(["./resources/crazyones.pdf"]))
         self.assertIsNone(deskew(["./resources/corrupted.pdf"]))
 
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_encrypt(self, notify) -> None:
+    def test_encrypt(self, notify, cache_data) -> None:
         """Test encrypt file action."""
         self.assertIsNone(encrypt("hunter2", ["./resources/encrypted.pdf"]))
         self.assertIsNone(encrypt("hunter2", ["./resources/crazyones.pdf"]))
 
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_decrypt(self, notify) -> None:
+    def test_decrypt(self, notify, cache_data) -> None:
         """Test decrypt file action."""
         with self.assertRaises(SystemExit):
             decrypt("hunter2", ["./resources/encrypted.pdf"])
         self.assertIsNone(decrypt("test", ["./resources/encrypted.pdf"]))
 
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_merge(self, notify) -> None:
+    def test_merge(self, notify, cache_data) -> None:
         """Test merge file action."""
         self.assertIsNone(
             merge("tmp_1", ["./resources/file_1.pdf", "./resources_mock/file_2.pdf"])
@@ -76,8 +86,40 @@ class AlfredPdfToolsTests(unittest.TestCase):
         for n, page in enumerate(reader.pages, 1):
             self.assertEqual(int(page.extract_text()), n)
 
+        self.assertIsNone(
+            merge("tmp_2", ["./resources/file_1.pdf", "./resources/file_2.pdf"], False)
+        )
+        self.assertLess(
+            Path("./resources/tmp_1.pdf").stat().st_size,
+            Path("./resources/tmp_2.pdf").stat().st_size,
+        )
+
+    @patch("alfred_pdf_tools.wf.cache_data")
+    @patch("workflow.notify.notify")
+    def test_merge_into_input(self, notify, cache_data) -> None:
+        """Test merge file action saving to the path of an input file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            shutil.copy("./resources/file_1.pdf", tmp_dir)
+            shutil.copy("./resources/file_2.pdf", tmp_dir)
+            pdf_paths = [f"{tmp_dir}/file_1.pdf", f"{tmp_dir}/file_2.pdf"]
+            self.assertIsNone(merge("file_1", pdf_paths))
+            reader = PdfReader(f"{tmp_dir}/file_1.pdf")
+            self.assertEqual(len(reader.pages), 2)
+
+            for n, page in enumerate(reader.pages, 1):
+                self.assertEqual(int(page.extract_text()), n)
+
+            # a failed merge leaves the files as they were
+            with self.assertRaises(FileNotFoundError):
+                merge("file_2", [*pdf_paths, f"{tmp_dir}/missing.pdf"])
+            self.assertEqual(
+                sorted(os.listdir(tmp_dir)), ["file_1.pdf", "file_2.pdf"]
+            )
+            self.assertEqual(len(PdfReader(f"{tmp_dir}/file_2.pdf").pages), 1)
+
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_split_count(self, notify) -> None:
+    def test_split_count(self, notify, cache_data) -> None:
         """Test split by page count file action."""
         self.assertIsNone(
             split_count(
@@ -111,8 +153,9 @@ class AlfredPdfToolsTests(unittest.TestCase):
         for n, page in enumerate(reader.pages, 9):
             self.assertEqual(int(page.extract_text()), n)
 
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_split_size(self, notify) -> None:
+    def test_split_size(self, notify, cache_data) -> None:
         """Test split by page count file action."""
         self.assertIsNone(
             split_size(
@@ -169,8 +212,9 @@ class AlfredPdfToolsTests(unittest.TestCase):
         self.assertLessEqual(size, 300000)
         reader = PdfReader("./resources/mult_pages_3 [part 3].pdf")
 
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_slice(self, notify) -> None:
+    def test_slice(self, notify, cache_data) -> None:
         """Test slice file action."""
         self.assertIsNone(
             slice_(
@@ -232,7 +276,8 @@ class AlfredPdfToolsTests(unittest.TestCase):
         for i, page in enumerate(reader.pages):
             self.assertEqual(int(page.extract_text()), pages[i])
 
-    def test_crop(self) -> None:
+    @patch("alfred_pdf_tools.wf.cache_data")
+    def test_crop(self, cache_data) -> None:
         """Test crop file action."""
         self.assertIsNone(crop(["./resources/landscape.pdf"]))
         reader = PdfReader("./resources/landscape [cropped].pdf")
@@ -254,7 +299,8 @@ class AlfredPdfToolsTests(unittest.TestCase):
             else:
                 self.assertEqual(list(page.mediabox), [0.0, 396, 612, 792])
 
-    def test_scale(self) -> None:
+    @patch("alfred_pdf_tools.wf.cache_data")
+    def test_scale(self, cache_data) -> None:
         """Test scale file action."""
         sys.argv = [None, None, "8.3", "11.7"]
         self.assertIsNone(scale(["./resources/mult_pages_1.pdf"]))
@@ -265,9 +311,13 @@ class AlfredPdfToolsTests(unittest.TestCase):
             self.assertEqual(int(page.extract_text()), n)
             self.assertEqual(float(page.mediabox.width), 8.3 * 72)
             self.assertEqual(float(page.mediabox.height), 11.7 * 72)
+            self.assertEqual(
+                page["/Contents"].get_object()["/Filter"], "/FlateDecode"
+            )
 
+    @patch("alfred_pdf_tools.wf.cache_data")
     @patch("workflow.notify.notify")
-    def test_extract_text(self, notify) -> None:
+    def test_extract_text(self, notify, cache_data) -> None:
         """Test extract text file action."""
         with patch("builtins.print") as mock_print:
             extract_text(["./resources/mult_pages_1.pdf"])
@@ -285,6 +335,95 @@ class AlfredPdfToolsTests(unittest.TestCase):
             ]
             mock_print.assert_has_calls(expected_calls)
 
+    @patch("alfred_pdf_tools.wf.cache_data")
+    @patch("workflow.notify.notify")
+    def test_extract_text_truncated_stream(self, notify, cache_data) -> None:
+        """Test extract text file action on a truncated content stream."""
+        with patch("builtins.print") as mock_print:
+            extract_text(["./resources/truncated_stream.pdf"])
+            mock_print.assert_called_once_with("Recovered text\n")
+
+    def test_read_pdf_structure(self) -> None:
+        """Test caching of the PDF structure between file actions."""
+        cache: dict = {}
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch(
+            "alfred_pdf_tools.wf.cache_data", side_effect=cache.__setitem__
+        ), patch(
+            "alfred_pdf_tools.wf.cached_data",
+            side_effect=lambda name, max_age: cache.get(name),
+        ):
+            pdf_path = shutil.copy("./resources/mult_pages_1.pdf", tmp_dir)
+            reader = read_pdf(pdf_path)
+            self.assertFalse(reader.structure_loaded)
+            texts = [page.extract_text() for page in reader.pages]
+            save_structures()
+            self.assertEqual(len(cache), 1)
+            reader.close()
+
+            # the structure is reused along with the page map
+            with read_pdf(pdf_path) as reader:
+                self.assertTrue(reader.structure_loaded)
+                self.assertIsNotNone(reader._page_refs)
+                self.assertEqual([page.extract_text() for page in reader.pages], texts)
+            self.assertEqual(unsaved_structures, [])
+
+            # a file with another modification time is parsed again
+            stat = os.stat(pdf_path)
+            os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+            with read_pdf(pdf_path) as reader:
+                self.assertFalse(reader.structure_loaded)
+
+            # as is a file with another size
+            save_structures()
+            with open(pdf_path, "ab") as f:
+                f.write(b"\n")
+
+            with read_pdf(pdf_path) as reader:
+                self.assertFalse(reader.structure_loaded)
+                self.assertEqual(len(reader.pages), len(texts))
+
+    def test_structure_cache_expiry(self) -> None:
+        """Test expiry of the cached PDF structures."""
+        with tempfile.TemporaryDirectory() as tmp_dir, patch(
+            "workflow.workflow.Workflow.cachedir",
+            new_callable=PropertyMock,
+            return_value=tmp_dir,
+        ):
+            pdf_path = shutil.copy("./resources/mult_pages_1.pdf", tmp_dir)
+            with read_pdf(pdf_path):
+                save_structures()
+            (structure_file,) = Path(tmp_dir).glob("structure_*")
+
+            other_file = Path(tmp_dir, f"structure_other{structure_file.suffix}")
+            page_file = Path(tmp_dir, f"page_count{structure_file.suffix}")
+            shutil.copy(structure_file, other_file)
+            shutil.copy(structure_file, page_file)
+            expired = os.stat(structure_file).st_mtime - STRUCTURE_CACHE_MAX_AGE - 60
+
+            # a structure in use is kept however old it was
+            os.utime(structure_file, (expired + 120, expired + 120))
+            with read_pdf(pdf_path) as reader:
+                self.assertTrue(reader.structure_loaded)
+            self.assertGreater(os.stat(structure_file).st_mtime, expired + 120)
+
+            # an expired structure is parsed again and the others are removed
+            for cache_file in (structure_file, other_file, page_file):
+                os.utime(cache_file, (expired, expired))
+
+            with read_pdf(pdf_path) as reader:
+                self.assertFalse(reader.structure_loaded)
+                save_structures()
+
+            self.assertTrue(structure_file.exists())
+            self.assertFalse(other_file.exists())
+            self.assertTrue(page_file.exists())
+
+    def tearDown(self) -> None:
+        """Drop the readers opened by the file actions."""
+        unsaved_structures.clear()
+
     @classmethod
     def tearDownClass(cls) -> None:
         """Clean up resources."""
@@ -293,6 +432,7 @@ class AlfredPdfToolsTests(unittest.TestCase):
         Path("./resources/crazyones [encrypted].pdf").unlink(missing_ok=True)
         Path("./resources/encrypted [decrypted].pdf").unlink(missing_ok=True)
         Path("./resources/tmp_1.pdf").unlink(missing_ok=True)
+        Path("./resources/tmp_2.pdf").unlink(missing_ok=True)
         Path("./resources/file_1 [merged].pdf").unlink(missing_ok=True)
         Path("./resources/mult_pages_1 [part 1].pdf").unlink(missing_ok=True)
         Path("./resources/mult_pages_1 [part 2].pdf").unlink(missing_ok=True)
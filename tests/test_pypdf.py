@@ -0,0 +1,1672 @@
+# pylint: disable=wrong-import-position, missing-class-docstring, protected-access
+"""Unit tests for the vendored pypdf"""
+import base64
+import math
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+import zlib
+from array import array
+from io import BufferedReader, BytesIO, FileIO, RawIOBase
+from typing import Any, Callable, Dict, List, Set, Tuple
+from unittest.mock import patch
+
+sys.path.append("./src")
+
+from pypdf import PdfReader, PdfWriter, _writer, filters
+from pypdf._doc_common import convert_to_int
+from pypdf._reader import _ObjectCache
+from pypdf._writer import WRITE_BUFFER_SIZE
+from pypdf._xref import (
+    _MAX_GAP,
+    XrefFlags,
+    XrefObjectStreams,
+    XrefOffsets,
+    new_free_entry_generation,
+    new_xref_generation,
+)
+from pypdf.errors import PdfStreamError
+from pypdf.filters import (
+    RECOVERY_CHUNK_SIZE,
+    ASCII85Decode,
+    ASCIIHexDecode,
+    FlateDecode,
+    LZWDecode,
+    RunLengthDecode,
+    _decompress_damaged,
+    _iter_decompress,
+    _iter_slices,
+)
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    EncodedStreamObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    NumberObject,
+    PdfObject,
+    StreamObject,
+    read_object,
+)
+from pypdf.generic._data_structures import _read_object_from_stream
+
+
+class MemoryMapTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def copy(self, name: str) -> str:
+        """Copy a file from the resources to the temporary directory."""
+        return shutil.copy(f"./resources/{name}", self.tmp_dir.name)
+
+    def test_write_back_to_source(self) -> None:
+        """Test writing cloned pages to the file they are mapped from."""
+        path = self.copy("mult_pages_1.pdf")
+        texts = [page.extract_text() for page in PdfReader(path).pages]
+
+        reader = PdfReader(path)
+        writer = PdfWriter()
+        writer.append(reader)
+        writer.write(path)
+        with PdfReader(path) as result:
+            self.assertEqual([page.extract_text() for page in result.pages], texts)
+
+        # a second write must not read the truncated mapping either
+        writer.write(path)
+        with PdfReader(path) as result:
+            self.assertEqual(len(result.pages), len(texts))
+        reader.close()
+
+    def test_bounded_cache_leaves_slices(self) -> None:
+        """Test the size of a bounded cache does not load the mapped data."""
+        with PdfReader(
+            "./resources/mult_pages_1.pdf", cache_max_bytes=1024 * 1024
+        ) as reader:
+            objects = map(reader.get_object, range(1, reader.trailer["/Size"]))
+            streams = [obj for obj in objects if isinstance(obj, StreamObject)]
+            self.assertTrue(streams)
+            for obj in streams:
+                self.assertIsNotNone(obj._data_slice)
+            self.assertEqual(reader.resolved_objects.nbytes, 0)
+
+            data = streams[0].get_data()
+            self.assertIsNone(streams[0]._data_slice)
+            cached = reader.resolved_objects.get(
+                (0, streams[0].indirect_reference.idnum)
+            )
+            self.assertIs(cached, streams[0])
+            self.assertGreaterEqual(reader.resolved_objects.nbytes, len(data))
+
+
+def write_markers(count: int) -> bytes:
+    """Write a PDF file with a classic xref table and ``count`` marker objects."""
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    refs = [
+        writer._add_object(
+            DictionaryObject({NameObject("/Marker"): NumberObject(n)})
+        )
+        for n in range(count)
+    ]
+    writer._root_object[NameObject("/Markers")] = ArrayObject(refs)
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+class HeaderCountingReader(PdfReader):
+    """Reader recording the offsets of the object headers it reads."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.headers: List[int] = []
+        super().__init__(*args, **kwargs)
+
+    def read_object_header(self, stream: Any) -> Tuple[int, int]:
+        self.headers.append(stream.tell())
+        return super().read_object_header(stream)
+
+
+def validate_xref_reference(reader: PdfReader) -> None:
+    """Drop the entries not pointing to an object header, as read() used to."""
+    if reader.strict:
+        return
+    for gen, xref_entry in reader.xref.items():
+        if gen == 65535:
+            continue
+        for idnum in list(xref_entry):
+            reader.stream.seek(xref_entry[idnum], 0)
+            try:
+                reader.read_object_header(reader.stream)
+            except ValueError:
+                del xref_entry[idnum]
+
+
+class XrefValidationTests(unittest.TestCase):
+    def make_pdf(self, keep_header: bool) -> Tuple[bytes, List[int]]:
+        """
+        Write 3 markers, the xref entry of the second pointing into the first.
+
+        Returns:
+            The file and the offsets of the headers of the markers.
+        """
+        data = write_markers(3)
+        offsets = [data.index(b"\n%d 0 obj" % idnum) + 1 for idnum in (5, 6, 7)]
+        entry = list(re.finditer(rb"(\d{10}) \d{5} [nf]", data))[6]
+        wrong = b"%010d" % data.index(b"/Marker 0")
+        data = data[: entry.start(1)] + wrong + data[entry.end(1) :]
+        if not keep_header:
+            data = data.replace(b"\n6 0 obj", b"\n6 0 xbj")
+        return data, offsets
+
+    def snapshot(self, reader: PdfReader) -> Dict[int, Dict[int, Any]]:
+        return {gen: dict(table) for gen, table in reader.xref.items()}
+
+    def test_recovered_on_access(self) -> None:
+        """Test a wrong offset is corrected when the object is resolved."""
+        data, offsets = self.make_pdf(keep_header=True)
+        reader = HeaderCountingReader(BytesIO(data))
+        self.assertEqual(reader.headers, [])
+        self.assertEqual(reader.get_object(6)["/Marker"], 1)
+        self.assertEqual(reader.xref[0][6], offsets[1])
+        # the other entries are not checked
+        self.assertNotIn(offsets[0], reader.headers)
+        self.assertNotIn(offsets[2], reader.headers)
+        self.assertEqual(reader.xref[0][7], offsets[2])
+
+    def test_dropped_on_access(self) -> None:
+        """Test an entry not pointing to an object is dropped on access."""
+        data, offsets = self.make_pdf(keep_header=False)
+        reader = HeaderCountingReader(BytesIO(data))
+        with self.assertLogs("pypdf._reader", "WARNING") as logs:
+            self.assertIsNone(reader.get_object(6))
+        self.assertIn("Ignoring wrong pointing object 6 0", "".join(logs.output))
+        self.assertNotIn(6, reader.xref[0])
+        self.assertNotIn(offsets[0], reader.headers)
+        self.assertNotIn(offsets[2], reader.headers)
+        self.assertEqual(reader.get_object(7)["/Marker"], 2)
+
+    def test_validate_xref(self) -> None:
+        """Test the explicit validation matches the former eager one."""
+        for strict in (False, True):
+            for keep_header in (False, True):
+                with self.subTest(strict=strict, keep_header=keep_header):
+                    data, _ = self.make_pdf(keep_header)
+                    reader = PdfReader(BytesIO(data), strict=strict)
+                    expected = PdfReader(BytesIO(data), strict=strict)
+                    self.assertEqual(expected.xref_index, 0)
+                    validate_xref_reference(expected)
+                    reader.validate_xref()
+                    self.assertEqual(self.snapshot(reader), self.snapshot(expected))
+                    self.assertEqual(6 in reader.xref[0], strict)
+                    if not strict:
+                        marker = reader.get_object(6)
+                        self.assertEqual(marker, expected.get_object(6))
+                        self.assertEqual(marker is not None, keep_header)
+
+
+class ChunkedIO(RawIOBase):
+    """Unbuffered input returning at most ``size`` bytes per read."""
+
+    def __init__(self, data: bytes, size: int) -> None:
+        self.data = BytesIO(data)
+        self.size = size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.data.seek(offset, whence)
+
+    def readinto(self, b: Any) -> int:
+        chunk = self.data.read(min(len(b), self.size))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class ObjectHeaderIndexTests(unittest.TestCase):
+    def make_pdf(self) -> bytes:
+        """
+        Write 3 markers, with a wrong offset for the second one.
+
+        A later copy of the second marker is appended to the file, as an
+        incremental update missing from the xref would.
+        """
+        data = write_markers(3)
+        entry = list(re.finditer(rb"(\d{10}) \d{5} [nf]", data))[6]
+        wrong = b"%010d" % data.index(b"/Marker 0")
+        data = data[: entry.start(1)] + wrong + data[entry.end(1) :]
+        return data + b"6\r\n0  obj\n<<\n/Marker 9\n>>\nendobj\n"
+
+    def test_wrong_offset(self) -> None:
+        """Test the last occurrence of an object is found for a wrong offset."""
+        data = self.make_pdf()
+        reader = PdfReader(BytesIO(data))
+        self.assertEqual(reader.get_object(6)["/Marker"], 9)
+        self.assertEqual(reader.xref[0][6], data.rindex(b"6\r\n0  obj"))
+        self.assertEqual(reader.get_object(5)["/Marker"], 0)
+
+    def test_read_boundaries(self) -> None:
+        """Test the headers split across reads of the stream are found."""
+        data = self.make_pdf()
+        for size in (1, 2, 3, 5, 7):
+            with self.subTest(size=size):
+                stream = BufferedReader(ChunkedIO(data, size), buffer_size=size)
+                reader = PdfReader(stream)
+                self.assertEqual(reader.get_object(6)["/Marker"], 9)
+                self.assertEqual(reader.get_object(7)["/Marker"], 2)
+
+    def test_invalid_entry(self) -> None:
+        """Test the generation of an invalid xref entry is taken from the file."""
+        data = self.make_pdf()
+        entry = list(re.finditer(rb"\d{10} \d{5} [nf]", data))[6]
+        data = data[: entry.start()] + b"xxxxxxxxxx 00000 n" + data[entry.end() :]
+        data = data.replace(b"6\r\n0  obj", b"6\r\n1  obj")
+        with self.assertLogs("pypdf._reader", "WARNING") as logs:
+            reader = PdfReader(BytesIO(data))
+        self.assertIn("entry 6 in Xref table invalid", "".join(logs.output))
+        self.assertEqual(reader.xref[1][6], data.rindex(b"6\r\n1  obj"))
+        self.assertEqual(reader.get_object(IndirectObject(6, 1, reader))["/Marker"], 9)
+
+    def test_generations(self) -> None:
+        """Test the occurrences of an object are told apart by generation."""
+        data = (
+            b"%PDF-1.7\n"
+            b"6 0 obj\n1\nendobj\n"
+            b"6 1 obj\n2\nendobj\n"
+            b"6 0 obj\n3\nendobj\n"
+            b"6 1 obj\n4\nendobj\n"
+            b"6 2 obj\n5\nendobj\n"
+            b"6 1 obj\n6\nendobj\n"
+        )
+        reader = PdfReader(BytesIO(write_markers(1)))
+        stream = BytesIO(data)
+        offsets = [m.start() for m in re.finditer(rb"6 \d obj", data)]
+        for generation, occurrence in ((0, 2), (1, 5), (2, 4), (None, 5)):
+            with self.subTest(generation=generation):
+                found = reader._find_object_header(stream, 6, generation)
+                self.assertIsNotNone(found)
+                self.assertEqual(found[1], offsets[occurrence])
+                self.assertEqual(found[0], int(data[found[1] + 2 : found[1] + 3]))
+        self.assertIsNone(reader._find_object_header(stream, 6, 3))
+        self.assertIsNone(reader._find_object_header(stream, 7))
+
+
+def decode_xref_fields_reference(
+    data: bytes, entry_sizes: List[int], count: int
+) -> List[List[int]]:
+    """Read the fields of a xref stream entry by entry, with short reads."""
+    stream = BytesIO(data)
+    fields: List[List[int]] = [[], [], []]
+    for _ in range(count):
+        for i, size in enumerate(entry_sizes):
+            if size > 0:
+                fields[i].append(convert_to_int(stream.read(size), size))
+            else:
+                fields[i].append(1 if i == 0 else 0)
+    return fields
+
+
+class XrefStreamDecodingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.random = random.Random(0)
+
+    def assertDecoded(self, data: bytes, entry_sizes: List[int], count: int) -> None:
+        fields = PdfReader._decode_xref_stream_fields(data, entry_sizes, count)
+        self.assertEqual(
+            [list(field) for field in fields],
+            decode_xref_fields_reference(data, entry_sizes, count),
+        )
+
+    def test_widths(self) -> None:
+        """Test the fields of every width match the per-row reading."""
+        for entry_sizes in ([0, 2, 1], [1, 1, 1], [1, 3, 0], [1, 8, 2], [2, 3, 8]):
+            with self.subTest(entry_sizes=entry_sizes):
+                count = 50
+                data = self.random.randbytes(sum(entry_sizes) * count)
+                self.assertDecoded(data, entry_sizes, count)
+        fields = PdfReader._decode_xref_stream_fields(b"\x00\x01" * 3, [0, 2, 0], 3)
+        self.assertEqual([list(field) for field in fields], [[1] * 3, [1] * 3, [0] * 3])
+
+    def test_short_data(self) -> None:
+        """Test the entries cut by the end of the data."""
+        for missing in range(1, 7):
+            with self.subTest(missing=missing):
+                data = self.random.randbytes(6 * 10 - missing)
+                self.assertDecoded(data, [1, 3, 2], 10)
+        # more entries than data
+        self.assertDecoded(self.random.randbytes(6 * 10), [1, 3, 2], 12)
+        self.assertDecoded(b"", [1, 3, 2], 2)
+
+    def test_wide_entries(self) -> None:
+        """Test widths adding up to more than the rows of the data."""
+        data = self.random.randbytes(4 * 10)
+        self.assertDecoded(data, [1, 2, 2], 10)
+        self.assertDecoded(data, [2, 8, 2], 10)
+
+    def test_subsections(self) -> None:
+        """Test the entries are numbered across several /Index subsections."""
+        rows = [
+            (1, 100, 0),
+            (2, 9, 0),
+            (0, 0, 0),
+            (1, 200, 1),
+            (2, 9, 1),
+            (1, 300, 0),
+            (1, 400, 0),
+        ]
+        data = b"".join(
+            bytes([t]) + f1.to_bytes(2, "big") + bytes([f2]) for t, f1, f2 in rows
+        )
+        idx_pairs = [0, 2, 5, 3, 20, 2]
+        reader = PdfReader(BytesIO(write_markers(1)))
+        reader.xref = {0: XrefOffsets({20: 99})}
+        reader.xref_objStm = XrefObjectStreams()
+        count = len(rows)
+        fields = PdfReader._decode_xref_stream_fields(data, [1, 2, 1], count)
+        reader._read_xref_subsections(idx_pairs, fields)
+        self.assertEqual(
+            {gen: dict(table) for gen, table in reader.xref.items()},
+            {0: {0: 100, 20: 99, 21: 400}, 1: {6: 200}},
+        )
+        self.assertEqual(dict(reader.xref_objStm), {1: (9, 0), 7: (9, 1)})
+
+
+class XrefTableTests(unittest.TestCase):
+    def test_mapping(self) -> None:
+        """Test the tables behave like the dictionaries they replace."""
+        for table, values in (
+            (XrefOffsets(), [10, 0, 2**40]),
+            (XrefFlags(), [True, False, True]),
+            (XrefObjectStreams(), [(3, 0), (3, 1), (0, 2**40)]),
+        ):
+            with self.subTest(table=type(table).__name__):
+                expected = {}
+                for num, value in zip((5, 1, 3), values):
+                    table[num] = value
+                    expected[num] = value
+                self.assertEqual(dict(table), expected)
+                self.assertEqual(list(table), [1, 3, 5])
+                self.assertEqual(len(table), 3)
+                for missing in (0, 2, 4, 6, 10**6, -1, "1", None):
+                    self.assertNotIn(missing, table)
+                    self.assertIsNone(table.get(missing))
+                    self.assertEqual(table.get(missing, "default"), "default")
+                    with self.assertRaises(KeyError):
+                        table[missing]
+                del table[3]
+                self.assertNotIn(3, table)
+                self.assertEqual(list(table), [1, 5])
+                with self.assertRaises(KeyError):
+                    del table[3]
+
+    def test_sparse(self) -> None:
+        """Test the numbers and values not fitting the arrays."""
+        table = XrefOffsets()
+        table[2] = 20
+        far = 3 + _MAX_GAP + 1
+        table[far] = 30
+        table[1] = 2**64
+        table[-4] = 40
+        table[0] = 5
+        self.assertEqual(len(table._present), 3)
+        self.assertEqual(set(table._sparse), {far, 1, -4})
+        self.assertEqual(list(table), [0, 2, far, 1, -4])
+        self.assertEqual(dict(table), {0: 5, 1: 2**64, 2: 20, far: 30, -4: 40})
+        # a number kept aside stays there
+        table[1] = 10
+        self.assertEqual(table[1], 10)
+        self.assertIn(1, table._sparse)
+        self.assertEqual(len(table), 5)
+        # a value not fitting the array moves the number aside
+        table[2] = 2**64
+        self.assertEqual(table[2], 2**64)
+        self.assertEqual(len(table), 5)
+        self.assertEqual(list(table), [0, far, 1, -4, 2])
+
+    def test_load(self) -> None:
+        """Test a range of objects is stored at once only when vacant."""
+        table = XrefObjectStreams()
+        table[2] = (1, 0)
+        table[_MAX_GAP * 3] = (1, 1)
+        self.assertFalse(table.is_vacant(0, 3))
+        self.assertTrue(table.is_vacant(3, 10))
+        self.assertFalse(table.is_vacant(10, _MAX_GAP * 3 + 1))
+        columns = [array("q", range(6)), array("q", range(10, 16))]
+        self.assertTrue(table.load(4, columns, bytes([1, 0, 1, 1, 0, 1])))
+        self.assertEqual(
+            dict(table),
+            {
+                2: (1, 0),
+                4: (0, 10),
+                6: (2, 12),
+                7: (3, 13),
+                9: (5, 15),
+                _MAX_GAP * 3: (1, 1),
+            },
+        )
+        self.assertEqual(len(table), 6)
+        self.assertFalse(table.is_vacant(3, 10))
+        # ranges too far away or overlapping the numbers kept aside
+        self.assertFalse(table.load(_MAX_GAP * 2, columns, bytes(6)))
+        self.assertFalse(table.load(_MAX_GAP * 3 - 2, columns, bytes(6)))
+        self.assertEqual(len(table), 6)
+
+    def test_generations(self) -> None:
+        """Test an object of generation 1 is stored apart from generation 0."""
+        self.assertIsInstance(new_xref_generation(0), XrefOffsets)
+        self.assertIsInstance(new_xref_generation(1), dict)
+        self.assertIsInstance(new_free_entry_generation(65535), XrefFlags)
+        data = write_markers(3)
+        entry = list(re.finditer(rb"\d{10} (\d{5}) [nf]", data))[6]
+        data = data[: entry.start(1)] + b"00001" + data[entry.end(1) :]
+        data = data.replace(b"\n6 0 obj", b"\n6 1 obj").replace(b"6 0 R", b"6 1 R")
+        reader = PdfReader(BytesIO(data))
+        self.assertEqual(reader.xref[1], {6: data.index(b"6 1 obj")})
+        self.assertNotIn(6, reader.xref[0])
+        self.assertIn(7, reader.xref[0])
+        markers = reader.root_object["/Markers"]
+        self.assertEqual([marker["/Marker"] for marker in markers], [0, 1, 2])
+
+
+class ObjectStreamIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        writer = PdfWriter()
+        writer.append(PdfReader("./resources/mult_pages_1.pdf"))
+        self.output = BytesIO()
+        writer.write(self.output, object_streams=True)
+
+    def test_siblings(self) -> None:
+        """Test the objects of an object stream are read with a single decoding."""
+        reader = PdfReader(self.output)
+        stmnum = next(iter(reader.xref_objStm.values()))[0]
+        idnums = [
+            idnum
+            for idnum, (number, _) in reader.xref_objStm.items()
+            if number == stmnum
+        ]
+        self.assertGreater(len(idnums), 2)
+        decode = filters.decode_stream_data
+        with patch.object(filters, "decode_stream_data", wraps=decode) as decoded:
+            reader.get_object(idnums[1])
+            self.assertEqual(decoded.call_count, 1)
+            index = reader._objstm_index[stmnum]
+            self.assertEqual(sorted(index), sorted(idnums))
+            objects = {idnum: reader.resolved_objects[(0, idnum)] for idnum in idnums}
+
+            # the siblings are read again from the data kept with the index
+            for idnum in idnums:
+                del reader.resolved_objects[(0, idnum)]
+            del reader.resolved_objects[(0, stmnum)]
+            for idnum in reversed(idnums):
+                obj = reader.get_object(idnum)
+                self.assertIsNot(obj, objects[idnum])
+                self.assertEqual(obj, objects[idnum])
+            self.assertEqual(decoded.call_count, 1)
+            self.assertIs(reader._objstm_index[stmnum], index)
+
+
+class ObjectCacheTests(unittest.TestCase):
+    def test_byte_budget_keeps_empty_entries(self) -> None:
+        """Test the objects without data are not evicted to free bytes."""
+        cache = _ObjectCache(None, 10, lambda key: True)
+        cache[(0, 1)] = DictionaryObject()
+        for idnum in (2, 3):
+            stream = DecodedStreamObject()
+            stream.set_data(b"0" * 8)
+            cache[(0, idnum)] = stream
+        self.assertEqual(sorted(cache), [(0, 1), (0, 3)])
+        self.assertEqual(cache.nbytes, 8)
+
+    def test_object_stream_siblings(self) -> None:
+        """Test the objects of an object stream do not evict the requested one."""
+        writer = PdfWriter()
+        writer.append(PdfReader("./resources/mult_pages_1.pdf"))
+        output = BytesIO()
+        writer.write(output, object_streams=True)
+        expected = PdfReader(output)
+        idnums = sorted(expected.xref_objStm)
+        self.assertGreater(len(idnums), 4)
+
+        reader = PdfReader(output, cache_max_objects=2)
+        read = reader._read_object_from_stream
+        for idnum in reversed(idnums):
+            with patch.object(
+                reader, "_read_object_from_stream", wraps=read
+            ) as read_object_from_stream:
+                obj = reader.get_object(idnum)
+            self.assertIs(type(obj), type(expected.get_object(idnum)))
+            self.assertIs(reader.resolved_objects.get((0, idnum)), obj)
+            # only the objects the cache has room for are parsed
+            self.assertLessEqual(read_object_from_stream.call_count, 2)
+        # the decoded data is left to the cache
+        self.assertFalse(reader._objstm_data)
+
+
+class TokenizerTests(unittest.TestCase):
+    # objects read in place from the buffer of in-memory streams
+    corpus = [
+        b"/Name ",
+        b"/A#20B",
+        b"/",
+        b"12 ",
+        b"-3.5 ",
+        b"+.5]",
+        b"1.2.3 ",
+        b"4 0 R ",
+        b"4 0 R/X",
+        b"4 0 Rx",
+        b"12 0 obj",
+        b"1 2",
+        b"123456789012345678 0 R ",
+        b"[1 2 3]",
+        b"[ ] ",
+        b"[/A[4 0 R]<</K (v)>>]",
+        b"[(a(b)c) <414243> true false null]",
+        b"[(a) (b (c) d)]",
+        b"(nested (strings (deep)))",
+        b"(a\\)b)",
+        b"[1 % comment\n 2]",
+        b"% comment\n/N ",
+        b"%comment\r\n 7 ",
+        b"<< /A 1 /B [2 3] /C << /D 4 0 R >> >>",
+        b"<</A(str)/B<01>>>",
+        b"<< % comment\n /A 1 >>",
+        b"<< /A 1 /A 2 >>",
+        b"<< 1 2 >>",
+        b"<< /Length 3 >>\nstream\nabc\nendstream",
+        b"true",
+        b"null",
+        b"endobj",
+        # malformed objects
+        b"[1 2",
+        b"[",
+        b"[(abc",
+        b"[ << /A 1 ]",
+        b"<<",
+        b"<< /A",
+        b"<< /A 1",
+        b"<< /A [1 2 >>",
+        b"<< /A (x) /B ) >>",
+        b"<< /A (unbalanced ( ) >>",
+        b"% comment only",
+        b"]",
+        b">>",
+        b"@",
+        b"",
+    ]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.reader = PdfReader("./resources/crazyones.pdf")
+
+    def parse(self, read: Callable[..., Any], data: bytes) -> Tuple[Any, ...]:
+        """Read an object, returning a comparable outcome."""
+        stream = BytesIO(data)
+        try:
+            obj = read(stream, self.reader)
+        except Exception as exc:  # pylint: disable=broad-except
+            return type(exc), str(exc)
+        content = obj.get_data() if isinstance(obj, StreamObject) else None
+        return type(obj), repr(obj), content, stream.tell()
+
+    def test_buffer_matches_stream(self) -> None:
+        """Test tokenizing in place gives the objects read from the stream."""
+        for strict in (False, True):
+            self.reader.strict = strict
+            for data in self.corpus:
+                with self.subTest(data=data, strict=strict):
+                    self.assertEqual(
+                        self.parse(read_object, data),
+                        self.parse(_read_object_from_stream, data),
+                    )
+        self.reader.strict = False
+
+    def test_buffer_position(self) -> None:
+        """Test reading objects one after the other from a buffer."""
+        stream = BytesIO(b"/A 1 0 R 2.5 [3] <</B 4>> % end\n(s) ")
+        objects = []
+        while stream.tell() < len(stream.getvalue()) - 1:
+            objects.append(read_object(stream, self.reader))
+            stream.seek(stream.tell() + 1)
+        self.assertEqual(
+            [type(obj).__name__ for obj in objects],
+            [
+                "NameObject",
+                "IndirectObject",
+                "FloatObject",
+                "ArrayObject",
+                "DictionaryObject",
+                "TextStringObject",
+            ],
+        )
+
+
+class HashCacheTests(unittest.TestCase):
+    def assertHashCurrent(self, obj: PdfObject) -> None:  # pylint: disable=invalid-name
+        """Assert the cached digest of an object matches its content."""
+        self.assertEqual(obj._hash_digest(), PdfObject._hash_digest(obj))
+
+    def test_array_mutations(self) -> None:
+        """Test every mutating method of an array invalidates its digest."""
+        mutations = [
+            lambda a: a.__setitem__(0, NumberObject(9)),
+            lambda a: a.__delitem__(0),
+            lambda a: a.__imul__(2),
+            lambda a: a.append(NumberObject(4)),
+            lambda a: a.extend([NumberObject(5)]),
+            lambda a: a.insert(0, NumberObject(6)),
+            lambda a: a.pop(),
+            lambda a: a.remove(NumberObject(2)),
+            lambda a: a.clear(),
+            lambda a: a.sort(reverse=True),
+            lambda a: a.reverse(),
+        ]
+        for n, mutate in enumerate(mutations):
+            with self.subTest(mutation=n):
+                array = ArrayObject(map(NumberObject, (1, 2, 3)))
+                before = array.hash_value()
+                self.assertEqual(array.hash_value(), before)
+                mutate(array)
+                self.assertHashCurrent(array)
+                self.assertNotEqual(array.hash_value(), before)
+
+    def test_dictionary_mutations(self) -> None:
+        """Test every mutating method of a dictionary invalidates its digest."""
+        mutations = [
+            lambda d: d.__setitem__(NameObject("/A"), NumberObject(9)),
+            lambda d: d.__delitem__("/A"),
+            lambda d: d.__ior__({NameObject("/C"): NumberObject(3)}),
+            lambda d: d.update({NameObject("/C"): NumberObject(3)}),
+            lambda d: d.pop("/A"),
+            lambda d: d.popitem(),
+            lambda d: d.clear(),
+            lambda d: d.setdefault(NameObject("/C"), NumberObject(3)),
+        ]
+        for n, mutate in enumerate(mutations):
+            with self.subTest(mutation=n):
+                dictionary = DictionaryObject(
+                    {
+                        NameObject("/A"): NumberObject(1),
+                        NameObject("/B"): NumberObject(2),
+                    }
+                )
+                before = dictionary.hash_value()
+                mutate(dictionary)
+                self.assertHashCurrent(dictionary)
+                self.assertNotEqual(dictionary.hash_value(), before)
+
+    def test_nested_mutations(self) -> None:
+        """Test modifying a nested container invalidates its ancestors."""
+        inner = DictionaryObject({NameObject("/A"): NumberObject(1)})
+        array = ArrayObject([inner])
+        outer = DictionaryObject({NameObject("/K"): array})
+        before = outer.hash_value()
+
+        inner[NameObject("/A")] = NumberObject(2)
+        self.assertHashCurrent(outer)
+        self.assertHashCurrent(array)
+        changed = outer.hash_value()
+        self.assertNotEqual(changed, before)
+
+        array.append(DictionaryObject())
+        self.assertHashCurrent(outer)
+        self.assertNotEqual(outer.hash_value(), changed)
+
+        # a container taken out no longer affects its former parent
+        del array[0]
+        unchanged = outer.hash_value()
+        inner[NameObject("/A")] = NumberObject(3)
+        self.assertEqual(outer.hash_value(), unchanged)
+
+    def test_stream_data(self) -> None:
+        """Test replacing the data of a stream invalidates its digest."""
+        stream = DecodedStreamObject()
+        stream.set_data(b"q Q")
+        before = stream.hash_value()
+        self.assertEqual(stream.hash_value(), before)
+        stream.set_data(b"q 1 0 0 1 0 0 cm Q")
+        changed = stream.hash_value()
+        self.assertNotEqual(changed, before)
+        other = DecodedStreamObject()
+        other.set_data(b"q 1 0 0 1 0 0 cm Q")
+        self.assertEqual(other.hash_value(), changed)
+
+        stream[NameObject("/Length")] = NumberObject(18)
+        self.assertNotEqual(stream.hash_value(), changed)
+
+    def test_sweep_updates_hash(self) -> None:
+        """Test the writer rehashes the objects changed by the sweep."""
+        reader = PdfReader("./resources/crazyones.pdf")
+        resources = reader.pages[0].raw_get("/Resources")
+        info = reader.trailer.raw_get("/Info")
+        writer = PdfWriter()
+        obj = DictionaryObject(
+            {
+                NameObject("/R"): resources,
+                NameObject("/A"): ArrayObject(
+                    [info, DictionaryObject({NameObject("/I"): info})]
+                ),
+            }
+        )
+        ref = writer._add_object(obj)
+        writer._idnum_hash[obj.hash_value()] = ref
+        before = obj.hash_value()
+
+        writer._sweep_indirect_references(obj)
+        self.assertEqual(obj.raw_get("/R").pdf, writer)
+        self.assertEqual(obj["/A"][0].pdf, writer)
+        self.assertEqual(obj["/A"][1].raw_get("/I"), obj["/A"][0])
+        self.assertNotIn(before, writer._idnum_hash)
+        self.assertIs(writer._idnum_hash[obj.hash_value()], ref)
+        for digest, indirect in writer._idnum_hash.items():
+            self.assertEqual(indirect.get_object().hash_value(), digest)
+
+
+class RecordingIO(RawIOBase):
+    """Unbuffered output keeping the size of every write."""
+
+    def __init__(self) -> None:
+        self.data = BytesIO()
+        self.writes: List[int] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.data.seek(offset, whence)
+
+    def write(self, b: Any) -> int:
+        self.writes.append(len(b))
+        return self.data.write(b)
+
+
+class WriteBufferTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.writer = PdfWriter()
+        self.writer.append(PdfReader("./resources/mult_pages_3.pdf"))
+        self.expected = BytesIO()
+        self.writer.write(self.expected)
+
+    def test_raw_stream(self) -> None:
+        """Test the writes to an unbuffered stream are buffered."""
+        raw = RecordingIO()
+        self.writer.write(raw)
+        self.assertEqual(raw.data.getvalue(), self.expected.getvalue())
+        self.assertFalse(raw.closed)
+        self.assertLessEqual(
+            len(raw.writes), len(raw.data.getvalue()) // WRITE_BUFFER_SIZE + 1
+        )
+
+    def test_file_stays_open(self) -> None:
+        """Test the file written to is left open after the buffer is detached."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with FileIO(os.path.join(tmp_dir, "out.pdf"), "wb") as f:
+                self.writer.write(f)
+                self.assertFalse(f.closed)
+                self.assertEqual(f.tell(), len(self.expected.getvalue()))
+                f.write(b"%")
+            with open(os.path.join(tmp_dir, "out.pdf"), "rb") as f:
+                self.assertEqual(f.read(), self.expected.getvalue() + b"%")
+
+    def test_detach_on_error(self) -> None:
+        """Test a failed write flushes and detaches the buffer."""
+        raw = RecordingIO()
+        with patch.object(
+            self.writer, "_write_xref_table", side_effect=RuntimeError
+        ), self.assertRaises(RuntimeError):
+            self.writer.write(raw)
+        self.assertFalse(raw.closed)
+        # the objects written before the error reached the stream
+        self.assertTrue(
+            self.expected.getvalue().startswith(raw.data.getvalue())
+        )
+        self.assertGreater(len(raw.data.getvalue()), 0)
+
+    def test_buffered_stream(self) -> None:
+        """Test buffered and in-memory streams are written to directly."""
+        output = BytesIO()
+        with patch("pypdf._writer.BufferedWriter") as buffered_writer:
+            self.writer.write(output)
+        buffered_writer.assert_not_called()
+        self.assertEqual(output.getvalue(), self.expected.getvalue())
+
+
+class RenumberingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.writer = writer = PdfWriter()
+        writer.append(PdfReader("./resources/mult_pages_1.pdf"))
+        page = writer.pages[0]
+
+        def marked(name: str) -> DictionaryObject:
+            return DictionaryObject({NameObject("/Marker"): NameObject(name)})
+
+        self.orphan = writer._add_object(marked("/Unused"))
+        self.target = writer._add_object(marked("/Target"))
+        writer._add_object(marked("/Unused2"))
+        self.item = writer._add_object(marked("/Item"))
+        stream = DecodedStreamObject()
+        stream.set_data(b"0 0 m")
+        stream[NameObject("/Ref")] = self.target
+        self.stream = writer._add_object(stream)
+        page[NameObject("/PieceInfo")] = ArrayObject(
+            [self.stream, ArrayObject([self.item, self.target])]
+        )
+
+    def test_numbers(self) -> None:
+        """Test the objects left unreferenced are not numbered."""
+        writer = self.writer
+        numbers = writer._number_reachable_objects()
+        self.assertNotIn(self.orphan.idnum, numbers)
+        self.assertEqual(len(numbers), len(writer._objects) - 2)
+        self.assertEqual(sorted(numbers.values()), list(range(1, len(numbers) + 1)))
+        # the objects keep their order
+        self.assertEqual(sorted(numbers, key=numbers.get), sorted(numbers))
+
+        stream = self.stream.get_object()
+        renumbered = writer._renumber_references(stream, numbers)
+        self.assertIsNot(renumbered, stream)
+        self.assertEqual(renumbered.get_data(), b"0 0 m")
+        self.assertEqual(renumbered.raw_get("/Ref").idnum, numbers[self.target.idnum])
+        # the object of the writer is left as it is
+        self.assertEqual(stream.raw_get("/Ref"), self.target)
+        # a reference to an object which is not written becomes null
+        del numbers[self.target.idnum]
+        renumbered = writer._renumber_references(stream, numbers)
+        self.assertIsInstance(renumbered.raw_get("/Ref"), NullObject)
+
+        numbers = writer._number_reachable_objects()
+        array = ArrayObject([self.item, ArrayObject([self.target, NumberObject(1)])])
+        renumbered = writer._renumber_references(array, numbers)
+        self.assertEqual(
+            renumbered,
+            [
+                IndirectObject(numbers[self.item.idnum], 0, writer),
+                [IndirectObject(numbers[self.target.idnum], 0, writer), 1],
+            ],
+        )
+        self.assertEqual(array[0], self.item)
+
+    def test_write(self) -> None:
+        """Test the written file has contiguous numbers and valid references."""
+        for object_streams in (False, True):
+            with self.subTest(object_streams=object_streams):
+                output = BytesIO()
+                self.writer.write(output, object_streams=object_streams)
+                self.assertFalse(b"/Unused" in output.getvalue())
+
+                reader = PdfReader(output)
+                size = reader.trailer["/Size"]
+                if not object_streams:
+                    self.assertEqual(size, len(self.writer._objects) - 1)
+                for idnum in range(1, size):
+                    self.assertIsNotNone(reader.get_object(idnum))
+                piece_info = reader.pages[0]["/PieceInfo"]
+                stream = piece_info[0].get_object()
+                self.assertEqual(stream.get_data(), b"0 0 m")
+                self.assertEqual(stream["/Ref"]["/Marker"], "/Target")
+                self.assertEqual(piece_info[1][0]["/Marker"], "/Item")
+                self.assertEqual(piece_info[1][1], stream.raw_get("/Ref"))
+                self.assertEqual(
+                    [int(page.extract_text()) for page in reader.pages],
+                    list(range(1, 11)),
+                )
+
+
+class ObjectStreamWriteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = PdfReader("./resources/mult_pages_1.pdf")
+        self.texts = [page.extract_text() for page in self.source.pages]
+
+    def write(self, password: str = "") -> PdfReader:
+        """Write the source with object streams and read it in strict mode."""
+        writer = PdfWriter()
+        writer.append(self.source)
+        if password:
+            writer.encrypt(password, algorithm="RC4-128")
+        output = BytesIO()
+        writer.write(output, object_streams=True)
+        self.assertTrue(output.getvalue().startswith(b"%PDF-1.5"))
+        # a cross-reference stream instead of a table
+        self.assertNotIn(b"\nxref\n", output.getvalue())
+        self.assertIn(b"/Type /XRef", output.getvalue())
+        reader = PdfReader(output, strict=True)
+        if password:
+            reader.decrypt(password)
+        return reader
+
+    def check_objects(self, reader: PdfReader) -> None:
+        """Check only the objects which are not streams are packed."""
+        self.assertTrue(reader.xref_objStm)
+        self.assertEqual(list(reader.xref), [0])
+        for idnum in reader.xref_objStm:
+            self.assertNotIsInstance(reader.get_object(idnum), StreamObject)
+        object_streams = {stmnum for stmnum, _ in reader.xref_objStm.values()}
+        for stmnum in object_streams:
+            self.assertIn(stmnum, reader.xref[0])
+            self.assertEqual(reader.get_object(stmnum)["/Type"], "/ObjStm")
+        for idnum in range(1, reader.trailer["/Size"]):
+            obj = reader.get_object(idnum)
+            if isinstance(obj, StreamObject):
+                self.assertIn(idnum, reader.xref[0])
+        self.assertEqual([page.extract_text() for page in reader.pages], self.texts)
+
+    def test_round_trip(self) -> None:
+        """Test a file written with object streams reads back in strict mode."""
+        reader = self.write()
+        self.check_objects(reader)
+
+    def test_encrypted(self) -> None:
+        """Test the encryption dictionary is not packed."""
+        reader = self.write("secret")
+        encrypt = reader.trailer.raw_get("/Encrypt")
+        self.assertIsInstance(encrypt, IndirectObject)
+        self.assertNotIn(encrypt.idnum, reader.xref_objStm)
+        self.assertIn(encrypt.idnum, reader.xref[0])
+        self.check_objects(reader)
+
+    def test_object_stream_size(self) -> None:
+        """Test the objects are packed by OBJECT_STREAM_SIZE at most."""
+        with patch.object(_writer, "OBJECT_STREAM_SIZE", 10):
+            reader = self.write()
+        sizes: Dict[int, int] = {}
+        for stmnum, _ in reader.xref_objStm.values():
+            sizes[stmnum] = sizes.get(stmnum, 0) + 1
+        self.assertGreater(len(sizes), 1)
+        for stmnum, size in sizes.items():
+            self.assertLessEqual(size, 10)
+            self.assertEqual(reader.get_object(stmnum)["/N"], size)
+        self.check_objects(reader)
+
+    def test_incremental_generation(self) -> None:
+        """Test an updated object of generation 1 is not packed."""
+        data = write_markers(3)
+        entry = list(re.finditer(rb"\d{10} (\d{5}) [nf]", data))[6]
+        data = data[: entry.start(1)] + b"00001" + data[entry.end(1) :]
+        data = data.replace(b"\n6 0 obj", b"\n6 1 obj").replace(b"6 0 R", b"6 1 R")
+        writer = PdfWriter(clone_from=BytesIO(data), incremental=True)
+        marker = writer._root_object["/Markers"][1].get_object()
+        marker[NameObject("/Marker")] = NumberObject(9)
+        output = BytesIO()
+        writer.write(output, object_streams=True)
+        update = output.getvalue()[len(data) :]
+        self.assertTrue(update.startswith(b"6 1 obj"))
+        self.assertNotIn(b"/ObjStm", update)
+
+        reader = PdfReader(output, strict=True)
+        self.assertFalse(reader.xref_objStm)
+        self.assertEqual(reader.xref[1][6], len(data))
+        markers = reader.root_object["/Markers"]
+        self.assertEqual([marker["/Marker"] for marker in markers], [0, 9, 2])
+
+
+class IdenticalObjectsTests(unittest.TestCase):
+    def add_piece_info(self, writer: PdfWriter, data: bytes, name: str) -> None:
+        """Add a page referring to a stream, and to a font referring to it."""
+        page = writer.add_blank_page(100, 100)
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        stream[NameObject("/Name")] = NameObject(name)
+        stream_ref = writer._add_object(stream)
+        font = DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/FontFile"): stream_ref,
+            }
+        )
+        page[NameObject("/PieceInfo")] = ArrayObject(
+            [stream_ref, writer._add_object(font)]
+        )
+
+    def piece_info(self, writer: Any) -> List[List[int]]:
+        return [[ref.idnum for ref in page["/PieceInfo"]] for page in writer.pages]
+
+    def test_merge(self) -> None:
+        """Test only the identical objects are merged."""
+        writer = PdfWriter()
+        self.add_piece_info(writer, b"0 0 m", "/A")
+        self.add_piece_info(writer, b"0 0 m", "/A")
+        # different data
+        self.add_piece_info(writer, b"1 1 m", "/A")
+        # different dictionary
+        self.add_piece_info(writer, b"0 0 m", "/B")
+        before = self.piece_info(writer)
+        writer.compress_identical_objects()
+        after = self.piece_info(writer)
+
+        self.assertEqual(after, [before[0], before[0], before[2], before[3]])
+        for idnum in before[1]:
+            self.assertIsNone(writer._objects[idnum - 1])
+        self.assertEqual(len(set(map(tuple, after))), 3)
+        pages = {page.indirect_reference.idnum for page in writer.pages}
+        self.assertEqual(len(pages), 4)
+        font = writer.pages[1]["/PieceInfo"][1]
+        self.assertEqual(font.raw_get("/FontFile").idnum, before[0][0])
+
+        output = BytesIO()
+        writer.write(output)
+        reader = PdfReader(output)
+        self.assertEqual(self.piece_info(reader)[1], self.piece_info(reader)[0])
+        self.assertEqual(
+            [page["/PieceInfo"][0].get_data() for page in reader.pages],
+            [b"0 0 m", b"0 0 m", b"1 1 m", b"0 0 m"],
+        )
+
+    def test_streaming(self) -> None:
+        """Test the streamed output merges the same objects as write()."""
+        source = PdfWriter()
+        self.add_piece_info(source, b"0 0 m", "/A")
+        data = BytesIO()
+        source.write(data)
+
+        outputs = []
+        for streamed in (False, True):
+            writer = PdfWriter()
+            output = BytesIO()
+            if streamed:
+                writer.start_streaming(output, compress_identical_objects=True)
+            for _ in range(3):
+                writer.append(PdfReader(BytesIO(data.getvalue())))
+            if not streamed:
+                writer.compress_identical_objects()
+            writer.write(output)
+            outputs.append(PdfReader(output))
+
+        for reader in outputs:
+            piece_info = self.piece_info(reader)
+            self.assertEqual(len(piece_info), 3)
+            self.assertEqual(piece_info[1], piece_info[0])
+            self.assertEqual(piece_info[2], piece_info[0])
+        # the same number of objects is written
+        self.assertEqual(len(outputs[1].xref[0]), len(outputs[0].xref[0]))
+
+
+class CompressStreamsTests(unittest.TestCase):
+    def make_writer(self) -> PdfWriter:
+        """Add a content, a random, a metadata and an already filtered stream."""
+        writer = PdfWriter()
+        page = writer.add_blank_page(100, 100)
+        self.content = b"0 0 m 100 100 l S\n" * 200
+        self.noise = random.Random(0).randbytes(2000)
+        data = {
+            "/Content": self.content,
+            "/Noise": self.noise,
+            "/Metadata": b"<x:xmpmeta xmlns:x='adobe:ns:meta/'/>" * 20,
+            "/Filtered": self.content.hex().encode() + b">",
+        }
+        refs = {}
+        for name, stream_data in data.items():
+            stream = DecodedStreamObject()
+            stream.set_data(stream_data)
+            if name == "/Metadata":
+                stream[NameObject("/Type")] = NameObject("/Metadata")
+                stream[NameObject("/Subtype")] = NameObject("/XML")
+            elif name == "/Filtered":
+                stream[NameObject("/Filter")] = NameObject("/ASCIIHexDecode")
+            refs[name] = writer._add_object(stream)
+        page[NameObject("/Contents")] = refs.pop("/Content")
+        writer._root_object[NameObject("/Metadata")] = refs.pop("/Metadata")
+        writer._root_object[NameObject("/Extra")] = DictionaryObject(
+            {NameObject(name): ref for name, ref in refs.items()}
+        )
+        return writer
+
+    def test_level(self) -> None:
+        """Test the compression level is applied."""
+        for level in (1, 9):
+            with self.subTest(level=level):
+                writer = self.make_writer()
+                writer.compress_streams(level=level)
+                contents = writer.pages[0]["/Contents"].get_object()
+                self.assertEqual(contents["/Filter"], "/FlateDecode")
+                self.assertEqual(contents._data, zlib.compress(self.content, level))
+                self.assertEqual(contents.get_data(), self.content)
+
+    def test_skipped_streams(self) -> None:
+        """Test the streams left uncompressed are not touched."""
+        writer = self.make_writer()
+        extra = writer._root_object["/Extra"]
+        streams = [
+            writer._root_object["/Metadata"].get_object(),
+            extra["/Noise"].get_object(),
+            extra["/Filtered"].get_object(),
+        ]
+        data = [stream._data for stream in streams]
+        writer.compress_streams()
+        for ref, stream, stream_data in zip(
+            (writer._root_object["/Metadata"], extra["/Noise"], extra["/Filtered"]),
+            streams,
+            data,
+        ):
+            self.assertIs(ref.get_object(), stream)
+            self.assertEqual(stream._data, stream_data)
+        self.assertNotIn("/Filter", streams[0])
+        self.assertNotIn("/Filter", streams[1])
+        self.assertEqual(streams[2]["/Filter"], "/ASCIIHexDecode")
+
+    def test_workers(self) -> None:
+        """Test the output does not depend on the number of threads."""
+        outputs = []
+        for workers in (1, 2, 8):
+            writer = self.make_writer()
+            writer.compress_streams(workers=workers)
+            output = BytesIO()
+            writer.write(output)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[1], outputs[0])
+        self.assertEqual(outputs[2], outputs[0])
+
+        reader = PdfReader(BytesIO(outputs[0]), strict=True)
+        self.assertEqual(reader.pages[0]["/Contents"].get_data(), self.content)
+        self.assertEqual(reader.root_object["/Extra"]["/Noise"].get_data(), self.noise)
+
+
+class PageTreeTests(unittest.TestCase):
+    def make_pdf(self, root_count: int, node_count: int) -> BytesIO:
+        """Write 6 pages, the middle 3 in a node, with the counts given."""
+        writer = PdfWriter()
+        for n in range(6):
+            page = writer.add_blank_page(100, 100)
+            page[NameObject("/Marker")] = NumberObject(n)
+        root = writer._root_object["/Pages"]
+        kids = root["/Kids"]
+        node = DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Kids"): ArrayObject(kids[1:4]),
+                NameObject("/Count"): NumberObject(node_count),
+                NameObject("/Parent"): writer._root_object.raw_get("/Pages"),
+            }
+        )
+        node_ref = writer._add_object(node)
+        for kid in kids[1:4]:
+            kid.get_object()[NameObject("/Parent")] = node_ref
+        root[NameObject("/Kids")] = ArrayObject([kids[0], node_ref, *kids[4:]])
+        root[NameObject("/Count")] = NumberObject(root_count)
+        output = BytesIO()
+        writer.write(output)
+        return output
+
+    def markers(self, reader: PdfReader) -> List[int]:
+        return [page["/Marker"] for page in reader.pages]
+
+    def test_consistent_counts(self) -> None:
+        """Test the pages are retrieved without flattening the page tree."""
+        reader = PdfReader(self.make_pdf(6, 3))
+        self.assertEqual(len(reader.pages), 6)
+        # the count is taken from the root only
+        self.assertFalse(
+            any(
+                isinstance(obj, DictionaryObject) and obj.get("/Type") == "/Page"
+                for obj in reader.resolved_objects.values()
+            )
+        )
+        self.assertEqual(reader.pages[4]["/Marker"], 4)
+        self.assertEqual(self.markers(reader), list(range(6)))
+        self.assertIsNone(reader.flattened_pages)
+
+    def test_wrong_root_count(self) -> None:
+        """Test a root /Count disagreeing with its kids is not trusted."""
+        for count in (5, 8):
+            with self.subTest(count=count):
+                reader = PdfReader(self.make_pdf(count, 3))
+                self.assertEqual(len(reader.pages), count)
+                # the root is checked on the way down to the page
+                self.assertEqual(reader.pages[0]["/Marker"], 0)
+                self.assertEqual(len(reader.pages), 6)
+                self.assertEqual(self.markers(reader), list(range(6)))
+
+    def test_wrong_node_count(self) -> None:
+        """Test a node /Count disagreeing with its kids is detected."""
+        for count in (2, 4):
+            with self.subTest(count=count):
+                # the root /Count agrees with the wrong count of the node
+                reader = PdfReader(self.make_pdf(count + 3, count))
+                self.assertEqual(self.markers(reader), list(range(6)))
+                self.assertEqual(len(reader.pages), 6)
+
+    def test_strict_check(self) -> None:
+        """Test the whole page tree is checked in strict mode."""
+        for root_count, node_count in ((0, 3), (5, 3), (8, 3), (5, 2), (7, 4)):
+            with self.subTest(root_count=root_count, node_count=node_count):
+                reader = PdfReader(self.make_pdf(root_count, node_count), strict=True)
+                self.assertEqual(len(reader.pages), 6)
+                reader = PdfReader(self.make_pdf(root_count, node_count), strict=True)
+                self.assertEqual(reader.pages[5]["/Marker"], 5)
+
+    def test_kids_cache_key(self) -> None:
+        """Test the kids of the nodes are cached by reference."""
+        reader = PdfReader(self.make_pdf(6, 3), cache_max_objects=4)
+        self.assertEqual(self.markers(reader), list(range(6)))
+        for key in reader._page_tree_kids:
+            node = reader.get_object(IndirectObject(*key, reader))
+            self.assertEqual(node["/Type"], "/Pages")
+
+
+class IncrementalUpdateTests(unittest.TestCase):
+    def update(self, path: str) -> Tuple[bytes, bytes]:
+        """Rotate the first page and add one, returning the file and its update."""
+        with open(path, "rb") as f:
+            original = f.read()
+        writer = PdfWriter(clone_from=path, incremental=True)
+        writer.pages[0][NameObject("/Rotate")] = NumberObject(90)
+        writer.add_page(PdfReader("./resources/file_2.pdf").pages[0])
+        output = BytesIO()
+        writer.write(output)
+        self.assertTrue(output.getvalue().startswith(original))
+        return original, output.getvalue()
+
+    def check_update(self, original: bytes, updated: bytes) -> None:
+        """Check the update points to the original file and extends it."""
+        before = PdfReader(BytesIO(original))
+        reader = PdfReader(BytesIO(updated))
+        startxref = int(original.rsplit(b"startxref", 1)[1].split()[0])
+        # the trailer, or the dictionary of the cross-reference stream
+        section = updated[int(updated.rsplit(b"startxref", 1)[1].split()[0]) :]
+        prev = re.search(rb"/Prev (\d+)", section)
+        self.assertIsNotNone(prev)
+        self.assertEqual(int(prev.group(1)), startxref)
+        self.assertEqual(reader.trailer["/ID"][0], before.trailer["/ID"][0])
+
+        size = before.trailer["/Size"]
+        self.assertGreater(reader.trailer["/Size"], size)
+        self.assertEqual(len(reader.pages), len(before.pages) + 1)
+        self.assertEqual(reader.pages[0]["/Rotate"], 90)
+        self.assertEqual(reader.pages[0].extract_text(), before.pages[0].extract_text())
+        self.assertGreaterEqual(reader.pages[-1].indirect_reference.idnum, size)
+        self.assertEqual(int(reader.pages[-1].extract_text()), 2)
+        # the objects added are numbered from the original /Size
+        def numbers(reader: PdfReader) -> Set[int]:
+            idnums = set(reader.xref_objStm)
+            for generation in reader.xref.values():
+                idnums.update(generation)
+            return idnums
+
+        added = numbers(reader) - numbers(before)
+        self.assertTrue(added)
+        self.assertTrue(all(idnum >= size for idnum in added))
+
+    def test_xref_table(self) -> None:
+        """Test updating a file with a cross-reference table."""
+        original, updated = self.update("./resources/file_1.pdf")
+        update = updated[len(original) :]
+        self.assertIn(b"\nxref\n0 1\n", update)
+        self.assertIn(b"\ntrailer\n", update)
+        self.check_update(original, updated)
+
+    def test_xref_stream(self) -> None:
+        """Test updating a file with a cross-reference stream."""
+        original, updated = self.update("./resources/crazyones.pdf")
+        update = updated[len(original) :]
+        self.assertIn(b"/Type /XRef", update)
+        self.assertNotIn(b"\ntrailer\n", update)
+        self.check_update(original, updated)
+
+    def test_unchanged(self) -> None:
+        """Test nothing is appended when no object changed."""
+        with open("./resources/file_1.pdf", "rb") as f:
+            original = f.read()
+        output = BytesIO()
+        PdfWriter(clone_from="./resources/file_1.pdf", incremental=True).write(output)
+        self.assertEqual(output.getvalue().rstrip(b"\n"), original.rstrip(b"\n"))
+
+    def test_update_in_place(self) -> None:
+        """Test writing the update to the path of the original file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = shutil.copy("./resources/file_1.pdf", tmp_dir)
+            with open(path, "rb") as f:
+                original = f.read()
+            writer = PdfWriter(clone_from=path, incremental=True)
+            writer.add_page(PdfReader("./resources/file_2.pdf").pages[0])
+            writer.pages[0][NameObject("/Rotate")] = NumberObject(90)
+            writer.write(path)
+            with open(path, "rb") as f:
+                updated = f.read()
+        self.assertTrue(updated.startswith(original))
+        self.check_update(original, updated)
+
+
+def decode_png_reference(data: bytes, rowlength: int, bpp: int) -> bytes:
+    """Decode the PNG predictors byte by byte."""
+    width = rowlength - 1
+    output = bytearray()
+    prev = bytearray(width)
+    for pos in range(0, len(data), rowlength):
+        filter_byte, row = data[pos], bytearray(data[pos + 1 : pos + rowlength])
+        for i in range(width):
+            left = row[i - bpp] if i >= bpp else 0
+            up_left = prev[i - bpp] if i >= bpp else 0
+            up = prev[i]
+            if filter_byte == 1:
+                row[i] = (row[i] + left) % 256
+            elif filter_byte == 2:
+                row[i] = (row[i] + up) % 256
+            elif filter_byte == 3:
+                row[i] = (row[i] + (left + up) // 2) % 256
+            elif filter_byte == 4:
+                p = left + up - up_left
+                pa, pb, pc = abs(p - left), abs(p - up), abs(p - up_left)
+                if pa <= pb and pa <= pc:
+                    predicted = left
+                elif pb <= pc:
+                    predicted = up
+                else:
+                    predicted = up_left
+                row[i] = (row[i] + predicted) % 256
+        output += row
+        prev = row
+    return bytes(output)
+
+
+def decode_tiff_reference(data: bytes, columns: int, colors: int, bits: int) -> bytes:
+    """Decode the TIFF predictor sample by sample."""
+    rowlength = math.ceil(columns * colors * bits / 8)
+    output = bytearray()
+    for pos in range(0, len(data), rowlength):
+        row = data[pos : pos + rowlength]
+        length = 8 * len(row)
+        x = int.from_bytes(row, "big")
+        count = min(columns * colors, length // bits)
+        samples = [
+            x >> (length - (i + 1) * bits) & ((1 << bits) - 1) for i in range(count)
+        ]
+        for i in range(colors, count):
+            samples[i] = (samples[i] + samples[i - colors]) % (1 << bits)
+        for i, sample in enumerate(samples):
+            shift = length - (i + 1) * bits
+            x = x & ~(((1 << bits) - 1) << shift) | sample << shift
+        output += x.to_bytes(len(row), "big")
+    return bytes(output)
+
+
+class PredictorTests(unittest.TestCase):
+    # bits per component, colors, columns
+    formats = [
+        (bits, colors, columns)
+        for bits in (1, 2, 4, 8, 16)
+        for colors in (1, 3)
+        for columns in (1, 5, 7, 64)
+    ]
+
+    def setUp(self) -> None:
+        self.random = random.Random(0)
+
+    def check_png(self) -> None:
+        """Compare the PNG predictors with the reference decoder."""
+        for bits, colors, columns in self.formats:
+            with self.subTest(bits=bits, colors=colors, columns=columns):
+                rowlength = math.ceil(columns * colors * bits / 8) + 1
+                bpp = max(1, (rowlength - 1) // columns)
+                data = bytearray(self.random.randbytes(rowlength * 40))
+                # runs of the same filter and isolated rows
+                for row in range(40):
+                    data[row * rowlength] = (row // 3 if row < 15 else row) % 5
+                self.assertEqual(
+                    FlateDecode._decode_png_prediction(bytes(data), columns, rowlength),
+                    decode_png_reference(bytes(data), rowlength, bpp),
+                )
+
+    def check_tiff(self) -> None:
+        """Compare the TIFF predictor with the reference decoder."""
+        for bits, colors, columns in self.formats:
+            rowlength = math.ceil(columns * colors * bits / 8)
+            data = self.random.randbytes(rowlength * 20)
+            # the last row may be truncated
+            for size in (len(data), len(data) - 1, 0):
+                with self.subTest(bits=bits, colors=colors, columns=columns, size=size):
+                    self.assertEqual(
+                        FlateDecode._decode_tiff_prediction(
+                            data[:size], columns, colors, bits
+                        ),
+                        decode_tiff_reference(data[:size], columns, colors, bits),
+                    )
+
+    def test_png_pure_python(self) -> None:
+        """Test the PNG predictors without NumPy."""
+        with patch.object(filters, "np", None):
+            self.check_png()
+
+    @unittest.skipIf(filters.np is None, "NumPy is not installed")
+    def test_png_numpy(self) -> None:
+        """Test the PNG predictors with NumPy."""
+        self.check_png()
+
+    def test_tiff_pure_python(self) -> None:
+        """Test the TIFF predictor without NumPy."""
+        with patch.object(filters, "np", None):
+            self.check_tiff()
+
+    @unittest.skipIf(filters.np is None, "NumPy is not installed")
+    def test_tiff_numpy(self) -> None:
+        """Test the TIFF predictor with NumPy."""
+        self.check_tiff()
+
+    def test_decode_parameters(self) -> None:
+        """Test FlateDecode applies the predictor given by its parameters."""
+        data = self.random.randbytes(3 * 2 * 10 * 4)
+        parms = DictionaryObject(
+            {
+                NameObject("/Predictor"): NumberObject(2),
+                NameObject("/Columns"): NumberObject(10),
+                NameObject("/Colors"): NumberObject(3),
+                NameObject("/BitsPerComponent"): NumberObject(16),
+            }
+        )
+        self.assertEqual(
+            FlateDecode.decode(zlib.compress(data), parms),
+            decode_tiff_reference(data, 10, 3, 16),
+        )
+        parms[NameObject("/Predictor")] = NumberObject(15)
+        data = bytes([4]) + data[:60] + bytes([1]) + data[60:120]
+        self.assertEqual(
+            FlateDecode.decode(zlib.compress(data), parms),
+            decode_png_reference(data, 61, 6),
+        )
+
+
+class LZWTests(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        """Test decoding the encoded data, for both /EarlyChange values."""
+        rand = random.Random(0)
+        samples = [
+            b"",
+            b"a",
+            b"abababababababa",
+            bytes(range(256)) * 4,
+            # fills the table several times
+            b"".join(f"{i} {i * i} Td\n".encode() for i in range(5000)),
+            rand.randbytes(20000),
+            bytes(rand.choice(b"ab") for _ in range(50000)),
+        ]
+        for early_change in (0, 1):
+            parms = DictionaryObject(
+                {NameObject("/EarlyChange"): NumberObject(early_change)}
+            )
+            for data in samples:
+                with self.subTest(early_change=early_change, size=len(data)):
+                    encoded = LZWDecode.encode(data, early_change)
+                    self.assertEqual(LZWDecode.decode(encoded, parms), data)
+
+    def test_early_change(self) -> None:
+        """Test the code length grows one code later without early change."""
+        data = bytes(range(256)) * 4
+        encoded = LZWDecode.encode(data, 0)
+        self.assertNotEqual(encoded, LZWDecode.encode(data, 1))
+        self.assertEqual(LZWDecode.Decoder(encoded, 0).decode(), data)
+
+    def test_reference_example(self) -> None:
+        """Test the example of the PDF specification."""
+        encoded = bytes.fromhex("800B6050220C0C8501")
+        self.assertEqual(LZWDecode.encode(b"-----A---B"), encoded)
+        self.assertEqual(LZWDecode.decode(encoded), b"-----A---B")
+
+
+class FlateRecoveryTests(unittest.TestCase):
+    payload = b"".join(f"{i} {i * i} Td\n".encode() for i in range(20000))
+
+    def test_truncated_stream(self) -> None:
+        """Test recovering the data of a truncated stream."""
+        data = zlib.compress(self.payload)[: 3 * RECOVERY_CHUNK_SIZE // 2]
+        expected = zlib.decompressobj().decompress(data)
+        self.assertTrue(self.payload.startswith(expected))
+        self.assertEqual(_decompress_damaged(data), expected)
+        self.assertEqual(_decompress_damaged(b""), b"")
+
+    def test_corrupt_tail(self) -> None:
+        """Test recovering the data before the corrupt part of a stream."""
+        size = len(self.payload) // 2
+        compressor = zlib.compressobj()
+        head = compressor.compress(self.payload[:size])
+        head += compressor.flush(zlib.Z_FULL_FLUSH)
+        # a block of the reserved type 3 follows the valid blocks
+        data = head + b"\x06" + compressor.compress(self.payload[size:])
+        data += compressor.flush()
+        self.assertGreater(len(head), RECOVERY_CHUNK_SIZE)
+
+        self.assertEqual(_decompress_damaged(data), self.payload[:size])
+        for chunk_size in (1, 1000, len(data)):
+            chunks = _iter_slices(data, chunk_size)
+            self.assertEqual(b"".join(_iter_decompress(chunks)), self.payload[:size])
+        chunks = _iter_slices(data, 1000)
+        self.assertEqual(
+            b"".join(_iter_decompress(chunks, max_length=100)), self.payload[:size]
+        )
+
+    def test_valid_stream(self) -> None:
+        """Test decompressing a valid stream by chunks."""
+        data = zlib.compress(self.payload)
+        self.assertEqual(_decompress_damaged(data), self.payload)
+        output = list(_iter_decompress(_iter_slices(data, 4096), max_length=512))
+        self.assertTrue(all(len(chunk) <= 512 for chunk in output))
+        self.assertEqual(b"".join(output), self.payload)
+
+
+
+def encode_run_length(data: bytes) -> bytes:
+    """Encode data with runs of repeated bytes and literal runs."""
+    output = bytearray()
+    literal = bytearray()
+    i = 0
+    while i < len(data):
+        run = 1
+        while i + run < len(data) and run < 128 and data[i + run] == data[i]:
+            run += 1
+        if run > 1 or len(literal) == 128:
+            if literal:
+                output += bytes([len(literal) - 1]) + literal
+                literal = bytearray()
+        if run > 1:
+            output += bytes([257 - run, data[i]])
+        else:
+            literal.append(data[i])
+        i += run
+    if literal:
+        output += bytes([len(literal) - 1]) + literal
+    return bytes(output) + b"\x80"
+
+
+class ChunkedDecodingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rand = random.Random(0)
+        self.payload = b"".join(
+            rand.choice((rand.randbytes(7), b"\0" * 9, b"a" * 140, b"ab" * 3))
+            for _ in range(12)
+        )
+        self.encoders: List[Tuple[Any, Callable[[bytes], bytes]]] = [
+            (ASCIIHexDecode, lambda data: data.hex(" ", 3).encode() + b"\n>"),
+            (ASCII85Decode, lambda data: base64.a85encode(data, wrapcol=30) + b"~>"),
+            (RunLengthDecode, encode_run_length),
+        ]
+
+    def test_split_positions(self) -> None:
+        """Test the data split in groups, runs and EOD markers."""
+        for decoder, encode in self.encoders:
+            with self.subTest(decoder=decoder.__name__):
+                encoded = encode(self.payload)
+                self.assertEqual(decoder.decode(encoded), self.payload)
+                for i in range(len(encoded) + 1):
+                    chunks = [encoded[:i], b"", encoded[i:]]
+                    output = b"".join(decoder.iter_decode(chunks))
+                    self.assertEqual(output, self.payload)
+
+    def test_eod_markers(self) -> None:
+        """Test the data after the EOD markers, split or not, is ignored."""
+        self.assertEqual(
+            b"".join(ASCIIHexDecode.iter_decode([b"41 4", b"2 4", b">43", b"44"])),
+            b"AB@",
+        )
+        self.assertEqual(
+            b"".join(ASCII85Decode.iter_decode([b"87cUR", b"D]", b"~", b">87cUR"])),
+            base64.a85decode(b"87cURD]"),
+        )
+        self.assertEqual(
+            b"".join(RunLengthDecode.iter_decode([b"\x01ab\xfe", b"c", b"\x80"])),
+            b"abccc",
+        )
+        with self.assertRaises(PdfStreamError):
+            b"".join(RunLengthDecode.iter_decode([b"\x00a\x80", b"\x00b"]))
+
+    def make_stream(self) -> EncodedStreamObject:
+        """Encode the payload with a chain of filters."""
+        stream = EncodedStreamObject()
+        stream[NameObject("/Filter")] = ArrayObject(
+            NameObject(name)
+            for name in (
+                "/ASCII85Decode",
+                "/RunLengthDecode",
+                "/ASCIIHexDecode",
+                "/FlateDecode",
+            )
+        )
+        encoders = dict(self.encoders)
+        data = zlib.compress(self.payload)
+        for decoder in (ASCIIHexDecode, RunLengthDecode, ASCII85Decode):
+            data = encoders[decoder](data)
+        stream._data = data
+        return stream
+
+    def test_chained_filters(self) -> None:
+        """Test chained filters decoded a chunk at a time."""
+        expected = self.make_stream().get_data()
+        self.assertEqual(expected, self.payload)
+        for chunk_size in (1, 2, 3, 5, 64, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                stream = self.make_stream()
+                output = b"".join(stream.iter_decoded(chunk_size))
+                self.assertEqual(output, expected)
+                self.assertIsNone(stream.decoded_self)
+
+    def test_mapped_data(self) -> None:
+        """Test the data left in the file is decoded a chunk at a time."""
+        writer = PdfWriter()
+        writer.add_blank_page(100, 100)
+        ref = writer._add_object(self.make_stream())
+        writer._root_object[NameObject("/Payload")] = ref
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "payload.pdf")
+            writer.write(path)
+            for chunk_size in (1, 7, 1 << 16):
+                with self.subTest(chunk_size=chunk_size), PdfReader(path) as reader:
+                    stream = reader.root_object["/Payload"]
+                    self.assertIsNotNone(stream._data_slice)
+                    output = b"".join(stream.iter_decoded(chunk_size))
+                    self.assertEqual(output, self.payload)
+                    # the data is still left in the file
+                    self.assertIsNotNone(stream._data_slice)
+                    self.assertIsNone(stream.decoded_self)
+                    self.assertEqual(stream.get_data(), output)
+
+if __name__ == "__main__":
+    unittest.main()